@@ -28,6 +28,14 @@ def integration_tests(session: Session) -> None:
     session.run("pytest", "-m integration", "-rA")
 
 
+@nox_poetry.session(python=["3.9"])
+def benchmark_tests(session: Session) -> None:
+    """Run the benchmark suite."""
+    session.install(".")
+    session.install("pytest", "pytest-mock")
+    session.run("pytest", "-m benchmark", "-rA")
+
+
 @nox_poetry.session(python="3.9")
 def black(session: Session) -> None:
     """Run black code formatter."""
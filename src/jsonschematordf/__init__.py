@@ -7,12 +7,21 @@ Modules:
     modelldcatnofactory
 """
 
-try:
-    from importlib.metadata import version, PackageNotFoundError  # type: ignore
-except ImportError:  # pragma: no cover
-    from importlib_metadata import version, PackageNotFoundError  # type: ignore
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
+def __getattr__(name: str) -> str:
+    """Get package version on first access, as importing metadata is slow."""
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from importlib.metadata import version, PackageNotFoundError  # type: ignore
+    except ImportError:  # pragma: no cover
+        from importlib_metadata import version, PackageNotFoundError  # type: ignore
+
+    try:
+        __version__ = version(__name__)
+    except PackageNotFoundError:  # pragma: no cover
+        __version__ = "unknown"
+
+    globals()["__version__"] = __version__
+    return __version__
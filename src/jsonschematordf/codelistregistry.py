@@ -0,0 +1,69 @@
+"""CodeListRegistry module."""
+from contextlib import contextmanager
+from typing import Any, Dict, FrozenSet, Hashable, Iterator, List, Optional, Tuple
+
+EnumKey = FrozenSet[Tuple[type, Hashable]]
+
+
+class CodeListRegistry:
+    """Registry of code lists shared by every schema converted in a batch.
+
+    The first code list created for a set of enum values is registered by its
+    identifier. Later code lists with the same set of values, in the same or any
+    other schema of the batch, refer to that identifier, so its code elements are
+    only created once for the batch.
+
+    Code lists are keyed by the set of their enum values and value types, so enums
+    listing the same values in another order, or with duplicates, share the code
+    list registered first.
+    """
+
+    __slots__ = ("__code_lists",)
+
+    __code_lists: Dict[EnumKey, str]
+
+    def __init__(self) -> None:
+        """Constructor for CodeListRegistry object."""
+        self.__code_lists = {}
+
+    def __len__(self) -> int:
+        """Number of registered code lists."""
+        return len(self.__code_lists)
+
+    def get_code_list_uri(self, enum: List[Any]) -> Optional[str]:
+        """Get identifier of code list registered for the set of enum values."""
+        key = _get_enum_key(enum)
+        return self.__code_lists.get(key) if key is not None else None
+
+    @contextmanager
+    def rollback_on_error(self) -> Iterator[None]:
+        """Drop code lists registered within the block if it raises an exception.
+
+        Elements created by a root element interrupted by an exception are
+        discarded, so code lists they registered would refer to code elements that
+        were never output.
+        """
+        count = len(self.__code_lists)
+        try:
+            yield
+        except BaseException:
+            for key in list(self.__code_lists)[count:]:
+                del self.__code_lists[key]
+            raise
+
+    def add_code_list(self, enum: List[Any], identifier: str) -> None:
+        """Register code list of the set of enum values, unless already registered.
+
+        Enum values that are not hashable, such as objects, are never registered.
+        """
+        key = _get_enum_key(enum)
+        if key is not None:
+            self.__code_lists.setdefault(key, identifier)
+
+
+def _get_enum_key(enum: List[Any]) -> Optional[EnumKey]:
+    """Get set of enum values and their types, or None if a value is unhashable."""
+    try:
+        return frozenset((type(value), value) for value in enum)
+    except TypeError:
+        return None
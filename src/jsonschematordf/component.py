@@ -1,127 +1,26 @@
 """Component module."""
-from copy import deepcopy
-from typing import Dict, List, Optional
+from __future__ import annotations
 
-from datacatalogtordf.uri import URI
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from jsonschematordf.serialization import dumps, loads
 from jsonschematordf.types.enums import RECURSIVE_CHARACTER
 
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
 
-class Component:
-    """Utility class representing a JSON Schema component."""
 
-    __slots__ = (
-        "_identifier",
-        "_path",
-        "_type",
-        "_title",
-        "_description",
-        "_pattern",
-        "_format",
-        "_required",
-        "_enum",
-        "_minimum",
-        "_maximum",
-        "_exclusive_minimum",
-        "_exclusive_maximum",
-        "_min_length",
-        "_max_length",
-        "_min_items",
-        "_max_items",
-        "_items",
-        "_properties",
-        "_all_of",
-        "_one_of",
-        "_ref",
-        "_max_occurs",
-        "_min_occurs",
-        "_specializes",
-    )
+class AbstractComponent(ABC):
+    """A JSON Schema component, stored by Component or read from a table row."""
 
-    _path: List[str]
-    _type: Optional[str]
-    _title: Optional[Dict[None, str]]
-    _description: Optional[Dict[None, str]]
-    _pattern: Optional[str]
-    _format: Optional[str]
-    _required: Optional[List[str]]
-    _enum: Optional[List[str]]
-    _minimum: Optional[int]
-    _maximum: Optional[int]
-    _exclusive_minimum: Optional[bool]
-    _exclusive_maximum: Optional[bool]
-    _min_length: Optional[int]
-    _max_length: Optional[int]
-    _min_items: Optional[int]
-    _max_items: Optional[int]
-    _items: Optional["Component"]
-    _properties: Optional[List["Component"]]
-    _all_of: Optional[List["Component"]]
-    _one_of: Optional[List["Component"]]
-    _ref: Optional[str]
-    _max_occurs: Optional[str]
-    _min_occurs: Optional[int]
-    _identifier: Optional[URI]
-    _specializes: Optional["Component"]
-
-    def __init__(
-        self,
-        path: List[str],
-        type: Optional[str] = None,
-        title: Optional[Dict[None, str]] = None,
-        description: Optional[Dict[None, str]] = None,
-        pattern: Optional[str] = None,
-        format: Optional[str] = None,
-        required: Optional[List[str]] = None,
-        enum: Optional[List[str]] = None,
-        minimum: Optional[int] = None,
-        maximum: Optional[int] = None,
-        exclusive_minimum: Optional[bool] = None,
-        exclusive_maximum: Optional[bool] = None,
-        min_length: Optional[int] = None,
-        max_length: Optional[int] = None,
-        min_items: Optional[int] = None,
-        max_items: Optional[int] = None,
-        items: Optional["Component"] = None,
-        properties: Optional[List["Component"]] = None,
-        all_of: Optional[List["Component"]] = None,
-        one_of: Optional[List["Component"]] = None,
-        ref: Optional[str] = None,
-        max_occurs: Optional[str] = None,
-        min_occurs: Optional[int] = None,
-        specializes: Optional["Component"] = None,
-    ) -> None:
-        """Constructor for Component object."""
-        self.identifier = None
-        self._path = path
-        self._type = type
-        self._title = title
-        self._description = description
-        self._pattern = pattern
-        self._format = format
-        self._required = required
-        self._enum = enum
-        self._minimum = minimum
-        self._maximum = maximum
-        self._exclusive_minimum = exclusive_minimum
-        self._exclusive_maximum = exclusive_maximum
-        self._min_length = min_length
-        self._max_length = max_length
-        self._min_items = min_items
-        self._max_items = max_items
-        self._items = items
-        self._properties = properties
-        self._all_of = all_of
-        self._one_of = one_of
-        self._ref = ref
-        self._max_occurs = max_occurs
-        self._min_occurs = min_occurs
-        self._specializes = specializes
+    __slots__ = ()
 
     def __eq__(self, o: object) -> bool:
-        """Evaluate equality between Component and other object."""
+        """Evaluate equality between component and other object."""
         return (
-            isinstance(o, Component)
+            isinstance(o, AbstractComponent)
             and self.path == o.path
             and self.type == o.type
             and self.title == o.title
@@ -148,10 +47,14 @@ class Component:
             and self.specializes == o.specializes
         )
 
+    def __reduce__(self) -> Tuple[Callable[[bytes], object], Tuple[bytes]]:
+        """Pickle component tree using the compact serialization format."""
+        return loads, (dumps(self),)
+
     def omit(
         self, omit: List[str], new_path: Optional[List[str]] = None
     ) -> "Component":
-        """Copy Component and omit fields."""
+        """Copy component to a Component and omit fields."""
         if new_path:
             component_path = new_path
         elif "path" in omit:
@@ -208,16 +111,16 @@ class Component:
         max_length: Optional[int] = None,
         min_items: Optional[int] = None,
         max_items: Optional[int] = None,
-        items: Optional["Component"] = None,
-        properties: Optional[List["Component"]] = None,
-        all_of: Optional[List["Component"]] = None,
-        one_of: Optional[List["Component"]] = None,
+        items: Optional["AbstractComponent"] = None,
+        properties: Optional[List["AbstractComponent"]] = None,
+        all_of: Optional[List["AbstractComponent"]] = None,
+        one_of: Optional[List["AbstractComponent"]] = None,
         ref: Optional[str] = None,
         max_occurs: Optional[str] = None,
         min_occurs: Optional[int] = None,
-        specializes: Optional["Component"] = None,
+        specializes: Optional["AbstractComponent"] = None,
     ) -> "Component":
-        """Copy Component and optionally replace fields."""
+        """Copy component to a Component and optionally replace fields."""
         return Component(
             path=deepcopy(self.path) if path is None else path,
             type=self.type if type is None else type,
@@ -254,26 +157,25 @@ class Component:
         )
 
     @property
-    def identifier(self) -> Optional[str]:
+    @abstractmethod
+    def identifier(self) -> Optional[URI]:
         """Getter for identifier."""
-        return self._identifier
 
     @identifier.setter
+    @abstractmethod
     def identifier(self, uri: Optional[URI]) -> None:
         """Setter for identifier."""
-        self._identifier = uri
 
     @property
     def complete_path(self) -> Optional[str]:
         """Constructs complete path to component."""
-        title_string = self._title.get(None) if self._title else None
+        title_string = self.title.get(None) if self.title else None
         if title_string is None:
             return None
 
+        path = self.path
         non_recursive_path = (
-            self._path[1:]
-            if self.path and self._path[0] == RECURSIVE_CHARACTER
-            else self._path
+            path[1:] if path and path[0] == RECURSIVE_CHARACTER else path
         )
 
         if len(non_recursive_path) > 0:
@@ -281,6 +183,248 @@ class Component:
         else:
             return "/#" + title_string
 
+    @property
+    @abstractmethod
+    def path(self) -> List[str]:
+        """Getter for path."""
+
+    @property
+    @abstractmethod
+    def type(self) -> Optional[str]:
+        """Getter for type."""
+
+    @property
+    @abstractmethod
+    def title(self) -> Optional[Dict[None, str]]:
+        """Getter for title."""
+
+    @property
+    @abstractmethod
+    def description(self) -> Optional[Dict[None, str]]:
+        """Getter for description."""
+
+    @property
+    @abstractmethod
+    def pattern(self) -> Optional[str]:
+        """Getter for pattern."""
+
+    @property
+    @abstractmethod
+    def format(self) -> Optional[str]:
+        """Getter for format."""
+
+    @property
+    @abstractmethod
+    def required(self) -> Optional[List[str]]:
+        """Getter for required."""
+
+    @property
+    @abstractmethod
+    def enum(self) -> Optional[List[str]]:
+        """Getter for enum."""
+
+    @property
+    @abstractmethod
+    def minimum(self) -> Optional[int]:
+        """Getter for minimum."""
+
+    @property
+    @abstractmethod
+    def maximum(self) -> Optional[int]:
+        """Getter for maximum."""
+
+    @property
+    @abstractmethod
+    def exclusive_minimum(self) -> Optional[bool]:
+        """Getter for exclusive_minimum."""
+
+    @property
+    @abstractmethod
+    def exclusive_maximum(self) -> Optional[bool]:
+        """Getter for exclusive_maximum."""
+
+    @property
+    @abstractmethod
+    def min_length(self) -> Optional[int]:
+        """Getter for min_length."""
+
+    @property
+    @abstractmethod
+    def max_length(self) -> Optional[int]:
+        """Getter for max_length."""
+
+    @property
+    @abstractmethod
+    def min_items(self) -> Optional[int]:
+        """Getter for min_items."""
+
+    @property
+    @abstractmethod
+    def max_items(self) -> Optional[int]:
+        """Getter for max_items."""
+
+    @property
+    @abstractmethod
+    def items(self) -> Optional["AbstractComponent"]:
+        """Getter for items."""
+
+    @property
+    @abstractmethod
+    def properties(self) -> Optional[List["AbstractComponent"]]:
+        """Getter for properties."""
+
+    @property
+    @abstractmethod
+    def all_of(self) -> Optional[List["AbstractComponent"]]:
+        """Getter for all_of."""
+
+    @property
+    @abstractmethod
+    def one_of(self) -> Optional[List["AbstractComponent"]]:
+        """Getter for one_of."""
+
+    @property
+    @abstractmethod
+    def ref(self) -> Optional[str]:
+        """Getter for ref."""
+
+    @property
+    @abstractmethod
+    def max_occurs(self) -> Optional[str]:
+        """Getter for max_occurs."""
+
+    @property
+    @abstractmethod
+    def min_occurs(self) -> Optional[int]:
+        """Getter for min_occurs."""
+
+    @property
+    @abstractmethod
+    def specializes(self) -> Optional["AbstractComponent"]:
+        """Getter for specializes."""
+
+
+class Component(AbstractComponent):
+    """Utility class representing a JSON Schema component."""
+
+    __slots__ = (
+        "_identifier",
+        "_path",
+        "_type",
+        "_title",
+        "_description",
+        "_pattern",
+        "_format",
+        "_required",
+        "_enum",
+        "_minimum",
+        "_maximum",
+        "_exclusive_minimum",
+        "_exclusive_maximum",
+        "_min_length",
+        "_max_length",
+        "_min_items",
+        "_max_items",
+        "_items",
+        "_properties",
+        "_all_of",
+        "_one_of",
+        "_ref",
+        "_max_occurs",
+        "_min_occurs",
+        "_specializes",
+    )
+
+    _path: List[str]
+    _type: Optional[str]
+    _title: Optional[Dict[None, str]]
+    _description: Optional[Dict[None, str]]
+    _pattern: Optional[str]
+    _format: Optional[str]
+    _required: Optional[List[str]]
+    _enum: Optional[List[str]]
+    _minimum: Optional[int]
+    _maximum: Optional[int]
+    _exclusive_minimum: Optional[bool]
+    _exclusive_maximum: Optional[bool]
+    _min_length: Optional[int]
+    _max_length: Optional[int]
+    _min_items: Optional[int]
+    _max_items: Optional[int]
+    _items: Optional[AbstractComponent]
+    _properties: Optional[List[AbstractComponent]]
+    _all_of: Optional[List[AbstractComponent]]
+    _one_of: Optional[List[AbstractComponent]]
+    _ref: Optional[str]
+    _max_occurs: Optional[str]
+    _min_occurs: Optional[int]
+    _identifier: Optional[URI]
+    _specializes: Optional[AbstractComponent]
+
+    def __init__(
+        self,
+        path: List[str],
+        type: Optional[str] = None,
+        title: Optional[Dict[None, str]] = None,
+        description: Optional[Dict[None, str]] = None,
+        pattern: Optional[str] = None,
+        format: Optional[str] = None,
+        required: Optional[List[str]] = None,
+        enum: Optional[List[str]] = None,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+        exclusive_minimum: Optional[bool] = None,
+        exclusive_maximum: Optional[bool] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        min_items: Optional[int] = None,
+        max_items: Optional[int] = None,
+        items: Optional[AbstractComponent] = None,
+        properties: Optional[List[AbstractComponent]] = None,
+        all_of: Optional[List[AbstractComponent]] = None,
+        one_of: Optional[List[AbstractComponent]] = None,
+        ref: Optional[str] = None,
+        max_occurs: Optional[str] = None,
+        min_occurs: Optional[int] = None,
+        specializes: Optional[AbstractComponent] = None,
+    ) -> None:
+        """Constructor for Component object."""
+        self.identifier = None
+        self._path = path
+        self._type = type
+        self._title = title
+        self._description = description
+        self._pattern = pattern
+        self._format = format
+        self._required = required
+        self._enum = enum
+        self._minimum = minimum
+        self._maximum = maximum
+        self._exclusive_minimum = exclusive_minimum
+        self._exclusive_maximum = exclusive_maximum
+        self._min_length = min_length
+        self._max_length = max_length
+        self._min_items = min_items
+        self._max_items = max_items
+        self._items = items
+        self._properties = properties
+        self._all_of = all_of
+        self._one_of = one_of
+        self._ref = ref
+        self._max_occurs = max_occurs
+        self._min_occurs = min_occurs
+        self._specializes = specializes
+
+    @property
+    def identifier(self) -> Optional[str]:
+        """Getter for identifier."""
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, uri: Optional[URI]) -> None:
+        """Setter for identifier."""
+        self._identifier = uri
+
     @property
     def path(self) -> List[str]:
         """Getter for path."""
@@ -362,22 +506,22 @@ class Component:
         return self._max_items
 
     @property
-    def items(self) -> Optional["Component"]:
+    def items(self) -> Optional[AbstractComponent]:
         """Getter for items."""
         return self._items
 
     @property
-    def properties(self) -> Optional[List["Component"]]:
+    def properties(self) -> Optional[List[AbstractComponent]]:
         """Getter for properties."""
         return self._properties
 
     @property
-    def all_of(self) -> Optional[List["Component"]]:
+    def all_of(self) -> Optional[List[AbstractComponent]]:
         """Getter for all_of."""
         return self._all_of
 
     @property
-    def one_of(self) -> Optional[List["Component"]]:
+    def one_of(self) -> Optional[List[AbstractComponent]]:
         """Getter for one_of."""
         return self._one_of
 
@@ -397,6 +541,6 @@ class Component:
         return self._min_occurs
 
     @property
-    def specializes(self) -> Optional["Component"]:
+    def specializes(self) -> Optional[AbstractComponent]:
         """Getter for identifier."""
         return self._specializes
@@ -0,0 +1,67 @@
+"""ComponentClassifier module."""
+from typing import Optional
+
+from jsonschematordf.typeregistry import DEFAULT_TYPE_REGISTRY, TypeRegistry
+from jsonschematordf.types.enums import (
+    CHOICE,
+    CODE_LIST,
+    OBJECT_ARRAY,
+    OBJECT_TYPE,
+    PRIMITIVE_SIMPLE_TYPE,
+    SIMPLE_TYPE,
+    SIMPLE_TYPE_ARRAY,
+    SPECIALIZES,
+)
+
+
+def classify_component(
+    type: object,
+    format: object,
+    items_type: Optional[str],
+    ref_type: Optional[str],
+    has_items: bool,
+    has_specializes: bool,
+    has_one_of: bool,
+    has_enum: bool,
+    has_properties: bool,
+    has_restrictions: bool,
+    type_registry: TypeRegistry = DEFAULT_TYPE_REGISTRY,
+) -> Optional[str]:
+    """Determine type of json schema component from its fields.
+
+    Args:
+        type: The JSON Schema type of the component.
+        format: The JSON Schema format of the component.
+        items_type: Type of the items component.
+        ref_type: Type of the referenced component.
+        has_items: Whether the component has an items component.
+        has_specializes: Whether the component specializes a component.
+        has_one_of: Whether the component has oneOf components.
+        has_enum: Whether the component has enum values.
+        has_properties: Whether the component has properties.
+        has_restrictions: Whether the component has a title, description, pattern,
+            length or range restrictions.
+        type_registry: Registry of primitive types and formats.
+
+    Returns:
+        The component type, or None if the component has no type.
+    """
+    if has_items:
+        if items_type == OBJECT_TYPE:
+            return OBJECT_ARRAY
+        if items_type == SIMPLE_TYPE:
+            return SIMPLE_TYPE_ARRAY
+    if has_specializes:
+        return SPECIALIZES
+    if has_one_of:
+        return CHOICE
+    if has_enum:
+        return CODE_LIST
+    if type == "object" or has_properties:
+        return OBJECT_TYPE
+    if type_registry.is_primitive(type, format) or type_registry.is_primitive(ref_type):
+        if has_restrictions:
+            return SIMPLE_TYPE
+        return PRIMITIVE_SIMPLE_TYPE
+
+    return ref_type
@@ -1,34 +1,70 @@
 """ComponentFactory module."""
-from typing import Dict, List, Optional
+from typing import Callable, cast, Collection, Dict, List, Optional
 
-from jsonschematordf.component import Component
+from jsonschematordf.component import AbstractComponent, Component
+from jsonschematordf.resourcelimits import ResourceLimits
 from jsonschematordf.types.enums import RECURSIVE_CHARACTER
 
 
 def create_components(
-    path: List[str], json_schema_representation: Dict
-) -> List[Component]:
+    path: List[str],
+    json_schema_representation: Dict,
+    component_constructor: Callable[..., AbstractComponent] = Component,
+    limits: Optional[ResourceLimits] = None,
+) -> List[AbstractComponent]:
     """Creates component for each associated type."""
     component_types = json_schema_representation.get("type")
     if isinstance(component_types, list):
         return [
-            create_component(path, {**json_schema_representation, "type": type})
+            create_component(
+                path,
+                {**json_schema_representation, "type": type},
+                component_constructor,
+                limits=limits,
+            )
             for type in component_types
         ]
     else:
-        return [create_component(path, json_schema_representation)]
+        return [
+            create_component(
+                path, json_schema_representation, component_constructor, limits=limits
+            )
+        ]
+
+
+def create_component(
+    path: List[str],
+    json_schema_representation: Dict,
+    component_constructor: Callable[..., AbstractComponent] = Component,
+    default_title: Optional[str] = None,
+    default_is_required: Optional[bool] = None,
+    limits: Optional[ResourceLimits] = None,
+    depth: Optional[int] = None,
+) -> AbstractComponent:
+    """Map JSON Schema dict representation to Component.
+
+    The component constructor, such as ComponentTable.add_component, takes the
+    arguments of the Component constructor. The default title and isRequired apply
+    if the representation has none, without copying the representation.
 
+    The depth of the component, which is the length of its path unless given, is
+    checked against the resource limits before any child component is created.
+
+    Raises:
+        ResourceLimitError: If the component is nested deeper than the limit.
+    """
+    depth = len(path) if depth is None else depth
+    if limits is not None:
+        limits.check_depth(depth)
 
-def create_component(path: List[str], json_schema_representation: Dict) -> Component:
-    """Map JSON Schema dict representation to Component."""
     component_path = path
     type = json_schema_representation.get("type")
-    title = json_schema_representation.get("title")
+    title = json_schema_representation.get("title", default_title)
     description = json_schema_representation.get("description")
     pattern = json_schema_representation.get("pattern")
     format = json_schema_representation.get("format")
     required = json_schema_representation.get("required")
-    is_required = json_schema_representation.get("isRequired")
+    is_required = json_schema_representation.get("isRequired", default_is_required)
     enum = json_schema_representation.get("enum")
     minimum = json_schema_representation.get("minimum")
     maximum = json_schema_representation.get("maximum")
@@ -56,7 +92,7 @@ def create_component(path: List[str], json_schema_representation: Dict) -> Compo
 
     child_path = [*path, title] if title else [RECURSIVE_CHARACTER]
 
-    return Component(
+    return component_constructor(
         path=component_path,
         type=type,
         title={None: title} if title else None,
@@ -74,30 +110,46 @@ def create_component(path: List[str], json_schema_representation: Dict) -> Compo
         min_items=min_items,
         max_items=max_items,
         items=(
-            create_component(child_path, {**items, "title": "items"}) if items else None
-        ),
-        properties=[
             create_component(
                 child_path,
-                {
-                    "title": property_name,
-                    "isRequired": property_name in required
-                    if property_name and required
-                    else None,
-                    **properties.get(property_name, {}),
-                },
+                {**items, "title": "items"},
+                component_constructor,
+                limits=limits,
+                depth=depth + 1,
             )
-            for property_name in properties
-        ]
+            if items
+            else None
+        ),
+        properties=_create_property_components(
+            child_path, properties, required, component_constructor, limits, depth + 1
+        )
         if properties
         else None,
         all_of=(
-            [create_component(child_path, component) for component in all_of]
+            [
+                create_component(
+                    child_path,
+                    component,
+                    component_constructor,
+                    limits=limits,
+                    depth=depth + 1,
+                )
+                for component in all_of
+            ]
             if all_of
             else None
         ),
         one_of=(
-            [create_component(child_path, component) for component in one_of]
+            [
+                create_component(
+                    child_path,
+                    component,
+                    component_constructor,
+                    limits=limits,
+                    depth=depth + 1,
+                )
+                for component in one_of
+            ]
             if one_of
             else None
         ),
@@ -105,3 +157,39 @@ def create_component(path: List[str], json_schema_representation: Dict) -> Compo
         max_occurs=max_occurs,
         min_occurs=min_occurs,
     )
+
+
+def _create_property_components(
+    path: List[str],
+    properties: Dict,
+    required: object,
+    component_constructor: Callable[..., AbstractComponent],
+    limits: Optional[ResourceLimits],
+    depth: int,
+) -> List[AbstractComponent]:
+    """Create components of properties, looking up required names in a set."""
+    required_names = _get_required_names(required)
+    return [
+        create_component(
+            path,
+            properties[property_name] or {},
+            component_constructor,
+            default_title=property_name,
+            default_is_required=property_name in required_names
+            if property_name and required_names
+            else None,
+            limits=limits,
+            depth=depth,
+        )
+        for property_name in properties
+    ]
+
+
+def _get_required_names(required: object) -> Collection:
+    """Get required property names as a set, if they are all hashable."""
+    if isinstance(required, list):
+        try:
+            return set(required)
+        except TypeError:
+            pass
+    return cast(Collection, required) or ()
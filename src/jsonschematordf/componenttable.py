@@ -0,0 +1,398 @@
+"""ComponentTable module."""
+from array import array
+from typing import (
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TYPE_CHECKING,
+)
+import warnings
+
+from jsonschematordf.component import AbstractComponent
+from jsonschematordf.componentclassifier import classify_component
+from jsonschematordf.componentview import ComponentView
+from jsonschematordf.exceptions import CyclicReferenceWarning
+from jsonschematordf.typeregistry import DEFAULT_TYPE_REGISTRY, TypeRegistry
+from jsonschematordf.types.enums import (
+    CHOICE,
+    CODE_LIST,
+    EXTERNAL_REFERENCE,
+    OBJECT_ARRAY,
+    OBJECT_TYPE,
+    PRIMITIVE_SIMPLE_TYPE,
+    SIMPLE_TYPE,
+    SIMPLE_TYPE_ARRAY,
+    SPECIALIZES,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+
+NO_VALUE = -1
+UNCLASSIFIED = -1
+CLASSIFYING = -2
+
+COMPONENT_TYPES = (
+    None,
+    OBJECT_TYPE,
+    SIMPLE_TYPE,
+    PRIMITIVE_SIMPLE_TYPE,
+    CHOICE,
+    OBJECT_ARRAY,
+    SIMPLE_TYPE_ARRAY,
+    SPECIALIZES,
+    CODE_LIST,
+    EXTERNAL_REFERENCE,
+)
+RESTRICTION_COLUMNS = (
+    "title",
+    "description",
+    "pattern",
+    "min_length",
+    "max_length",
+    "minimum",
+    "exclusive_minimum",
+    "maximum",
+    "exclusive_maximum",
+)
+
+VALUE_COLUMNS = (
+    "type",
+    "title",
+    "description",
+    "pattern",
+    "format",
+    "required",
+    "enum",
+    "minimum",
+    "maximum",
+    "exclusive_minimum",
+    "exclusive_maximum",
+    "min_length",
+    "max_length",
+    "min_items",
+    "max_items",
+    "ref",
+    "max_occurs",
+    "min_occurs",
+)
+CHILD_COLUMNS = ("items", "specializes")
+CHILD_LIST_COLUMNS = ("properties", "all_of", "one_of")
+
+
+class ReferenceResolver(Protocol):
+    """Resolves references of component rows during classification."""
+
+    def get_reference_row(self, reference: str) -> Optional[int]:
+        """Get row of referenced component in the same table."""
+
+    def get_reference_type(self, reference: str) -> Optional[str]:
+        """Get type of referenced component outside the table."""
+
+
+class ComponentTable:
+    """Columnar storage of JSON Schema components.
+
+    Every component is a row, stored as indices into a table of interned values,
+    indices of child rows, and ranges of child rows in a shared array. Components
+    are accessed through ComponentView objects reading a single row, and the
+    identifiers given to components during conversion are stored by row.
+
+    The types of all components added since the last classification are determined
+    in one pass over the columns, and stored as type codes in a column of their own.
+    """
+
+    __slots__ = (
+        "_values",
+        "_value_indices",
+        "_paths",
+        "_path_indices",
+        "_path_column",
+        "_value_columns",
+        "_child_columns",
+        "_child_list_columns",
+        "_children",
+        "_type_codes",
+        "_classified_count",
+        "_identifiers",
+    )
+
+    _values: List[object]
+    _value_indices: Dict[Tuple[type, Hashable], int]
+    _paths: List[Tuple[str, ...]]
+    _path_indices: Dict[Tuple[str, ...], int]
+    _path_column: array
+    _value_columns: Dict[str, array]
+    _child_columns: Dict[str, array]
+    _child_list_columns: Dict[str, Tuple[array, array]]
+    _children: array
+    _type_codes: array
+    _classified_count: int
+    _identifiers: Dict[int, Optional["URI"]]
+
+    def __init__(self) -> None:
+        """Constructor for ComponentTable object."""
+        self._values = []
+        self._value_indices = {}
+        self._paths = []
+        self._path_indices = {}
+        self._path_column = array("l")
+        self._value_columns = {column: array("l") for column in VALUE_COLUMNS}
+        self._child_columns = {column: array("l") for column in CHILD_COLUMNS}
+        self._child_list_columns = {
+            column: (array("l"), array("l")) for column in CHILD_LIST_COLUMNS
+        }
+        self._children = array("l")
+        self._type_codes = array("b")
+        self._classified_count = 0
+        self._identifiers = {}
+
+    def __len__(self) -> int:
+        """Number of components in table."""
+        return len(self._path_column)
+
+    def add_component(
+        self,
+        path: List[str],
+        title: Optional[Dict[None, str]] = None,
+        description: Optional[Dict[None, str]] = None,
+        items: Optional[AbstractComponent] = None,
+        specializes: Optional[AbstractComponent] = None,
+        properties: Optional[List[AbstractComponent]] = None,
+        all_of: Optional[List[AbstractComponent]] = None,
+        one_of: Optional[List[AbstractComponent]] = None,
+        **values: object,
+    ) -> ComponentView:
+        """Add component row, taking the arguments of the Component constructor.
+
+        Child components must be views of rows in the same table.
+        """
+        index = len(self)
+        self._path_column.append(self._intern_path(path))
+
+        values["title"] = title.get(None) if title else None
+        values["description"] = description.get(None) if description else None
+        for column in VALUE_COLUMNS:
+            self._value_columns[column].append(self._intern_value(values.get(column)))
+
+        for column, child in (("items", items), ("specializes", specializes)):
+            self._child_columns[column].append(
+                child.index if isinstance(child, ComponentView) else NO_VALUE
+            )
+
+        for column, child_list in (
+            ("properties", properties),
+            ("all_of", all_of),
+            ("one_of", one_of),
+        ):
+            starts, ends = self._child_list_columns[column]
+            if child_list is None:
+                starts.append(NO_VALUE)
+                ends.append(NO_VALUE)
+            else:
+                starts.append(len(self._children))
+                self._children.extend(child.index for child in child_list)
+                ends.append(len(self._children))
+
+        self._type_codes.append(UNCLASSIFIED)
+        return ComponentView(self, index)
+
+    def get_component(self, index: int) -> ComponentView:
+        """Get view of component row."""
+        return ComponentView(self, index)
+
+    def get_path(self, index: int) -> List[str]:
+        """Get path of component row."""
+        return list(self._paths[self._path_column[index]])
+
+    def get_value(self, index: int, column: str) -> object:
+        """Get value of component row in value column."""
+        value_index = self._value_columns[column][index]
+        return self._values[value_index] if value_index != NO_VALUE else None
+
+    def get_child(self, index: int, column: str) -> Optional[ComponentView]:
+        """Get view of child component of component row in child column."""
+        child_index = self._child_columns[column][index]
+        return ComponentView(self, child_index) if child_index != NO_VALUE else None
+
+    def get_children(
+        self, index: int, column: str
+    ) -> Optional[List[AbstractComponent]]:
+        """Get views of child components of component row in child list column."""
+        starts, ends = self._child_list_columns[column]
+        if starts[index] == NO_VALUE:
+            return None
+        return [
+            ComponentView(self, child_index)
+            for child_index in self._children[starts[index] : ends[index]]
+        ]
+
+    def get_identifier(self, index: int) -> Optional["URI"]:
+        """Get identifier of component row."""
+        return self._identifiers.get(index)
+
+    def set_identifier(self, index: int, identifier: Optional["URI"]) -> None:
+        """Set identifier of component row."""
+        self._identifiers[index] = identifier
+
+    def get_component_type(self, index: int) -> Optional[str]:
+        """Get type of classified component row.
+
+        Rows still being classified depend on themselves, and have no type.
+        """
+        type_code = self._type_codes[index]
+        if type_code == UNCLASSIFIED:
+            raise ValueError(f"Component {index} is not classified")
+        return COMPONENT_TYPES[type_code] if type_code >= 0 else None
+
+    def classify(
+        self,
+        resolver: ReferenceResolver,
+        type_registry: TypeRegistry = DEFAULT_TYPE_REGISTRY,
+    ) -> None:
+        """Determine types of component rows added since the last classification.
+
+        Args:
+            resolver: Resolves references to rows in the table, or to types of
+                components outside the table.
+            type_registry: Registry of primitive types and formats.
+
+        References missing from the resolver, and references back to components
+        whose types depend on the referencing component, have no type.
+        """
+        index = self._classified_count
+        while index < len(self):
+            if self._type_codes[index] == UNCLASSIFIED:
+                self._classify_row(index, resolver, type_registry)
+            index += 1
+        self._classified_count = index
+
+    def classify_row(
+        self,
+        index: int,
+        resolver: ReferenceResolver,
+        type_registry: TypeRegistry = DEFAULT_TYPE_REGISTRY,
+    ) -> None:
+        """Determine type of component row, and of the rows it depends on only."""
+        if self._type_codes[index] == CLASSIFYING:
+            self._warn_cyclic_reference(index)
+        elif self._type_codes[index] == UNCLASSIFIED:
+            self._classify_row(index, resolver, type_registry)
+
+    def _classify_row(
+        self,
+        index: int,
+        resolver: ReferenceResolver,
+        type_registry: TypeRegistry,
+    ) -> None:
+        """Classify row after the items and referenced rows it depends on.
+
+        Every row on a chain of references is classified once, so later rows
+        referring to any of them read the type of the final target directly.
+        """
+        stack = [index]
+        while stack:
+            row = stack[-1]
+            if self._type_codes[row] >= 0:
+                stack.pop()
+                continue
+            self._type_codes[row] = CLASSIFYING
+
+            items_row = self._child_columns["items"][row]
+            ref = self.get_value(row, "ref")
+            ref = ref if isinstance(ref, str) else None
+            ref_row = resolver.get_reference_row(ref) if ref else None
+            ref_row = ref_row if ref_row is not None else NO_VALUE
+            dependencies = [
+                dependency
+                for dependency in (items_row, ref_row)
+                if dependency != NO_VALUE
+            ]
+            dependency = next(
+                (
+                    dependency
+                    for dependency in dependencies
+                    if self._type_codes[dependency] == UNCLASSIFIED
+                ),
+                None,
+            )
+            if dependency is not None:
+                stack.append(dependency)
+                continue
+            if any(
+                self._type_codes[dependency] == CLASSIFYING
+                for dependency in dependencies
+            ):
+                self._warn_cyclic_reference(row)
+
+            if ref_row != NO_VALUE:
+                ref_type = self._get_classified_type(ref_row)
+            else:
+                ref_type = resolver.get_reference_type(ref) if ref else None
+            component_type = classify_component(
+                self.get_value(row, "type"),
+                self.get_value(row, "format"),
+                self._get_classified_type(items_row),
+                ref_type,
+                has_items=items_row != NO_VALUE,
+                has_specializes=self._child_columns["specializes"][row] != NO_VALUE,
+                has_one_of=self._has_children(row, "one_of"),
+                has_enum=bool(self.get_value(row, "enum")),
+                has_properties=self._has_children(row, "properties"),
+                has_restrictions=any(
+                    self.get_value(row, column) for column in RESTRICTION_COLUMNS
+                ),
+                type_registry=type_registry,
+            )
+            self._type_codes[row] = COMPONENT_TYPES.index(component_type)
+            stack.pop()
+
+    def _get_classified_type(self, index: int) -> Optional[str]:
+        """Get type of row, or None if it has no row or is still being classified."""
+        if index == NO_VALUE or self._type_codes[index] < 0:
+            return None
+        return COMPONENT_TYPES[self._type_codes[index]]
+
+    def _warn_cyclic_reference(self, index: int) -> None:
+        """Warn that the type of component row depends on itself."""
+        component = self.get_component(index)
+        location = component.complete_path or "/".join(component.path)
+        warnings.warn(
+            f"Component {location} references itself",
+            CyclicReferenceWarning,
+            stacklevel=4,
+        )
+
+    def _has_children(self, index: int, column: str) -> bool:
+        """Whether component row has any children in child list column."""
+        starts, ends = self._child_list_columns[column]
+        return starts[index] != NO_VALUE and ends[index] > starts[index]
+
+    def _intern_path(self, path: List[str]) -> int:
+        """Get index of interned path."""
+        key = tuple(path)
+        if key not in self._path_indices:
+            self._path_indices[key] = len(self._paths)
+            self._paths.append(key)
+        return self._path_indices[key]
+
+    def _intern_value(self, value: object) -> int:
+        """Get index of interned value, storing unhashable values separately."""
+        if value is None:
+            return NO_VALUE
+
+        try:
+            key = (type(value), value)
+            value_index = self._value_indices.get(key)
+        except TypeError:
+            self._values.append(value)
+            return len(self._values) - 1
+
+        if value_index is None:
+            value_index = len(self._values)
+            self._value_indices[key] = value_index
+            self._values.append(value)
+        return value_index
@@ -0,0 +1,219 @@
+"""ComponentView module."""
+from typing import cast, Dict, List, Optional, TYPE_CHECKING
+
+from jsonschematordf.component import AbstractComponent, Component
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+
+    from jsonschematordf.componenttable import ComponentTable
+
+
+class ComponentView(AbstractComponent):
+    """A component reading its fields from a row of a ComponentTable.
+
+    The view holds nothing but the table and the row, so views of the same row are
+    interchangeable, and the identifier of the row is stored in the table. Copies of
+    the view, made by omit and copy, are plain Components.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    _table: "ComponentTable"
+    _index: int
+
+    def __init__(self, table: "ComponentTable", index: int) -> None:
+        """Constructor for ComponentView object."""
+        self._table = table
+        self._index = index
+
+    def detach(self) -> Component:
+        """Copy viewed component and its children to plain Components."""
+        return Component(
+            path=self.path,
+            type=self.type,
+            title=self.title,
+            description=self.description,
+            pattern=self.pattern,
+            format=self.format,
+            required=self.required,
+            enum=self.enum,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            exclusive_minimum=self.exclusive_minimum,
+            exclusive_maximum=self.exclusive_maximum,
+            min_length=self.min_length,
+            max_length=self.max_length,
+            min_items=self.min_items,
+            max_items=self.max_items,
+            items=self.items.detach() if self.items is not None else None,
+            properties=_detach_all(self.properties),
+            all_of=_detach_all(self.all_of),
+            one_of=_detach_all(self.one_of),
+            ref=self.ref,
+            max_occurs=self.max_occurs,
+            min_occurs=self.min_occurs,
+            specializes=(
+                self.specializes.detach() if self.specializes is not None else None
+            ),
+        )
+
+    @property
+    def table(self) -> "ComponentTable":
+        """Getter for table."""
+        return self._table
+
+    @property
+    def index(self) -> int:
+        """Getter for row index in table."""
+        return self._index
+
+    @property
+    def identifier(self) -> Optional["URI"]:
+        """Getter for identifier."""
+        return self._table.get_identifier(self._index)
+
+    @identifier.setter
+    def identifier(self, uri: Optional["URI"]) -> None:
+        """Setter for identifier."""
+        self._table.set_identifier(self._index, uri)
+
+    @property
+    def path(self) -> List[str]:
+        """Getter for path."""
+        return self._table.get_path(self._index)
+
+    @property
+    def type(self) -> Optional[str]:
+        """Getter for type."""
+        return cast(Optional[str], self._table.get_value(self._index, "type"))
+
+    @property
+    def title(self) -> Optional[Dict[None, str]]:
+        """Getter for title."""
+        value = cast(Optional[str], self._table.get_value(self._index, "title"))
+        return {None: value} if value else None
+
+    @property
+    def description(self) -> Optional[Dict[None, str]]:
+        """Getter for description."""
+        value = cast(Optional[str], self._table.get_value(self._index, "description"))
+        return {None: value} if value else None
+
+    @property
+    def pattern(self) -> Optional[str]:
+        """Getter for pattern."""
+        return cast(Optional[str], self._table.get_value(self._index, "pattern"))
+
+    @property
+    def format(self) -> Optional[str]:
+        """Getter for format."""
+        return cast(Optional[str], self._table.get_value(self._index, "format"))
+
+    @property
+    def required(self) -> Optional[List[str]]:
+        """Getter for required."""
+        return cast(Optional[List[str]], self._table.get_value(self._index, "required"))
+
+    @property
+    def enum(self) -> Optional[List[str]]:
+        """Getter for enum."""
+        return cast(Optional[List[str]], self._table.get_value(self._index, "enum"))
+
+    @property
+    def minimum(self) -> Optional[int]:
+        """Getter for minimum."""
+        return cast(Optional[int], self._table.get_value(self._index, "minimum"))
+
+    @property
+    def maximum(self) -> Optional[int]:
+        """Getter for maximum."""
+        return cast(Optional[int], self._table.get_value(self._index, "maximum"))
+
+    @property
+    def exclusive_minimum(self) -> Optional[bool]:
+        """Getter for exclusive_minimum."""
+        return cast(
+            Optional[bool], self._table.get_value(self._index, "exclusive_minimum")
+        )
+
+    @property
+    def exclusive_maximum(self) -> Optional[bool]:
+        """Getter for exclusive_maximum."""
+        return cast(
+            Optional[bool], self._table.get_value(self._index, "exclusive_maximum")
+        )
+
+    @property
+    def min_length(self) -> Optional[int]:
+        """Getter for min_length."""
+        return cast(Optional[int], self._table.get_value(self._index, "min_length"))
+
+    @property
+    def max_length(self) -> Optional[int]:
+        """Getter for max_length."""
+        return cast(Optional[int], self._table.get_value(self._index, "max_length"))
+
+    @property
+    def min_items(self) -> Optional[int]:
+        """Getter for min_items."""
+        return cast(Optional[int], self._table.get_value(self._index, "min_items"))
+
+    @property
+    def max_items(self) -> Optional[int]:
+        """Getter for max_items."""
+        return cast(Optional[int], self._table.get_value(self._index, "max_items"))
+
+    @property
+    def items(self) -> Optional["ComponentView"]:
+        """Getter for items."""
+        return self._table.get_child(self._index, "items")
+
+    @property
+    def properties(self) -> Optional[List[AbstractComponent]]:
+        """Getter for properties."""
+        return self._table.get_children(self._index, "properties")
+
+    @property
+    def all_of(self) -> Optional[List[AbstractComponent]]:
+        """Getter for all_of."""
+        return self._table.get_children(self._index, "all_of")
+
+    @property
+    def one_of(self) -> Optional[List[AbstractComponent]]:
+        """Getter for one_of."""
+        return self._table.get_children(self._index, "one_of")
+
+    @property
+    def ref(self) -> Optional[str]:
+        """Getter for ref."""
+        return cast(Optional[str], self._table.get_value(self._index, "ref"))
+
+    @property
+    def max_occurs(self) -> Optional[str]:
+        """Getter for max_occurs."""
+        return cast(Optional[str], self._table.get_value(self._index, "max_occurs"))
+
+    @property
+    def min_occurs(self) -> Optional[int]:
+        """Getter for min_occurs."""
+        return cast(Optional[int], self._table.get_value(self._index, "min_occurs"))
+
+    @property
+    def specializes(self) -> Optional["ComponentView"]:
+        """Getter for specializes."""
+        return self._table.get_child(self._index, "specializes")
+
+
+def _detach_all(
+    components: Optional[List[AbstractComponent]],
+) -> Optional[List[AbstractComponent]]:
+    """Copy viewed components to plain Components."""
+    return (
+        [
+            component.detach() if isinstance(component, ComponentView) else component
+            for component in components
+        ]
+        if components is not None
+        else None
+    )
@@ -0,0 +1,90 @@
+"""ConversionPlan module."""
+from __future__ import annotations
+
+from typing import Any, List, Tuple, TYPE_CHECKING
+
+from jsonschematordf.lazyimport import lazy_import
+from jsonschematordf.utils import create_uri
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rdflib.graph import Graph
+
+rdflib = lazy_import("rdflib")
+
+PLAN_BASE_URI = "http://jsonschematordf.invalid/base"
+
+_FIXED = 0
+_BASE = 1
+_SKOLEM = 2
+_SKOLEM_PATH = ".well-known/skolem/"
+_PLAN_SKOLEM_PREFIX = f"{PLAN_BASE_URI}/{_SKOLEM_PATH}"
+
+
+class ConversionPlan:
+    """A JSON Schema conversion independent of the base URI of the schema.
+
+    The schema is converted once under a placeholder base URI, and every identifier
+    minted from it is stored as a suffix to the base URI. Instantiating the plan for
+    a base URI only prefixes the suffixes, and gives the same graph as converting the
+    schema under that base URI, apart from randomly minted skolemized identifiers.
+    """
+
+    __slots__ = ("_triples", "_namespaces")
+
+    _triples: List[Tuple[Tuple[int, Any], ...]]
+    _namespaces: List[Tuple[str, Any]]
+
+    def __init__(self, graph: Graph) -> None:
+        """Constructor for ConversionPlan object.
+
+        Args:
+            graph: The graph converted under PLAN_BASE_URI.
+        """
+        self._triples = [
+            tuple(_compile_term(term) for term in triple) for triple in graph
+        ]
+        self._namespaces = list(graph.namespaces())
+
+    def __len__(self) -> int:
+        """Number of triples in plan."""
+        return len(self._triples)
+
+    def to_graph(self, base_uri: str) -> Graph:
+        """Instantiate plan for base URI.
+
+        Args:
+            base_uri: Base URI of the schema.
+
+        Returns:
+            An RDF Graph representing the JSON Schema using modelldcatno.
+
+        Raises:
+            InvalidURIError: If the base URI is not a valid URI.
+        """
+        create_uri(base_uri)
+        skolem_base_uri = base_uri if base_uri.endswith("/") else f"{base_uri}/"
+        prefixes = ("", base_uri, f"{skolem_base_uri}{_SKOLEM_PATH}")
+        uri_ref = rdflib.URIRef
+
+        graph = rdflib.Graph()
+        for prefix, namespace in self._namespaces:
+            graph.bind(prefix, namespace)
+        add = graph.add
+        for triple in self._triples:
+            add(
+                tuple(
+                    value if kind == _FIXED else uri_ref(prefixes[kind] + value)
+                    for kind, value in triple
+                )
+            )
+        return graph
+
+
+def _compile_term(term: object) -> Tuple[int, object]:
+    """Compile term to kind of prefix, and the term or its suffix to the prefix."""
+    if isinstance(term, rdflib.URIRef):
+        if term.startswith(_PLAN_SKOLEM_PREFIX):
+            return _SKOLEM, str(term[len(_PLAN_SKOLEM_PREFIX) :])
+        if term.startswith(PLAN_BASE_URI):
+            return _BASE, str(term[len(PLAN_BASE_URI) :])
+    return _FIXED, term
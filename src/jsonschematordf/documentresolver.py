@@ -0,0 +1,170 @@
+"""DocumentResolver module."""
+from abc import ABC, abstractmethod
+from functools import lru_cache
+import os
+from typing import Any, Dict, Hashable, Optional, Tuple
+from zipfile import ZipFile
+
+from jsonschematordf.resourcelimits import load_json_schema_string, ResourceLimits
+
+DOCUMENT_CACHE_SIZE = 256
+
+
+class DocumentResolver(ABC):
+    """Base class for offline resolvers of external JSON Schema documents.
+
+    Resolvers are compared by their cache key, and parsed documents are cached per
+    process, so each external document is loaded and parsed only once.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, o: object) -> bool:
+        """Evaluate equality between DocumentResolver and other object."""
+        return type(o) is type(self) and o.cache_key == self.cache_key
+
+    def __hash__(self) -> int:
+        """Hash DocumentResolver by its cache key."""
+        return hash((type(self), self.cache_key))
+
+    @property
+    @abstractmethod
+    def cache_key(self) -> Hashable:
+        """Getter for key identifying the documents available to the resolver."""
+
+    @abstractmethod
+    def load(self, document_uri: str) -> Optional[str]:
+        """Load JSON Schema string of document, or None if it is not available."""
+
+    def resolve(
+        self, document_uri: str, limits: Optional[ResourceLimits] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get parsed JSON Schema representation of document.
+
+        Documents exceeding the resource limits raise ResourceLimitError.
+        """
+        return _parse_document(self, document_uri, limits)
+
+
+class DirectoryResolver(DocumentResolver):
+    """Resolver for documents mirrored in a local directory."""
+
+    __slots__ = ("_base_uri", "_directory")
+
+    _base_uri: str
+    _directory: str
+
+    def __init__(self, base_uri: str, directory: str) -> None:
+        """Constructor for DirectoryResolver object."""
+        self._base_uri = base_uri
+        self._directory = os.path.abspath(directory)
+
+    @property
+    def cache_key(self) -> Tuple[str, str]:
+        """Getter for base URI and directory of the mirror."""
+        return self._base_uri, self._directory
+
+    def load(self, document_uri: str) -> Optional[str]:
+        """Load JSON Schema string of document from directory."""
+        relative_path = _relative_path(self._base_uri, document_uri)
+        if relative_path is None:
+            return None
+
+        file_path = os.path.join(self._directory, *relative_path.split("/"))
+        if not os.path.isfile(file_path):
+            return None
+
+        with open(file_path, encoding="utf-8") as document_file:
+            return document_file.read()
+
+
+class ZipResolver(DocumentResolver):
+    """Resolver for documents mirrored in a zip archive."""
+
+    __slots__ = ("_base_uri", "_archive")
+
+    _base_uri: str
+    _archive: str
+
+    def __init__(self, base_uri: str, archive: str) -> None:
+        """Constructor for ZipResolver object."""
+        self._base_uri = base_uri
+        self._archive = os.path.abspath(archive)
+
+    @property
+    def cache_key(self) -> Tuple[str, str]:
+        """Getter for base URI and path of the archive."""
+        return self._base_uri, self._archive
+
+    def load(self, document_uri: str) -> Optional[str]:
+        """Load JSON Schema string of document from zip archive."""
+        relative_path = _relative_path(self._base_uri, document_uri)
+        if relative_path is None:
+            return None
+
+        with ZipFile(self._archive) as archive:
+            try:
+                return archive.read(relative_path).decode("utf-8")
+            except KeyError:
+                return None
+
+
+class MappingResolver(DocumentResolver):
+    """Resolver for documents held in memory."""
+
+    __slots__ = ("_documents", "_cache_key")
+
+    _documents: Dict[str, str]
+    _cache_key: Tuple[Tuple[str, str], ...]
+
+    def __init__(self, documents: Dict[str, str]) -> None:
+        """Constructor for MappingResolver object."""
+        self._documents = dict(documents)
+        self._cache_key = tuple(sorted(self._documents.items()))
+
+    @property
+    def cache_key(self) -> Tuple[Tuple[str, str], ...]:
+        """Getter for documents of the resolver."""
+        return self._cache_key
+
+    def load(self, document_uri: str) -> Optional[str]:
+        """Load JSON Schema string of document from mapping."""
+        return self._documents.get(document_uri)
+
+
+def clear_document_cache() -> None:
+    """Clear cache of parsed external documents."""
+    _parse_document.cache_clear()
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _parse_document(
+    resolver: DocumentResolver,
+    document_uri: str,
+    limits: Optional[ResourceLimits] = None,
+) -> Optional[Dict[str, Any]]:
+    """Load and parse document once per resolver, document URI and limits."""
+    json_schema_string = resolver.load(document_uri)
+    if json_schema_string is None:
+        return None
+
+    in_dict = load_json_schema_string(json_schema_string, limits)
+    return in_dict if isinstance(in_dict, dict) else None
+
+
+def _relative_path(base_uri: str, document_uri: str) -> Optional[str]:
+    """Get path of document relative to base URI, disallowing parent segments.
+
+    The base URI must be followed by a path segment boundary, so a base URI such as
+    http://uri.com does not match http://uri.community.
+    """
+    if not document_uri.startswith(base_uri):
+        return None
+    if not base_uri.endswith("/") and document_uri[len(base_uri) :][:1] != "/":
+        return None
+
+    relative_path = document_uri[len(base_uri) :].lstrip("/")
+    if not relative_path or ".." in relative_path.split("/"):
+        return None
+
+    return relative_path
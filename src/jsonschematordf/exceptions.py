@@ -0,0 +1,13 @@
+"""Exceptions module."""
+
+
+class CyclicReferenceWarning(UserWarning):
+    """Warning issued for references that lead back to themselves."""
+
+
+class ResourceLimitError(ValueError):
+    """Error raised when a JSON Schema exceeds the configured resource limits."""
+
+
+class ConversionTimeoutError(TimeoutError):
+    """Error raised when converting a schema takes longer than its deadline."""
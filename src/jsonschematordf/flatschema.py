@@ -0,0 +1,168 @@
+"""FlatSchema module.
+
+Converts flat schemas, whose root elements are objects of primitive properties only,
+directly from the JSON Schema representation. No components are created or
+classified, and the modelldcatno elements are the same as those created by the
+general conversion.
+"""
+from __future__ import annotations
+
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING, Union
+
+from jsonschematordf.lazyimport import lazy_import
+from jsonschematordf.modelldcatnofactory import create_primitive_simple_type
+from jsonschematordf.parsedschema import ParsedSchema
+from jsonschematordf.schema import Schema
+from jsonschematordf.typeregistry import TypeRegistry
+from jsonschematordf.types.enums import RECURSIVE_CHARACTER
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+    from modelldcatnotordf.modelldcatno import Attribute
+
+modelldcatno = lazy_import("modelldcatnotordf.modelldcatno")
+
+FLAT_OBJECT_KEYS = frozenset(("type", "title", "description", "properties", "required"))
+FLAT_PROPERTY_KEYS = frozenset(("type", "format", "title", "description"))
+
+
+def is_flat_schema(schema: Schema, root_paths: List[List[str]]) -> bool:
+    """Whether every root element is an object of primitive properties only.
+
+    Objects and properties with references, combinators, enums, items or
+    restrictions other than title and description are not flat. Schemas with
+    resource limits are never flat, as the limits apply to created components.
+    """
+    return schema.limits is None and all(
+        _is_flat_object(schema.get_representation(root_path), schema.type_registry)
+        for root_path in root_paths
+    )
+
+
+def flat_component_to_modelldcatno(schema: Schema, path: List[str]) -> ParsedSchema:
+    """Parse a flat root element to a modelldcatno representation.
+
+    Args:
+        schema: A jsonschematordf Schema object.
+        path: Path to the root element, which must be flat.
+
+    Returns:
+        A ParsedSchema object containing the parsed modelldcatno ModelElements.
+    """
+    schema.check_deadline()
+    representation = schema.get_representation(path)
+    *parent_path, key = path
+    title = representation.get("title", key)
+    complete_path = _get_complete_path(parent_path, title)
+    if parsed_component_uri := schema.get_parsed_component_uri(complete_path):
+        return ParsedSchema([parsed_component_uri])
+
+    identifier = schema.create_identifier(complete_path)
+    if complete_path:
+        schema.add_parsed_identifier(complete_path, identifier)
+    object_type = modelldcatno.ObjectType(identifier)
+    object_type.title = {None: title} if title else None
+    object_type.description = _get_language_map(representation.get("description"))
+
+    properties = representation.get("properties")
+    if properties:
+        child_path = [*parent_path, title] if title else [RECURSIVE_CHARACTER]
+        required = set(representation.get("required") or ())
+        object_type.has_property = [
+            _create_attribute(
+                schema,
+                child_path,
+                property_name,
+                properties[property_name],
+                bool(property_name) and property_name in required,
+            )
+            for property_name in properties
+        ]
+
+    return ParsedSchema([object_type])
+
+
+def _create_attribute(
+    schema: Schema,
+    path: List[str],
+    property_name: str,
+    representation: Mapping[str, Any],
+    is_required: bool,
+) -> Union[Attribute, URI]:
+    """Create attribute of primitive property."""
+    schema.check_deadline()
+    title = representation.get("title", property_name)
+    complete_path = _get_complete_path(path, title)
+    if parsed_component_uri := schema.get_parsed_component_uri(complete_path):
+        return parsed_component_uri
+
+    identifier = schema.create_identifier(complete_path)
+    if complete_path:
+        schema.add_parsed_identifier(complete_path, identifier)
+    attribute = modelldcatno.Attribute(identifier)
+    attribute.title = {None: title} if title else None
+    attribute.description = _get_language_map(representation.get("description"))
+    attribute.max_occurs = "1"
+    attribute.min_occurs = 1 if is_required else 0
+    attribute.has_simple_type = create_primitive_simple_type(
+        representation.get("type"), representation.get("format"), schema
+    )
+    return attribute
+
+
+def _is_flat_object(representation: object, type_registry: TypeRegistry) -> bool:
+    """Whether representation is an object of primitive properties only."""
+    if not isinstance(representation, dict):
+        return False
+
+    properties = representation.get("properties", {})
+    required = representation.get("required", [])
+    return (
+        FLAT_OBJECT_KEYS.issuperset(representation)
+        and representation.get("type") == "object"
+        and _has_string_values(representation, ("title", "description"))
+        and isinstance(properties, dict)
+        and isinstance(required, list)
+        and all(isinstance(property_name, str) for property_name in required)
+        and all(
+            isinstance(property_name, str)
+            and _is_flat_property(property_representation, type_registry)
+            for property_name, property_representation in properties.items()
+        )
+    )
+
+
+def _is_flat_property(representation: object, type_registry: TypeRegistry) -> bool:
+    """Whether representation is a primitive property without restrictions."""
+    return (
+        isinstance(representation, dict)
+        and FLAT_PROPERTY_KEYS.issuperset(representation)
+        and _has_string_values(
+            representation, ("type", "format", "title", "description")
+        )
+        and type_registry.is_primitive(
+            representation.get("type"), representation.get("format")
+        )
+    )
+
+
+def _has_string_values(representation: Mapping[str, Any], keys: tuple) -> bool:
+    """Whether the values of keys present in representation are strings."""
+    return all(
+        isinstance(representation[key], str) for key in keys if key in representation
+    )
+
+
+def _get_complete_path(path: List[str], title: Optional[str]) -> Optional[str]:
+    """Get complete path of component with title at path, as Component does."""
+    if not title:
+        return None
+    non_recursive_path = path[1:] if path and path[0] == RECURSIVE_CHARACTER else path
+    if non_recursive_path:
+        return "/" + "/".join(non_recursive_path) + "#" + title
+    return "/#" + title
+
+
+def _get_language_map(value: Optional[str]) -> Optional[dict]:
+    """Get language map of value, or None if empty."""
+    return {None: value} if value else None
@@ -0,0 +1,28 @@
+"""GraphDelta module."""
+from typing import Iterator, List
+
+from attr import dataclass, Factory
+
+
+@dataclass
+class GraphDelta:
+    """A class representing the triples to add to and remove from a published graph.
+
+    Triples are represented as N-Triples statements.
+    """
+
+    additions: List[str] = Factory(list)
+    removals: List[str] = Factory(list)
+
+    def __iter__(self) -> Iterator:
+        """Returns iterable of class attributes."""
+        return iter((self.additions, self.removals))
+
+    def to_sparql_update(self, graph_uri: str) -> str:
+        """Create a SPARQL Update request applying the delta to a named graph."""
+        removals = "\n".join(self.removals)
+        additions = "\n".join(self.additions)
+        return (
+            f"DELETE DATA {{ GRAPH <{graph_uri}> {{\n{removals}\n}} }};\n"
+            f"INSERT DATA {{ GRAPH <{graph_uri}> {{\n{additions}\n}} }}"
+        )
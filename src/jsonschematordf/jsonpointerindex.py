@@ -0,0 +1,101 @@
+"""JsonPointerIndex module."""
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+
+class JsonPointerIndex:
+    """Utility class indexing the objects and arrays of a document by JSON Pointer.
+
+    Every top-level member of the document is indexed once, in a single pass over
+    its subtree, when a path below it is first looked up. Members that are never
+    looked up, such as the paths of an OpenAPI document, are never visited, and
+    looking up a node of an indexed member is a single dictionary lookup.
+
+    Lazily loaded objects and nodes reachable through more than one path are not
+    descended into. Paths through them, and paths to scalars, are walked from the
+    deepest indexed node.
+    """
+
+    __slots__ = ("__document", "__nodes", "__indexed_members")
+
+    __document: Mapping[str, Any]
+    __nodes: Dict[Tuple[str, ...], Any]
+    __indexed_members: Set[str]
+
+    def __init__(self, document: Mapping[str, Any]) -> None:
+        """Constructor for JsonPointerIndex object, indexing the document root."""
+        self.__document = document
+        self.__nodes = {(): document}
+        self.__indexed_members = set()
+
+    def __len__(self) -> int:
+        """Number of indexed nodes."""
+        return len(self.__nodes)
+
+    def get(self, path: List[str]) -> Optional[Any]:
+        """Get node at path of unescaped reference tokens."""
+        key = tuple(path)
+        if key in self.__nodes:
+            return self.__nodes[key]
+
+        if len(key) > 1 and key[0] not in self.__indexed_members:
+            self.__indexed_members.add(key[0])
+            self.__index_subtree(key[:1])
+            if key in self.__nodes:
+                return self.__nodes[key]
+        return self.__walk(key)
+
+    def invalidate(self, path: List[str]) -> None:
+        """Index subtree at path again, after the document is edited below path."""
+        key = tuple(path)
+        self.__nodes = {
+            node_key: node
+            for node_key, node in self.__nodes.items()
+            if node_key[: len(key)] != key
+        }
+        if not key:
+            self.__nodes[()] = self.__document
+            self.__indexed_members.clear()
+        elif key[0] in self.__indexed_members:
+            self.__index_subtree(key)
+
+    def __index_subtree(self, key: Tuple[str, ...]) -> None:
+        """Index every object and array of subtree at key, visiting each once."""
+        root = self.__walk(key)
+        visited = set()
+        stack: List[Tuple[Tuple[str, ...], Any]] = [(key, root)]
+
+        while stack:
+            node_key, node = stack.pop()
+            if not isinstance(node, (Mapping, list)):
+                continue
+            self.__nodes[node_key] = node
+            if id(node) in visited or not isinstance(node, (dict, list)):
+                continue
+            visited.add(id(node))
+
+            children = node.items() if isinstance(node, dict) else enumerate(node)
+            stack.extend((node_key + (str(token),), child) for token, child in children)
+
+    def __walk(self, key: Tuple[str, ...]) -> Optional[Any]:
+        """Get node at key by walking the document from the deepest indexed node."""
+        depth = len(key)
+        while key[:depth] not in self.__nodes:
+            depth -= 1
+        node = self.__nodes[key[:depth]]
+
+        for length in range(depth + 1, len(key) + 1):
+            node = _get_child(node, key[length - 1])
+            if node is None:
+                return None
+            if isinstance(node, (Mapping, list)):
+                self.__nodes[key[:length]] = node
+        return node
+
+
+def _get_child(node: object, token: str) -> Optional[Any]:
+    """Get child of object or array by unescaped reference token."""
+    if isinstance(node, Mapping):
+        return node.get(token)
+    if isinstance(node, list) and token.isdigit() and int(token) < len(node):
+        return node[int(token)]
+    return None
@@ -0,0 +1,49 @@
+"""LazyImport module."""
+from importlib import import_module
+from importlib.machinery import ModuleSpec, PathFinder
+from importlib.util import find_spec, LazyLoader, module_from_spec
+import sys
+from types import ModuleType
+from typing import List, Optional
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Get module, deferring its import until its attributes are first used.
+
+    The module is loaded by importlib's LazyLoader, and is executed on first
+    attribute access, after which it is an ordinary module. Parent packages are
+    loaded lazily as well, so nothing is imported until an attribute is accessed.
+
+    Args:
+        name: Absolute name of the module.
+
+    Returns:
+        The module if it is imported already, and a lazily loaded module otherwise.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    parent_name, _, child_name = name.rpartition(".")
+    parent = lazy_import(parent_name) if parent_name else None
+    spec = (
+        PathFinder.find_spec(name, _get_search_locations(parent))
+        if parent is not None
+        else find_spec(name)
+    )
+    if spec is None or spec.loader is None:
+        return import_module(name)
+
+    spec.loader = LazyLoader(spec.loader)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    if parent is not None:
+        setattr(parent, child_name, module)
+    return module
+
+
+def _get_search_locations(package: ModuleType) -> Optional[List[str]]:
+    """Get submodule search locations of package, without loading it."""
+    spec: ModuleSpec = object.__getattribute__(package, "__spec__")
+    return spec.submodule_search_locations
@@ -0,0 +1,174 @@
+"""LazyJson module.
+
+Navigates a JSON document held in a buffer, such as a memory-mapped file, without
+parsing it up front. Objects only record where their members are located in the
+buffer, and a member is parsed when it is first accessed.
+"""
+from __future__ import annotations
+
+import json
+from mmap import mmap
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jsonschematordf.resourcelimits import ResourceLimits
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,:}\]\s]+")
+_STRUCTURE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+
+Buffer = Union[bytes, mmap]
+
+
+class LazyJsonObject(Mapping):
+    """A read-only mapping over a JSON object in a buffer, parsed on first access."""
+
+    __slots__ = ("_buffer", "_start", "_end", "_members", "_children", "_value")
+
+    _buffer: Buffer
+    _start: int
+    _end: int
+    _members: Optional[Dict[str, Tuple[int, int]]]
+    _children: Dict[str, object]
+    _value: Optional[Dict[str, Any]]
+
+    def __init__(self, buffer: Buffer, start: int, end: int) -> None:
+        """Constructor for LazyJsonObject spanning buffer[start:end]."""
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._members = None
+        self._children = {}
+        self._value = None
+
+    def __getitem__(self, key: str) -> object:
+        """Get member, parsing it on first access."""
+        if key in self._children:
+            return self._children[key]
+
+        start, end = self._get_members()[key]
+        if self._buffer[start : start + 1] == b"{":
+            child: object = LazyJsonObject(self._buffer, start, end)
+        else:
+            child = json.loads(self._buffer[start:end])
+        self._children[key] = child
+        return child
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over member keys."""
+        return iter(self._get_members())
+
+    def __len__(self) -> int:
+        """Number of members."""
+        return len(self._get_members())
+
+    def materialize(self) -> Dict[str, Any]:
+        """Parse the whole object into a dict."""
+        if self._value is None:
+            self._value = json.loads(self._buffer[self._start : self._end])
+        return self._value
+
+    def _get_members(self) -> Dict[str, Tuple[int, int]]:
+        """Locate keys and value spans of members, without parsing the values."""
+        if self._members is None:
+            self._members = _scan_members(self._buffer, self._start)
+        return self._members
+
+
+def load_lazy_json(
+    buffer: Buffer, limits: Optional[ResourceLimits] = None
+) -> Optional[LazyJsonObject]:
+    """Get lazy root object of JSON document in buffer, or None if not an object.
+
+    The members of the root object are scanned up front, so documents that are not
+    JSON, such as YAML flow mappings, are rejected before they are used. The nesting
+    depth of the whole document is enforced while the root object is scanned.
+
+    Raises:
+        ValueError: If the root object is not a JSON object.
+        ResourceLimitError: If the document is nested deeper than the limit.
+    """
+    start = _skip_whitespace(buffer, 0)
+    if buffer[start : start + 1] != b"{":
+        return None
+    root = LazyJsonObject(buffer, start, _skip_value(buffer, start, limits))
+    root._get_members()
+    return root
+
+
+def materialize(node: object) -> object:
+    """Parse lazy node into plain Python objects, returning other values as is."""
+    if isinstance(node, LazyJsonObject):
+        return node.materialize()
+    return node
+
+
+def _scan_members(buffer: Buffer, start: int) -> Dict[str, Tuple[int, int]]:
+    """Scan members of object starting at start."""
+    members = {}
+    position = _skip_whitespace(buffer, start + 1)
+    if buffer[position : position + 1] == b"}":
+        return members
+
+    while True:
+        key_match = _STRING.match(buffer, position)
+        if key_match is None:
+            raise ValueError(f"Expected object key at position {position}")
+        key = json.loads(key_match.group())
+
+        position = _skip_whitespace(buffer, key_match.end())
+        if buffer[position : position + 1] != b":":
+            raise ValueError(f"Expected ':' at position {position}")
+
+        value_start = _skip_whitespace(buffer, position + 1)
+        value_end = _skip_value(buffer, value_start)
+        members[key] = (value_start, value_end)
+
+        position = _skip_whitespace(buffer, value_end)
+        delimiter = buffer[position : position + 1]
+        if delimiter == b"}":
+            return members
+        if delimiter != b",":
+            raise ValueError(f"Expected ',' or '}}' at position {position}")
+        position = _skip_whitespace(buffer, position + 1)
+
+
+def _skip_value(
+    buffer: Buffer, start: int, limits: Optional[ResourceLimits] = None
+) -> int:
+    """Get end position of value starting at start, enforcing its nesting depth."""
+    first = buffer[start : start + 1]
+    if first in (b"{", b"["):
+        depth = 0
+        for match in _STRUCTURE.finditer(buffer, start):
+            token = match.group()
+            if token in (b"{", b"["):
+                depth += 1
+                if limits is not None:
+                    limits.check_depth(depth)
+            elif token in (b"}", b"]"):
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        raise ValueError(f"Unterminated value at position {start}")
+
+    value_match = (_STRING if first == b'"' else _SCALAR).match(buffer, start)
+    if value_match is None:
+        raise ValueError(f"Expected value at position {start}")
+    return value_match.end()
+
+
+def _skip_whitespace(buffer: Buffer, position: int) -> int:
+    """Get position of next non-whitespace character."""
+    return _WHITESPACE.match(buffer, position).end()
@@ -1,23 +1,13 @@
 """ModelldcatnoFactory module."""
-from typing import Optional, Union
-
-from datacatalogtordf.uri import URI
-from modelldcatnotordf.modelldcatno import (
-    Attribute,
-    Choice,
-    CodeElement,
-    CodeList,
-    ModelElement,
-    ModelProperty,
-    ObjectType,
-    Role,
-    SimpleType,
-    Specialization,
-)
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING, Union
 
-from jsonschematordf.component import Component
+from jsonschematordf.component import AbstractComponent, Component
+from jsonschematordf.componentclassifier import classify_component
+from jsonschematordf.componentview import ComponentView
+from jsonschematordf.lazyimport import lazy_import
 from jsonschematordf.schema import Schema
-from jsonschematordf.types.constants import TYPE_DEFINITION_REFERENCE
 from jsonschematordf.types.enums import (
     CHOICE,
     CODE_LIST,
@@ -31,13 +21,31 @@ from jsonschematordf.types.enums import (
     SIMPLE_TYPE_ARRAY,
     SPECIALIZES,
 )
-from jsonschematordf.utils import add_to_path, determine_reference_type
+from jsonschematordf.utils import add_to_path, create_uri, determine_reference_type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+    from modelldcatnotordf.modelldcatno import (
+        Attribute,
+        CodeElement,
+        CodeList,
+        ModelElement,
+        ModelProperty,
+        ObjectType,
+        Role,
+        SimpleType,
+        Specialization,
+    )
+
+datacatalogtordf = lazy_import("datacatalogtordf")
+modelldcatno = lazy_import("modelldcatnotordf.modelldcatno")
 
 
 def create_model_property(
-    component: Component, schema: Schema
+    component: AbstractComponent, schema: Schema
 ) -> Optional[Union[ModelProperty, URI]]:
     """Create modelldcatno property component for JSON Schema Component."""
+    schema.check_deadline()
     if parsed_component_uri := schema.get_parsed_component_uri(component.complete_path):
         return parsed_component_uri
 
@@ -66,9 +74,10 @@ def create_model_property(
 
 
 def create_model_element(
-    component: Component, schema: Schema
+    component: AbstractComponent, schema: Schema
 ) -> Optional[Union[ModelElement, URI]]:
     """Create modelldcatno element component for JSON Schema Component."""
+    schema.check_deadline()
     if parsed_component_uri := schema.get_parsed_component_uri(component.complete_path):
         return parsed_component_uri
     if component.ref:
@@ -94,7 +103,7 @@ def _create_code_element(
 ) -> CodeElement:
     """Create Code Element."""
     identifier = schema.create_identifier(None)
-    code_element = CodeElement(identifier)
+    code_element = modelldcatno.CodeElement(identifier)
     code_element.notation = notation
     code_element.in_scheme = [parent]
     return code_element
@@ -103,13 +112,15 @@ def _create_code_element(
 def _resolve_component_reference(
     reference: str, schema: Schema
 ) -> Optional[Union[ModelElement, URI]]:
-    """Resolve component reference."""
-    reference_type = determine_reference_type(reference)
-    if reference_type == RECURSIVE_REFERENCE:
-        return _resolve_recursive_reference(reference, schema)
-    if reference_type == EXTERNAL_REFERENCE:
-        return reference
-    return None
+    """Resolve component reference through references to its final target."""
+    reference_target = schema.get_reference_target(reference)
+    if reference_target is None:
+        return None
+
+    target_schema, target_reference = reference_target
+    if determine_reference_type(target_reference) == RECURSIVE_REFERENCE:
+        return _resolve_recursive_reference(target_reference, target_schema)
+    return target_reference
 
 
 def _resolve_recursive_reference(
@@ -123,9 +134,9 @@ def _resolve_recursive_reference(
 
     for component in reference_components:
         element = create_model_element(component, schema)
-        if isinstance(element, ModelElement):
+        if isinstance(element, modelldcatno.ModelElement):
             model_elements.append(element)
-        if isinstance(element, URI):
+        if isinstance(element, datacatalogtordf.URI):
             uri = element
 
     if len(model_elements) > 1:
@@ -140,29 +151,32 @@ def _resolve_recursive_reference(
         return None
 
 
-def _determine_component_type(component: Component, schema: Schema) -> Optional[str]:
+def _determine_component_type(
+    component: AbstractComponent, schema: Schema
+) -> Optional[str]:
     """Determine type of json schema component."""
-    ref_type = _determine_ref_type(component.ref, schema) if component.ref else None
-
-    if component.items:
-        items_type = _determine_component_type(component.items, schema)
-        if items_type == OBJECT_TYPE:
-            return OBJECT_ARRAY
-        if items_type == SIMPLE_TYPE:
-            return SIMPLE_TYPE_ARRAY
-    if component.specializes:
-        return SPECIALIZES
-    if component.one_of:
-        return CHOICE
-    if component.enum:
-        return CODE_LIST
-    if component.type == "object" or component.properties:
-        return OBJECT_TYPE
     if (
-        component.type in TYPE_DEFINITION_REFERENCE.keys()
-        or ref_type in TYPE_DEFINITION_REFERENCE.keys()
+        isinstance(component, ComponentView)
+        and component.table is schema.component_table
     ):
-        if (
+        return schema.get_component_type(component)
+
+    ref_type = schema.get_reference_type(component.ref) if component.ref else None
+    items_type = (
+        _determine_component_type(component.items, schema) if component.items else None
+    )
+
+    return classify_component(
+        component.type,
+        component.format,
+        items_type,
+        ref_type,
+        has_items=bool(component.items),
+        has_specializes=bool(component.specializes),
+        has_one_of=bool(component.one_of),
+        has_enum=bool(component.enum),
+        has_properties=bool(component.properties),
+        has_restrictions=bool(
             component.title
             or component.description
             or component.pattern
@@ -172,49 +186,33 @@ def _determine_component_type(component: Component, schema: Schema) -> Optional[
             or component.exclusive_minimum
             or component.maximum
             or component.exclusive_maximum
-        ):
-            return SIMPLE_TYPE
-        return PRIMITIVE_SIMPLE_TYPE
-
-    return ref_type
-
-
-def _determine_ref_type(ref: str, schema: Schema) -> Optional[str]:
-    """Determine type of referenced schema."""
-    reference_type = determine_reference_type(ref)
-    if reference_type == RECURSIVE_REFERENCE:
-        referenced_components = schema.get_components_by_path(ref)
-        if len(referenced_components) >= 1 and isinstance(
-            referenced_components[0], Component
-        ):
-            return _determine_component_type(referenced_components[0], schema)
-
-    elif reference_type == EXTERNAL_REFERENCE:
-        return reference_type
-    return None
+        ),
+        type_registry=schema.type_registry,
+    )
 
 
-def _create_object_type(component: Component, schema: Schema) -> ObjectType:
+def _create_object_type(component: AbstractComponent, schema: Schema) -> ObjectType:
     """Create object type."""
-    object_type = ObjectType(component.identifier)
+    object_type = modelldcatno.ObjectType(component.identifier)
     object_type.title = component.title
     object_type.description = component.description
 
     if component.properties:
-        model_properties = [
-            create_model_property(model_property, schema)
-            for model_property in component.properties
-        ]
         object_type.has_property = [
-            property for property in model_properties if property
+            property
+            for property in (
+                create_model_property(model_property, schema)
+                for model_property in component.properties
+            )
+            if property
         ]
 
     return object_type
 
 
-def _create_simple_type(component: Component, schema: Schema) -> SimpleType:
+def _create_simple_type(component: AbstractComponent, schema: Schema) -> SimpleType:
     """Create simple type."""
-    simple_type = SimpleType(component.identifier)
+    simple_type = modelldcatno.SimpleType(component.identifier)
     simple_type.title = component.title
     simple_type.description = component.description
     simple_type.pattern = component.pattern
@@ -250,22 +248,58 @@ def _create_simple_type(component: Component, schema: Schema) -> SimpleType:
     return simple_type
 
 
-def _create_primitive_simple_type(component: Component, schema: Schema) -> SimpleType:
+def _create_primitive_simple_type(
+    component: AbstractComponent, schema: Schema
+) -> Union[SimpleType, URI]:
     """Create primitive global simple type based on format or type."""
-    title = component.format if component.format else component.type
+    return create_primitive_simple_type(component.type, component.format, schema)
 
-    simple_type = SimpleType(schema.create_identifier("/#" + title if title else None))
+
+def create_primitive_simple_type(
+    type: Optional[str], format: Optional[str], schema: Schema
+) -> Union[SimpleType, URI]:
+    """Create primitive global simple type based on format or type.
+
+    The simple type is created once per schema, and later uses refer to it by its
+    identifier, so it is serialized once.
+    """
+    title = format if format else type
+    type_reference = schema.type_registry.get_type_definition_reference(type, format)
+    if title and (
+        shared_simple_type := schema.get_primitive_simple_type(title, type_reference)
+    ):
+        return create_uri(shared_simple_type.identifier)
+
+    simple_type = modelldcatno.SimpleType(
+        schema.create_identifier("/#" + title if title else None)
+    )
     simple_type.title = {None: title} if title else None
 
-    if type_reference := TYPE_DEFINITION_REFERENCE.get(component.type):
+    if type_reference:
         simple_type.type_definition_reference = type_reference
 
+    schema.add_primitive_simple_type(simple_type, type_reference)
     return simple_type
 
 
-def _create_code_list(component: Component, schema: Schema) -> CodeList:
-    """Create Code List and add Code Elements to orphan graph."""
-    code_list = CodeList(component.identifier)
+def _create_code_list(
+    component: AbstractComponent, schema: Schema
+) -> Union[CodeList, URI]:
+    """Create Code List and add Code Elements to orphan graph.
+
+    If the schema shares code lists, and a code list of the same enum values is
+    already created, the component refers to it instead.
+    """
+    code_list_registry = schema.code_list_registry
+    if code_list_registry is not None and component.enum:
+        code_list_uri = code_list_registry.get_code_list_uri(component.enum)
+        if code_list_uri:
+            if component.complete_path:
+                schema.add_parsed_identifier(component.complete_path, code_list_uri)
+            return create_uri(code_list_uri)
+        code_list_registry.add_code_list(component.enum, component.identifier)
+
+    code_list = modelldcatno.CodeList(component.identifier)
     code_list.title = component.title
     code_list.description = component.description
 
@@ -281,10 +315,10 @@ def _create_code_list(component: Component, schema: Schema) -> CodeList:
 
 
 def _create_specialization_property(
-    component: Component, schema: Schema
+    component: AbstractComponent, schema: Schema
 ) -> Specialization:
     """Create Specialization model property."""
-    specialization = Specialization(component.identifier)
+    specialization = modelldcatno.Specialization(component.identifier)
     if component.specializes:
         specialization.has_general_concept = create_model_element(
             component.specializes, schema
@@ -293,9 +327,11 @@ def _create_specialization_property(
     return specialization
 
 
-def _create_attribute_property(component: Component, schema: Schema) -> Attribute:
+def _create_attribute_property(
+    component: AbstractComponent, schema: Schema
+) -> Attribute:
     """Create Attribute model property."""
-    attribute = Attribute(component.identifier)
+    attribute = modelldcatno.Attribute(component.identifier)
     attribute.title = component.title
     attribute.description = component.description
     attribute.max_occurs = component.max_occurs
@@ -323,9 +359,9 @@ def _create_attribute_property(component: Component, schema: Schema) -> Attribut
     return attribute
 
 
-def _create_choice_property(component: Component, schema: Schema) -> Attribute:
+def _create_choice_property(component: AbstractComponent, schema: Schema) -> Attribute:
     """Create Choice model property."""
-    choice = Choice(component.identifier)
+    choice = modelldcatno.Choice(component.identifier)
     choice.title = component.title
     choice.description = component.description
     choice.max_occurs = component.max_occurs
@@ -339,9 +375,9 @@ def _create_choice_property(component: Component, schema: Schema) -> Attribute:
     return choice
 
 
-def _create_object_array_property(component: Component, schema: Schema) -> Role:
+def _create_object_array_property(component: AbstractComponent, schema: Schema) -> Role:
     """Create object array model property."""
-    array = Role(component.identifier)
+    array = modelldcatno.Role(component.identifier)
     array.title = component.title
     array.description = component.description
     array.max_occurs = component.max_occurs
@@ -354,10 +390,10 @@ def _create_object_array_property(component: Component, schema: Schema) -> Role:
 
 
 def _create_simple_type_array_property(
-    component: Component, schema: Schema
+    component: AbstractComponent, schema: Schema
 ) -> Attribute:
     """Create simple type array model property."""
-    array = Attribute(component.identifier)
+    array = modelldcatno.Attribute(component.identifier)
     array.title = component.title
     array.description = component.description
     array.max_occurs = component.max_occurs
@@ -369,9 +405,9 @@ def _create_simple_type_array_property(
     return array
 
 
-def _create_role_property(component: Component, schema: Schema) -> Role:
+def _create_role_property(component: AbstractComponent, schema: Schema) -> Role:
     """Create object array model property."""
-    role = Role(component.identifier)
+    role = modelldcatno.Role(component.identifier)
     role.title = component.title
     role.description = component.description
     role.max_occurs = component.max_occurs
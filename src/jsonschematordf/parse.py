@@ -1,21 +1,89 @@
-"""JsonSchemaToRDF module."""
-from typing import List
+"""JsonSchemaToRDF module.
 
-from rdflib.graph import Graph
-import yaml
+Heavy dependencies, such as rdflib and modelldcatnotordf, are imported on first use,
+so importing the module is fast.
+"""
+from __future__ import annotations
 
+from contextlib import nullcontext
+from mmap import ACCESS_READ, mmap
+import os
+import re
+import time
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from jsonschematordf.codelistregistry import CodeListRegistry
+from jsonschematordf.conversionplan import ConversionPlan, PLAN_BASE_URI
+from jsonschematordf.documentresolver import DocumentResolver
+from jsonschematordf.exceptions import ConversionTimeoutError
+from jsonschematordf.flatschema import flat_component_to_modelldcatno, is_flat_schema
+from jsonschematordf.graphdelta import GraphDelta
+from jsonschematordf.lazyimport import lazy_import
 from jsonschematordf.modelldcatnofactory import create_model_element
 from jsonschematordf.parsedschema import ParsedSchema
+from jsonschematordf.resourcelimits import (
+    load_json_schema_buffer,
+    load_json_schema_string,
+    ResourceLimits,
+)
 from jsonschematordf.schema import Schema
-from jsonschematordf.utils import add_elements_to_graph
+from jsonschematordf.schemaregistry import SchemaRegistry
+from jsonschematordf.sharedschema import share_json_schema, SharedJsonSchema
+from jsonschematordf.utils import (
+    add_elements_to_graph,
+    graph_to_ntriples,
+    read_ntriples,
+    split_json_pointer,
+    to_json_pointer,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
+    from rdflib.graph import Graph
+
+futures = lazy_import("concurrent.futures")
+rdflib = lazy_import("rdflib")
+rdflib_compare = lazy_import("rdflib.compare")
+
+_SKOLEM_IRI = re.compile(r"<[^<>]*/\.well-known/skolem/[^<>]*>")
 
 
-def json_schema_to_graph(json_schema_string: str, base_uri: str) -> Graph:
+def json_schema_to_graph(
+    json_schema_string: str,
+    base_uri: str,
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    limits: Optional[ResourceLimits] = None,
+    time_budget: Optional[float] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+) -> Graph:
     """Parse JSON Schema to RDF Graph representation.
 
     Args:
         json_schema_string: a valid JSON Schema string.
         base_uri: base URI of the schema.
+        resolver: optional resolver loading externally referenced documents.
+        root_selectors: optional JSON Pointers to objects containing root elements.
+        max_workers: optional number of worker processes converting root elements.
+        limits: optional resource limits enforced while loading and converting.
+        time_budget: optional number of seconds after which conversion stops, and
+            the graph only contains the root elements converted in time.
+        code_list_registry: optional registry of code lists shared by a batch.
 
     Returns:
         an RDF Graph representing the JSON Schema using modelldcatno.
@@ -27,24 +95,168 @@ def json_schema_to_graph(json_schema_string: str, base_uri: str) -> Graph:
     >>> graph = json_schema_to_graph(json_schema_string, base_uri)
     """
     model_elements, orphan_elements = json_schema_to_modelldcatno(
-        json_schema_string, base_uri
+        json_schema_string,
+        base_uri,
+        resolver,
+        root_selectors,
+        max_workers,
+        limits,
+        time_budget,
+        code_list_registry,
     )
 
-    schema_graph = add_elements_to_graph(Graph(), [*model_elements, *orphan_elements])
+    schema_graph = add_elements_to_graph(
+        rdflib.Graph(), [*model_elements, *orphan_elements]
+    )
 
     return schema_graph
 
 
-def json_schema_to_modelldcatno(json_schema_string: str, base_uri: str) -> ParsedSchema:
+def json_schema_to_conversion_plan(
+    json_schema_string: str,
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    limits: Optional[ResourceLimits] = None,
+) -> ConversionPlan:
+    """Compile JSON Schema to a conversion plan reusable across base URIs.
+
+    The schema is converted once, and the plan is instantiated for each base URI
+    by prefixing identifiers, which is much cheaper than converting it again.
+
+    Args:
+        json_schema_string: a valid JSON Schema string.
+        resolver: optional resolver loading externally referenced documents.
+        root_selectors: optional JSON Pointers to objects containing root elements.
+        max_workers: optional number of worker processes converting root elements.
+        limits: optional resource limits enforced while loading and converting.
+
+    Returns:
+        a ConversionPlan creating the RDF Graph of the JSON Schema for a base URI.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_to_conversion_plan
+    >>> json_schema_string = "{ 'Element': { 'type': 'object' } }"
+    >>> plan = json_schema_to_conversion_plan(json_schema_string)
+    >>> graph = plan.to_graph("http://uri.com")
+    """
+    return ConversionPlan(
+        json_schema_to_graph(
+            json_schema_string,
+            PLAN_BASE_URI,
+            resolver,
+            root_selectors,
+            max_workers,
+            limits,
+        )
+    )
+
+
+def json_schema_to_graph_delta(
+    json_schema_string: str, base_uri: str, previous: Union[Graph, str]
+) -> GraphDelta:
+    """Parse JSON Schema and compute the delta against a previously published graph.
+
+    The previous graph is streamed from its N-Triples file line by line and is never
+    loaded into an RDF Graph. Only the statements about skolemized identifiers, which
+    are minted anew on every conversion, are held in memory. They are grouped into
+    parts connected by skolemized identifiers, and parts that are equal apart from
+    the naming of their skolemized identifiers are left out of the delta.
+
+    Args:
+        json_schema_string: A valid JSON Schema string.
+        base_uri: Base URI of the schema.
+        previous: The previous output Graph, or path to its N-Triples file.
+
+    Returns:
+        A GraphDelta object containing the N-Triples statements to add and remove.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_to_graph_delta
+    >>> json_schema_string = "{ 'Element': { 'type': 'object' } }"
+    >>> base_uri = "http://uri.com"
+    >>> additions, removals = json_schema_to_graph_delta(
+        ... json_schema_string, base_uri, "previous.nt"
+        ...)
+    """
+    current = graph_to_ntriples(json_schema_to_graph(json_schema_string, base_uri))
+    removals = set()
+    unchanged = set()
+    previous_skolem_statements = []
+
+    for statement in _read_previous_statements(previous):
+        if statement in current:
+            unchanged.add(statement)
+        elif _SKOLEM_IRI.search(statement):
+            previous_skolem_statements.append(statement)
+        else:
+            removals.add(statement)
+
+    additions = current - unchanged
+    current_skolem_statements = [
+        statement for statement in additions if _SKOLEM_IRI.search(statement)
+    ]
+    renamed, previous_renamed = _match_skolem_parts(
+        current_skolem_statements, previous_skolem_statements
+    )
+    removals.update(set(previous_skolem_statements) - previous_renamed)
+
+    return GraphDelta(sorted(additions - renamed), sorted(removals))
+
+
+def json_schema_to_modelldcatno(
+    json_schema_string: str,
+    base_uri: str,
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    limits: Optional[ResourceLimits] = None,
+    time_budget: Optional[float] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+) -> ParsedSchema:
     """Parse JSON Schema to modelldcatno representation.
 
+    Externally referenced documents are loaded and parsed as well if a resolver is
+    given, and their orphaned elements are included in the output.
+
+    By default every top-level member of the document is a root element. Root
+    selectors, such as "/$defs" or "/components/schemas", restrict the root elements
+    to the members of the selected objects, so the rest of the document is skipped.
+
+    If more than one worker process is allowed, root elements not referencing each
+    other are converted in separate processes sharing the document read-only. The
+    output is identical to converting the root elements in a single process.
+
+    If resource limits are given, documents exceeding them, such as YAML documents
+    whose aliases expand to too many nodes, are rejected while they are loaded, and
+    conversion stops as soon as too many components are built.
+
+    If a time budget is given, conversion stops when it runs out. Root elements
+    converted in time are returned, and the root element being converted and the
+    ones after it are listed as skipped definitions.
+
+    If a code list registry is given, code lists whose enum values are already
+    converted with the same registry, such as in an earlier document of a batch,
+    are referred to by their identifier, and their code elements are not created
+    again. Conversion with a code list registry runs in a single process, so its
+    output does not depend on the number of workers.
+
     Args:
         json_schema_string: A valid JSON Schema string.
         base_uri: Base URI of the schema.
+        resolver: Optional resolver loading externally referenced documents.
+        root_selectors: Optional JSON Pointers to objects containing root elements.
+        max_workers: Optional number of worker processes converting root elements.
+        limits: Optional resource limits enforced while loading and converting.
+        time_budget: Optional number of seconds after which conversion stops.
+        code_list_registry: Optional registry of code lists shared by a batch.
 
     Returns:
         A ParsedSchema object containing the parsed modelldcatno ModelElements and
-        orphaned elements.
+        orphaned elements, and the root elements skipped when time ran out.
+
+    Raises:
+        ResourceLimitError: If the JSON Schema exceeds the resource limits.
 
     Example:
     >>> from jsonschematordf.parse import json_schema_to_modelldcatno
@@ -54,23 +266,257 @@ def json_schema_to_modelldcatno(json_schema_string: str, base_uri: str) -> Parse
         ... json_schema_string, base_uri
         ...)
     """
-    in_dict = yaml.safe_load(json_schema_string)
-    model_elements = []
-    orphan_elements = []
+    deadline = _get_deadline(time_budget)
+    if max_workers is not None and max_workers > 1 and code_list_registry is None:
+        with share_json_schema(json_schema_string) as shared_schema:
+            return _shared_json_schema_to_modelldcatno(
+                shared_schema,
+                base_uri,
+                resolver,
+                root_selectors,
+                max_workers,
+                limits,
+                deadline,
+            )
+
+    in_dict = load_json_schema_string(json_schema_string, limits)
 
     if isinstance(in_dict, dict):
-        schema = Schema(base_uri, in_dict)
-        for root_element in in_dict.keys():
-            parsed_schema = json_schema_component_to_modelldcatno(
-                schema, [root_element]
-            )
-            model_elements.extend(parsed_schema.model_elements)
-            orphan_elements.extend(parsed_schema.orphan_elements)
-        return ParsedSchema(model_elements, orphan_elements)
+        return _json_schema_representation_to_modelldcatno(
+            in_dict,
+            base_uri,
+            resolver,
+            root_selectors,
+            limits,
+            deadline,
+            code_list_registry,
+        )
 
     return ParsedSchema()
 
 
+def json_schema_file_to_graph(
+    file_path: str,
+    base_uri: str,
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    limits: Optional[ResourceLimits] = None,
+    time_budget: Optional[float] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+) -> Graph:
+    """Parse JSON Schema file to RDF Graph representation.
+
+    Args:
+        file_path: path to a valid JSON Schema file.
+        base_uri: base URI of the schema.
+        resolver: optional resolver loading externally referenced documents.
+        root_selectors: optional JSON Pointers to objects containing root elements.
+        limits: optional resource limits enforced while loading and converting.
+        time_budget: optional number of seconds after which conversion stops, and
+            the graph only contains the root elements converted in time.
+        code_list_registry: optional registry of code lists shared by a batch.
+
+    Returns:
+        an RDF Graph representing the JSON Schema using modelldcatno.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_file_to_graph
+    >>> base_uri = "http://uri.com"
+    >>> graph = json_schema_file_to_graph("schema.json", base_uri)
+    """
+    model_elements, orphan_elements = json_schema_file_to_modelldcatno(
+        file_path,
+        base_uri,
+        resolver,
+        root_selectors,
+        limits,
+        time_budget,
+        code_list_registry,
+    )
+
+    return add_elements_to_graph(rdflib.Graph(), [*model_elements, *orphan_elements])
+
+
+def json_schema_file_to_modelldcatno(
+    file_path: str,
+    base_uri: str,
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    limits: Optional[ResourceLimits] = None,
+    time_budget: Optional[float] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+) -> ParsedSchema:
+    """Parse JSON Schema file to modelldcatno representation.
+
+    JSON files are memory-mapped and parsed lazily, so only the definitions that are
+    parsed, and the objects leading to them, are loaded into memory. Files that are
+    not JSON objects are loaded as YAML.
+
+    Args:
+        file_path: Path to a valid JSON Schema file.
+        base_uri: Base URI of the schema.
+        resolver: Optional resolver loading externally referenced documents.
+        root_selectors: Optional JSON Pointers to objects containing root elements.
+        limits: Optional resource limits enforced while loading and converting.
+        time_budget: Optional number of seconds after which conversion stops.
+        code_list_registry: Optional registry of code lists shared by a batch.
+
+    Returns:
+        A ParsedSchema object containing the parsed modelldcatno ModelElements and
+        orphaned elements, and the root elements skipped when time ran out.
+
+    Raises:
+        ResourceLimitError: If the JSON Schema exceeds the resource limits.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_file_to_modelldcatno
+    >>> base_uri = "http://uri.com"
+    >>> model_elements, orphan_elements = json_schema_file_to_modelldcatno(
+        ... "schema.json", base_uri
+        ...)
+    """
+    deadline = _get_deadline(time_budget)
+    with open(file_path, "rb") as schema_file:
+        file_size = os.fstat(schema_file.fileno()).st_size
+        if file_size == 0:
+            return ParsedSchema()
+        if limits is not None:
+            limits.check_bytes(file_size)
+
+        with mmap(schema_file.fileno(), 0, access=ACCESS_READ) as buffer:
+            representation = load_json_schema_buffer(buffer, limits)
+
+            if representation is not None:
+                return _json_schema_representation_to_modelldcatno(
+                    representation,
+                    base_uri,
+                    resolver,
+                    root_selectors,
+                    limits,
+                    deadline,
+                    code_list_registry,
+                )
+
+    return ParsedSchema()
+
+
+def json_schema_bundle_to_graph(
+    documents: Dict[str, str],
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    limits: Optional[ResourceLimits] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+    time_budget: Optional[float] = None,
+) -> Graph:
+    """Parse bundle of JSON Schema documents to RDF Graph representation.
+
+    If a time budget is given, it is shared by loading, converting and adding to
+    the graph every document of the bundle. The graph contains the root elements
+    converted in time, of the documents added to the graph in time.
+
+    Args:
+        documents: Mapping from base URI of each document to its JSON Schema string.
+        resolver: Optional resolver loading documents referenced outside the bundle.
+        root_selectors: Optional JSON Pointers to objects containing root elements.
+        limits: Optional resource limits enforced for every document.
+        code_list_registry: Optional registry of code lists shared with other
+            bundles, instead of one shared by the documents of this bundle only.
+        time_budget: Optional number of seconds after which conversion stops.
+
+    Returns:
+        an RDF Graph representing the JSON Schema bundle using modelldcatno.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_bundle_to_graph
+    >>> documents = {
+        ... "http://uri.com/a.json": "{ 'A': { '$ref': 'b.json#/B' } }",
+        ... "http://uri.com/b.json": "{ 'B': { 'type': 'object' } }",
+        ...}
+    >>> graph = json_schema_bundle_to_graph(documents)
+    """
+    deadline = _get_deadline(time_budget)
+    graph = rdflib.Graph()
+    for model_elements, orphan_elements in _parse_bundle(
+        documents, resolver, root_selectors, limits, deadline, code_list_registry
+    ):
+        if _is_past_deadline(deadline):
+            break
+        document_graph = add_elements_to_graph(
+            rdflib.Graph(), [*model_elements, *orphan_elements]
+        )
+        for prefix, namespace in document_graph.namespaces():
+            graph.bind(prefix, namespace)
+        graph += document_graph
+
+    return graph
+
+
+def json_schema_bundle_to_modelldcatno(
+    documents: Dict[str, str],
+    resolver: Optional[DocumentResolver] = None,
+    root_selectors: Optional[List[str]] = None,
+    limits: Optional[ResourceLimits] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+    time_budget: Optional[float] = None,
+) -> ParsedSchema:
+    """Parse bundle of JSON Schema documents to modelldcatno representation.
+
+    All documents share one SchemaRegistry, so references between documents are
+    resolved in-process and each shared definition is parsed once for the bundle.
+    The documents share one CodeListRegistry as well, so code lists of the same
+    enum values are created once, by the first document using them.
+
+    If a time budget is given, it is shared by loading and converting every
+    document of the bundle. Root elements converted in time are returned, and the
+    root elements skipped when it ran out are listed by their URI reference, such
+    as "http://uri.com/a.json#/A". Documents not loaded in time are listed by
+    their URI.
+
+    Args:
+        documents: Mapping from base URI of each document to its JSON Schema string.
+        resolver: Optional resolver loading documents referenced outside the bundle.
+        root_selectors: Optional JSON Pointers to objects containing root elements.
+        limits: Optional resource limits enforced for every document.
+        code_list_registry: Optional registry of code lists shared with other
+            bundles, instead of one shared by the documents of this bundle only.
+        time_budget: Optional number of seconds after which conversion stops.
+
+    Returns:
+        A ParsedSchema object containing the parsed modelldcatno ModelElements and
+        orphaned elements of all documents, and the root elements and documents
+        skipped when time ran out.
+
+    Raises:
+        ResourceLimitError: If a document exceeds the resource limits.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_bundle_to_modelldcatno
+    >>> documents = {
+        ... "http://uri.com/a.json": "{ 'A': { '$ref': 'b.json#/B' } }",
+        ... "http://uri.com/b.json": "{ 'B': { 'type': 'object' } }",
+        ...}
+    >>> model_elements, orphan_elements = json_schema_bundle_to_modelldcatno(
+        ... documents
+        ...)
+    """
+    model_elements = []
+    orphan_elements = []
+    skipped_definitions = []
+    for parsed_schema in _parse_bundle(
+        documents,
+        resolver,
+        root_selectors,
+        limits,
+        _get_deadline(time_budget),
+        code_list_registry,
+    ):
+        model_elements.extend(parsed_schema.model_elements)
+        orphan_elements.extend(parsed_schema.orphan_elements)
+        skipped_definitions.extend(parsed_schema.skipped_definitions)
+
+    return ParsedSchema(model_elements, orphan_elements, skipped_definitions)
+
+
 def json_schema_component_to_modelldcatno(
     schema: Schema, path: List[str]
 ) -> ParsedSchema:
@@ -82,7 +528,7 @@ def json_schema_component_to_modelldcatno(
 
     Returns:
         A ParsedSchema object containing the parsed modelldcatno ModelElements and
-        orphaned elements.
+        the orphaned elements created while parsing the component.
 
 
     Example:
@@ -97,6 +543,7 @@ def json_schema_component_to_modelldcatno(
         ...)
     """
     model_elements = []
+    orphan_count = len(schema.orphan_elements)
     components = schema.get_components_by_path_list(path)
 
     for component in components:
@@ -104,4 +551,387 @@ def json_schema_component_to_modelldcatno(
         if parsed_element:
             model_elements.append(parsed_element)
 
-    return ParsedSchema(model_elements, schema.orphan_elements)
+    return ParsedSchema(model_elements, schema.orphan_elements[orphan_count:])
+
+
+def json_schema_definitions_to_modelldcatno(
+    schema: Schema, pointers: List[str]
+) -> ParsedSchema:
+    """Parse selected definitions and the definitions they transitively reference.
+
+    Args:
+        schema: A jsonschematordf Schema object.
+        pointers: JSON Pointers to the definitions to be serialized.
+
+    Returns:
+        A ParsedSchema object containing the parsed modelldcatno ModelElements and
+        orphaned elements of the definitions and their references.
+
+    Example:
+    >>> from jsonschematordf.parse import json_schema_definitions_to_modelldcatno
+    >>> from jsonschematordf.schema import Schema
+    >>> json_schema = { "$defs": { "Element": { "type": "object" } } }
+    >>> base_uri = "http://uri.com"
+    >>> schema = Schema(base_uri, json_schema)
+    >>> model_elements, orphan_elements = json_schema_definitions_to_modelldcatno(
+        ... schema, ["/$defs/Element"]
+        ...)
+    """
+    model_elements = []
+    orphan_elements = []
+    paths = [split_json_pointer(pointer) for pointer in pointers]
+
+    for path in schema.get_reference_closure(paths):
+        parsed_schema = json_schema_component_to_modelldcatno(schema, path)
+        model_elements.extend(parsed_schema.model_elements)
+        orphan_elements.extend(parsed_schema.orphan_elements)
+
+    return ParsedSchema(model_elements, orphan_elements)
+
+
+def _json_schema_representation_to_modelldcatno(
+    json_schema_representation: Mapping[str, Any],
+    base_uri: str,
+    resolver: Optional[DocumentResolver],
+    root_selectors: Optional[List[str]],
+    limits: Optional[ResourceLimits] = None,
+    deadline: Optional[float] = None,
+    code_list_registry: Optional[CodeListRegistry] = None,
+) -> ParsedSchema:
+    """Parse root elements of JSON Schema representation."""
+    registry = SchemaRegistry(resolver) if resolver else None
+    schema = Schema(
+        base_uri,
+        json_schema_representation,
+        registry,
+        limits=limits,
+        deadline=deadline,
+        code_list_registry=code_list_registry,
+    )
+    return _schema_to_modelldcatno(
+        schema, registry, schema.get_root_paths(root_selectors)
+    )
+
+
+def _schema_to_modelldcatno(
+    schema: Schema, registry: Optional[SchemaRegistry], root_paths: List[List[str]]
+) -> ParsedSchema:
+    """Parse root elements of schema, and orphans of documents it references."""
+    parsed_roots = _parse_roots(schema, root_paths)
+    return _merge_parsed_roots(
+        root_paths, parsed_roots, _get_external_orphan_elements(registry)
+    )
+
+
+def _shared_json_schema_to_modelldcatno(
+    shared_schema: SharedJsonSchema,
+    base_uri: str,
+    resolver: Optional[DocumentResolver],
+    root_selectors: Optional[List[str]],
+    max_workers: int,
+    limits: Optional[ResourceLimits] = None,
+    deadline: Optional[float] = None,
+) -> ParsedSchema:
+    """Parse independent groups of root elements in separate worker processes.
+
+    Schemas with fewer than two independent groups are parsed in this process.
+    """
+    json_schema_representation = shared_schema.load(limits)
+    if json_schema_representation is None:
+        return ParsedSchema()
+
+    registry = SchemaRegistry(resolver) if resolver else None
+    schema = Schema(
+        base_uri,
+        json_schema_representation,
+        registry,
+        limits=limits,
+        deadline=deadline,
+    )
+    root_paths = schema.get_root_paths(root_selectors)
+    root_groups = schema.get_independent_root_groups(root_paths)
+    if len(root_groups) < 2:
+        return _schema_to_modelldcatno(schema, registry, root_paths)
+
+    parsed_roots: Dict[str, Optional[ParsedSchema]] = {}
+    external_orphan_elements = []
+    with futures.ProcessPoolExecutor(
+        max_workers,
+        initializer=_initialize_worker,
+        initargs=(shared_schema, base_uri, resolver, limits, deadline),
+    ) as executor:
+        chunksize = max(1, len(root_groups) // (max_workers * 4))
+        for root_group, (parsed_group, external_orphans) in zip(
+            root_groups,
+            executor.map(_parse_root_group, root_groups, chunksize=chunksize),
+        ):
+            for root_path, parsed_schema in zip(root_group, parsed_group):
+                parsed_roots[to_json_pointer(root_path)] = parsed_schema
+            external_orphan_elements.extend(external_orphans)
+
+    return _merge_parsed_roots(
+        root_paths,
+        [parsed_roots[to_json_pointer(root_path)] for root_path in root_paths],
+        external_orphan_elements,
+    )
+
+
+def _load_bundle(
+    documents: Dict[str, str],
+    resolver: Optional[DocumentResolver],
+    limits: Optional[ResourceLimits],
+    deadline: Optional[float],
+    code_list_registry: Optional[CodeListRegistry],
+) -> Tuple[SchemaRegistry, List[str]]:
+    """Load documents of bundle into one registry, and URIs of documents skipped.
+
+    Documents are loaded until the deadline, and the rest are skipped.
+    """
+    registry = SchemaRegistry(resolver)
+    if code_list_registry is None:
+        code_list_registry = CodeListRegistry()
+    skipped_documents = []
+    for document_uri, json_schema_string in documents.items():
+        if _is_past_deadline(deadline):
+            skipped_documents.append(document_uri)
+            continue
+        in_dict = load_json_schema_string(json_schema_string, limits)
+        if isinstance(in_dict, dict):
+            Schema(
+                document_uri,
+                in_dict,
+                registry,
+                limits=limits,
+                deadline=deadline,
+                code_list_registry=code_list_registry,
+            )
+    return registry, skipped_documents
+
+
+def _parse_bundle(
+    documents: Dict[str, str],
+    resolver: Optional[DocumentResolver],
+    root_selectors: Optional[List[str]],
+    limits: Optional[ResourceLimits],
+    deadline: Optional[float],
+    code_list_registry: Optional[CodeListRegistry],
+) -> List[ParsedSchema]:
+    """Parse documents of bundle until the deadline, one ParsedSchema per schema.
+
+    Documents not loaded in time are listed as skipped by their URI, and root
+    elements not converted in time by their URI reference.
+    """
+    registry, skipped_documents = _load_bundle(
+        documents, resolver, limits, deadline, code_list_registry
+    )
+    model_elements: Dict[int, List[ModelElement]] = {}
+    skipped_definitions: Dict[int, List[str]] = {}
+    timed_out = False
+    for schema in registry.schemas:
+        model_elements[id(schema)] = []
+        skipped_definitions[id(schema)] = []
+        for root_path in schema.get_root_paths(root_selectors):
+            if not timed_out:
+                try:
+                    with _rollback_code_lists_on_error(schema):
+                        parsed_schema = json_schema_component_to_modelldcatno(
+                            schema, root_path
+                        )
+                    model_elements[id(schema)].extend(parsed_schema.model_elements)
+                    continue
+                except ConversionTimeoutError:
+                    timed_out = True
+            skipped_definitions[id(schema)].append(
+                f"{schema.base_uri}#{to_json_pointer(root_path)}"
+            )
+
+    # Orphans are collected after every document is converted, since converting
+    # a document can add orphans to the documents it references.
+    parsed_schemas = [
+        ParsedSchema(
+            model_elements.get(id(schema), []),
+            schema.orphan_elements,
+            skipped_definitions.get(id(schema), []),
+        )
+        for schema in registry.schemas
+    ]
+    if skipped_documents:
+        parsed_schemas.append(ParsedSchema(skipped_definitions=skipped_documents))
+    return parsed_schemas
+
+
+def _parse_roots(
+    schema: Schema, root_paths: List[List[str]]
+) -> List[Optional[ParsedSchema]]:
+    """Parse root elements until the deadline of the schema, None for skipped roots.
+
+    Flat schemas are parsed directly from their representation. Elements of a root
+    element interrupted by the deadline are discarded, along with the code lists it
+    registered.
+    """
+    parse_root = (
+        flat_component_to_modelldcatno
+        if is_flat_schema(schema, root_paths)
+        else json_schema_component_to_modelldcatno
+    )
+    parsed_roots: List[Optional[ParsedSchema]] = []
+    for root_path in root_paths:
+        try:
+            with _rollback_code_lists_on_error(schema):
+                parsed_roots.append(parse_root(schema, root_path))
+        except ConversionTimeoutError:
+            break
+    return [*parsed_roots, *[None] * (len(root_paths) - len(parsed_roots))]
+
+
+def _rollback_code_lists_on_error(schema: Schema) -> ContextManager[None]:
+    """Get context dropping code lists registered by an interrupted root element."""
+    registry = schema.code_list_registry
+    return registry.rollback_on_error() if registry is not None else nullcontext()
+
+
+def _merge_parsed_roots(
+    root_paths: List[List[str]],
+    parsed_roots: List[Optional[ParsedSchema]],
+    external_orphan_elements: List[Union[ModelElement, CodeElement]],
+) -> ParsedSchema:
+    """Merge parsed root elements in order, listing skipped roots."""
+    model_elements = []
+    orphan_elements = []
+    skipped_definitions = []
+    for root_path, parsed_schema in zip(root_paths, parsed_roots):
+        if parsed_schema is None:
+            skipped_definitions.append(to_json_pointer(root_path))
+        else:
+            model_elements.extend(parsed_schema.model_elements)
+            orphan_elements.extend(parsed_schema.orphan_elements)
+
+    return ParsedSchema(
+        model_elements,
+        [*orphan_elements, *external_orphan_elements],
+        skipped_definitions,
+    )
+
+
+_worker_arguments: Tuple[Any, ...] = ()
+
+
+def _initialize_worker(
+    shared_schema: SharedJsonSchema,
+    base_uri: str,
+    resolver: Optional[DocumentResolver],
+    limits: Optional[ResourceLimits],
+    deadline: Optional[float],
+) -> None:
+    """Keep shared schema and conversion arguments for the tasks of a worker."""
+    global _worker_arguments
+    _worker_arguments = (shared_schema, base_uri, resolver, limits, deadline)
+
+
+def _parse_root_group(
+    root_paths: List[List[str]],
+) -> Tuple[List[Optional[ParsedSchema]], List[Union[ModelElement, CodeElement]]]:
+    """Parse group of root elements, and orphans of documents they reference."""
+    shared_schema, base_uri, resolver, limits, deadline = _worker_arguments
+    registry = SchemaRegistry(resolver) if resolver else None
+    schema = Schema(
+        base_uri, shared_schema.load(limits), registry, limits=limits, deadline=deadline
+    )
+
+    parsed_group = _parse_roots(schema, root_paths)
+    return parsed_group, _get_external_orphan_elements(registry)
+
+
+def _get_external_orphan_elements(
+    registry: Optional[SchemaRegistry],
+) -> List[Union[ModelElement, CodeElement]]:
+    """Get orphans of external documents loaded into the registry of a schema."""
+    if registry is None:
+        return []
+    return [
+        orphan
+        for external in registry.schemas[1:]
+        for orphan in external.orphan_elements
+    ]
+
+
+def _get_deadline(time_budget: Optional[float]) -> Optional[float]:
+    """Get time.monotonic() value at which a time budget starting now runs out."""
+    return time.monotonic() + time_budget if time_budget is not None else None
+
+
+def _is_past_deadline(deadline: Optional[float]) -> bool:
+    """Check whether a deadline, as a time.monotonic() value, has passed."""
+    return deadline is not None and time.monotonic() > deadline
+
+
+def _match_skolem_parts(
+    statements: List[str], previous_statements: List[str]
+) -> Tuple[Set[str], Set[str]]:
+    """Get statements of parts equal in both lists apart from their skolem IRIs."""
+    previous_parts = _get_skolem_parts(previous_statements)
+    matched: Set[str] = set()
+    previous_matched: Set[str] = set()
+
+    for key, parts in _get_skolem_parts(statements).items():
+        for part, previous_part in zip(parts, previous_parts.get(key, [])):
+            matched.update(part)
+            previous_matched.update(previous_part)
+    return matched, previous_matched
+
+
+def _get_skolem_parts(
+    statements: Iterable[str],
+) -> Dict[FrozenSet[str], List[List[str]]]:
+    """Group statements connected by skolem IRIs, keyed by their canonical form."""
+    parents: Dict[str, str] = {}
+    statement_iris = []
+    for statement in statements:
+        first, *others = _SKOLEM_IRI.findall(statement)
+        parents.setdefault(first, first)
+        for other in others:
+            parents.setdefault(other, other)
+            parents[_find_part(parents, other)] = _find_part(parents, first)
+        statement_iris.append((statement, first))
+
+    parts: Dict[str, List[str]] = {}
+    for statement, iri in statement_iris:
+        parts.setdefault(_find_part(parents, iri), []).append(statement)
+
+    keyed_parts: Dict[FrozenSet[str], List[List[str]]] = {}
+    for part in parts.values():
+        keyed_parts.setdefault(_get_canonical_key(part), []).append(part)
+    return keyed_parts
+
+
+def _find_part(parents: Dict[str, str], iri: str) -> str:
+    """Find representative of part containing skolem IRI, compressing the path."""
+    part = iri
+    while parents[part] != part:
+        part = parents[part]
+    while parents[iri] != part:
+        parents[iri], iri = part, parents[iri]
+    return part
+
+
+def _get_canonical_key(statements: List[str]) -> FrozenSet[str]:
+    """Get statements with skolem IRIs replaced by canonically labeled blank nodes."""
+    labels: Dict[str, str] = {}
+    data = _SKOLEM_IRI.sub(
+        lambda match: labels.setdefault(match.group(), f"_:s{len(labels)}"),
+        "\n".join(statements),
+    )
+    graph = rdflib.Graph().parse(data=data, format="nt")
+    return frozenset(
+        " ".join(term.n3() for term in triple)
+        for triple in rdflib_compare.to_canonical_graph(graph)
+    )
+
+
+def _read_previous_statements(previous: Union[Graph, str]) -> Iterator[str]:
+    """Stream N-Triples statements of previous Graph or N-Triples file."""
+    if isinstance(previous, rdflib.Graph):
+        yield from graph_to_ntriples(previous)
+    else:
+        with open(previous, encoding="utf-8") as previous_file:
+            yield from read_ntriples(previous_file)
@@ -1,17 +1,38 @@
 """ParsedSchema module."""
-from typing import Iterator, List, Union
+from __future__ import annotations
 
-from attr import dataclass
-from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
+from typing import Callable, cast, Iterator, List, Tuple, TYPE_CHECKING, Union
+
+from attr import dataclass, Factory
+
+from jsonschematordf.serialization import dumps, loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
 
 
 @dataclass
 class ParsedSchema:
-    """A class representing the modelldcatno output of a parsed JSON Schema document."""
+    """A class representing the modelldcatno output of a parsed JSON Schema document.
+
+    If conversion ran out of time, the JSON Pointers of the root elements that were
+    not converted are listed as skipped definitions.
+    """
 
-    model_elements: List[ModelElement] = []
-    orphan_elements: List[Union[ModelElement, CodeElement]] = []
+    model_elements: List[ModelElement] = Factory(list)
+    orphan_elements: List[Union[ModelElement, CodeElement]] = Factory(list)
+    skipped_definitions: List[str] = Factory(list)
 
     def __iter__(self) -> Iterator:
         """Returns iterable of class attributes."""
         return iter((self.model_elements, self.orphan_elements))
+
+    def __reduce__(self) -> Tuple[Callable[[bytes], "ParsedSchema"], Tuple[bytes]]:
+        """Pickle ParsedSchema using the compact serialization format."""
+        return _load_parsed_schema, (dumps([*self, self.skipped_definitions]),)
+
+
+def _load_parsed_schema(data: bytes) -> ParsedSchema:
+    """Load ParsedSchema pickled using the compact serialization format."""
+    model_elements, orphan_elements, skipped_definitions = cast(list, loads(data))
+    return ParsedSchema(model_elements, orphan_elements, skipped_definitions)
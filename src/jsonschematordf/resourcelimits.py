@@ -0,0 +1,167 @@
+"""ResourceLimits module."""
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from attr import dataclass
+
+from jsonschematordf.exceptions import ResourceLimitError
+from jsonschematordf.lazyimport import lazy_import
+from jsonschematordf.lazyjson import Buffer, load_lazy_json
+
+yaml = lazy_import("yaml")
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits on the resources a JSON Schema document may use while converted.
+
+    Limits are enforced while the document is loaded and its components are built,
+    so hostile documents are rejected before they are expanded. Limits that are
+    None are not enforced.
+
+    Attributes:
+        max_bytes: Maximum size of the document in bytes.
+        max_alias_expansions: Maximum number of YAML nodes that aliases expand to.
+        max_depth: Maximum nesting depth of YAML nodes and components.
+        max_components: Maximum number of components built for a schema.
+    """
+
+    max_bytes: Optional[int] = None
+    max_alias_expansions: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_components: Optional[int] = None
+
+    def check_bytes(self, size: int) -> None:
+        """Raise ResourceLimitError if document size exceeds the limit."""
+        _check_limit("Document size", size, self.max_bytes)
+
+    def check_depth(self, depth: int) -> None:
+        """Raise ResourceLimitError if nesting depth exceeds the limit."""
+        _check_limit("Nesting depth", depth, self.max_depth)
+
+    def check_components(self, count: int) -> None:
+        """Raise ResourceLimitError if component count exceeds the limit."""
+        _check_limit("Component count", count, self.max_components)
+
+
+def load_json_schema_string(
+    json_schema_string: Union[str, bytes], limits: Optional[ResourceLimits] = None
+) -> object:
+    """Load JSON or YAML JSON Schema string, enforcing resource limits.
+
+    Args:
+        json_schema_string: A JSON or YAML JSON Schema string, or its bytes.
+        limits: Optional limits on document size, alias expansions and depth.
+
+    Returns:
+        The loaded document.
+
+    Raises:
+        ResourceLimitError: If the document exceeds the limits.
+    """
+    if limits is None:
+        return yaml.safe_load(json_schema_string)
+
+    if limits.max_bytes is not None:
+        limits.check_bytes(len(json_schema_string))
+        if isinstance(json_schema_string, str):
+            limits.check_bytes(len(json_schema_string.encode("utf-8")))
+
+    loader = _get_limited_loader_class()(json_schema_string, limits)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def load_json_schema_buffer(
+    buffer: Buffer, limits: Optional[ResourceLimits] = None
+) -> Optional[Mapping[str, Any]]:
+    """Load JSON Schema in buffer lazily as JSON, or else in full as YAML.
+
+    Args:
+        buffer: A JSON or YAML JSON Schema document, such as a memory-mapped file.
+        limits: Optional limits on document size, alias expansions and depth.
+
+    Returns:
+        The root object of the document, or None if it has no root object.
+
+    Raises:
+        ResourceLimitError: If the document exceeds the limits.
+    """
+    if limits is not None:
+        limits.check_bytes(len(buffer))
+
+    try:
+        root = load_lazy_json(buffer, limits)
+    except ResourceLimitError:
+        raise
+    except ValueError:
+        root = None
+    if root is not None:
+        return root
+
+    in_dict = load_json_schema_string(buffer[:], limits)
+    return in_dict if isinstance(in_dict, dict) else None
+
+
+def _check_limit(name: str, value: int, limit: Optional[int]) -> None:
+    """Raise ResourceLimitError if value exceeds limit."""
+    if limit is not None and value > limit:
+        raise ResourceLimitError(f"{name} {value} exceeds limit of {limit}")
+
+
+@lru_cache(maxsize=None)
+def _get_limited_loader_class() -> type:
+    """Create YAML loader class enforcing resource limits, importing yaml once."""
+
+    class LimitedSafeLoader(yaml.SafeLoader):
+        """Safe YAML loader counting nesting depth and nodes expanded by aliases.
+
+        The expanded size of every node is counted when it is composed, so aliases
+        are charged the full size of the node they repeat before it is constructed.
+        """
+
+        limits: ResourceLimits
+        _depth: int
+        _alias_expansions: int
+        _node_sizes: Dict[Any, int]
+
+        def __init__(self, stream: Union[str, bytes], limits: ResourceLimits) -> None:
+            """Constructor for LimitedSafeLoader object."""
+            super().__init__(stream)
+            self.limits = limits
+            self._depth = 0
+            self._alias_expansions = 0
+            self._node_sizes = {}
+
+        def compose_node(self, parent: object, index: object) -> object:
+            """Compose node, enforcing limits on depth and alias expansions."""
+            if self.check_event(yaml.AliasEvent):
+                node = super().compose_node(parent, index)
+                if node not in self._node_sizes:
+                    raise ResourceLimitError("Recursive YAML aliases are not allowed")
+                self._alias_expansions += self._node_sizes[node]
+                _check_limit(
+                    "Alias expansion count",
+                    self._alias_expansions,
+                    self.limits.max_alias_expansions,
+                )
+                return node
+
+            self._depth += 1
+            self.limits.check_depth(self._depth)
+            node = super().compose_node(parent, index)
+            self._depth -= 1
+
+            children: List[Any] = []
+            if isinstance(node, yaml.SequenceNode):
+                children = node.value
+            elif isinstance(node, yaml.MappingNode):
+                children = [child for pair in node.value for child in pair]
+            self._node_sizes[node] = 1 + sum(
+                self._node_sizes[child] for child in children
+            )
+            return node
+
+    return LimitedSafeLoader
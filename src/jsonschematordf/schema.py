@@ -1,15 +1,45 @@
 """Schema module."""
-import os
-from typing import Any, Dict, List, Optional, Union
+from __future__ import annotations
 
-from datacatalogtordf.uri import InvalidURIError, URI
-from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
-from skolemizer import Skolemizer
+from collections import deque
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING, Union
+from urllib.parse import urldefrag, urljoin
+import uuid
+import warnings
 
-from jsonschematordf.component import Component
+from jsonschematordf.codelistregistry import CodeListRegistry
+from jsonschematordf.component import AbstractComponent
 import jsonschematordf.componentfactory as component_factory
-from jsonschematordf.types.enums import RECURSIVE_CHARACTER
-from jsonschematordf.utils import nested_get
+from jsonschematordf.componenttable import ComponentTable
+from jsonschematordf.componentview import ComponentView
+from jsonschematordf.exceptions import ConversionTimeoutError, CyclicReferenceWarning
+from jsonschematordf.jsonpointerindex import JsonPointerIndex
+from jsonschematordf.lazyimport import lazy_import
+from jsonschematordf.lazyjson import materialize
+from jsonschematordf.resourcelimits import ResourceLimits
+from jsonschematordf.schemaregistry import SchemaRegistry
+from jsonschematordf.typeregistry import DEFAULT_TYPE_REGISTRY, TypeRegistry
+from jsonschematordf.types.enums import (
+    EXTERNAL_REFERENCE,
+    RECURSIVE_CHARACTER,
+    RECURSIVE_REFERENCE,
+)
+from jsonschematordf.utils import (
+    create_uri,
+    determine_reference_type,
+    find_references,
+    join_uri,
+    split_json_pointer,
+    split_reference,
+    to_json_pointer,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+    from modelldcatnotordf.modelldcatno import CodeElement, ModelElement, SimpleType
+
+datacatalogtordf = lazy_import("datacatalogtordf")
 
 
 class Schema:
@@ -18,42 +48,239 @@ class Schema:
     __slots__ = (
         "__base_uri",
         "__json_schema_representation",
+        "__json_pointer_index",
+        "__component_table",
+        "__component_rows",
+        "__reference_rows",
+        "__reference_types",
+        "__registry_references",
+        "__reference_targets",
         "__parsed_components_cache",
         "__orphans",
+        "__registry",
+        "__type_registry",
+        "__primitive_simple_types",
+        "__limits",
+        "__deadline",
+        "__code_list_registry",
     )
 
     __base_uri: URI
-    __json_schema_representation: Dict[str, Any]
+    __json_schema_representation: Mapping[str, Any]
+    __json_pointer_index: JsonPointerIndex
+    __component_table: ComponentTable
+    __component_rows: Dict[Tuple[str, ...], List[int]]
+    __reference_rows: Dict[str, int]
+    __reference_types: Dict[str, Optional[str]]
+    __registry_references: Dict[str, Tuple[Schema, int]]
+    __reference_targets: Dict[str, Optional[Tuple[Schema, str]]]
     __parsed_components_cache: Dict[str, URI]
     __orphans: List[Union[ModelElement, CodeElement]]
+    __registry: Optional[SchemaRegistry]
+    __type_registry: TypeRegistry
+    __primitive_simple_types: Dict[Tuple[str, Optional[str]], SimpleType]
+    __limits: Optional[ResourceLimits]
+    __deadline: Optional[float]
+    __code_list_registry: Optional[CodeListRegistry]
 
     def __init__(
-        self, base_uri: URI, json_schema_representation: Dict[str, Any]
+        self,
+        base_uri: URI,
+        json_schema_representation: Mapping[str, Any],
+        registry: Optional[SchemaRegistry] = None,
+        type_registry: TypeRegistry = DEFAULT_TYPE_REGISTRY,
+        limits: Optional[ResourceLimits] = None,
+        deadline: Optional[float] = None,
+        code_list_registry: Optional[CodeListRegistry] = None,
     ) -> None:
-        """Constructor for Schema object."""
-        self.__base_uri = URI(base_uri)
+        """Constructor for Schema object.
+
+        If resource limits are given, building more components, or more deeply
+        nested components, than allowed raises ResourceLimitError. If a deadline is
+        given, as a time.monotonic() value, converting components after it raises
+        ConversionTimeoutError. If a code list registry is given, code lists are
+        shared with the other schemas converted with the same registry.
+        """
+        self.__base_uri = create_uri(base_uri)
         self.__json_schema_representation = json_schema_representation
+        self.__json_pointer_index = JsonPointerIndex(json_schema_representation)
+        self.__component_table = ComponentTable()
+        self.__component_rows = {}
+        self.__reference_rows = {}
+        self.__reference_types = {}
+        self.__registry_references = {}
+        self.__reference_targets = {}
         self.__parsed_components_cache = {}
         self.__orphans = []
-        os.environ["skolemizer_baseurl"] = base_uri
+        self.__registry = registry
+        self.__type_registry = type_registry
+        self.__primitive_simple_types = {}
+        self.__limits = limits
+        self.__deadline = deadline
+        self.__code_list_registry = code_list_registry
+        if registry is not None:
+            registry.add_schema(self)
 
     @property
     def base_uri(self) -> str:
         """Getter for base URI."""
         return self.__base_uri
 
+    @property
+    def component_table(self) -> ComponentTable:
+        """Getter for table storing the components of the schema."""
+        return self.__component_table
+
+    @property
+    def type_registry(self) -> TypeRegistry:
+        """Getter for registry of primitive types and formats."""
+        return self.__type_registry
+
+    @property
+    def limits(self) -> Optional[ResourceLimits]:
+        """Getter for resource limits enforced while building components."""
+        return self.__limits
+
+    @property
+    def code_list_registry(self) -> Optional[CodeListRegistry]:
+        """Getter for registry of code lists shared across schemas."""
+        return self.__code_list_registry
+
     @property
     def orphan_elements(self) -> List[Union[ModelElement, CodeElement]]:
         """Getter for orphan elements."""
         return self.__orphans
 
-    def get_components_by_path(self, path: str) -> List[Component]:
-        """Attempt to get component by reference path."""
-        path_list = path.split("/")
-        return self.get_components_by_path_list(path_list)
+    def get_root_paths(
+        self, root_selectors: Optional[List[str]] = None
+    ) -> List[List[str]]:
+        """Get paths of root elements, optionally selected by container JSON Pointers.
+
+        Every member of the objects selected by the root selectors is a root element.
+        If no root selectors are given, every top-level member is a root element.
+        """
+        if root_selectors is None:
+            return [[key] for key in self.__json_schema_representation.keys()]
+
+        root_paths = []
+        for root_selector in root_selectors:
+            container_path = split_json_pointer(root_selector)
+            container = self.__json_pointer_index.get(container_path)
+            if isinstance(container, Mapping):
+                root_paths.extend([*container_path, key] for key in container.keys())
+        return root_paths
+
+    def get_reference_closure(self, paths: List[List[str]]) -> List[List[str]]:
+        """Get paths, followed by paths of all definitions they transitively reference.
+
+        Only references within the schema are followed.
+        """
+        closure: Dict[str, List[str]] = {}
+        queue = deque(paths)
+        while queue:
+            path = queue.popleft()
+            pointer = to_json_pointer(path)
+            if pointer in closure:
+                continue
+            closure[pointer] = path
+
+            for reference in find_references(self.__json_pointer_index.get(path)):
+                if determine_reference_type(reference) == RECURSIVE_REFERENCE:
+                    queue.append(split_reference(reference)[1:])
+
+        return list(closure.values())
+
+    def get_independent_root_groups(
+        self, root_paths: List[List[str]]
+    ) -> List[List[List[str]]]:
+        """Group root paths so that no two groups share any referenced definition.
 
-    def get_components_by_path_list(self, path_list: List[str]) -> List[Component]:
-        """Attempt to get component by reference path."""
+        Root elements are grouped by the connected components of the reference graph,
+        so each group can be converted separately from the others. References to
+        other documents connect their roots if the schema belongs to a registry.
+        Groups, and root paths within each group, keep the order of the root paths.
+        """
+        root_pointers = [to_json_pointer(path) for path in root_paths]
+        definitions = dict(zip(root_pointers, root_paths))
+        parents = {pointer: pointer for pointer in root_pointers}
+        queue = deque(definitions.items())
+        while queue:
+            pointer, path = queue.popleft()
+            for reference in find_references(self.__json_pointer_index.get(path)):
+                target_path = None
+                if determine_reference_type(reference) == RECURSIVE_REFERENCE:
+                    target_path = split_reference(reference)[1:]
+                    target = _get_owner_pointer(target_path, definitions)
+                elif self.__registry is not None:
+                    target = urldefrag(urljoin(self.base_uri, reference))[0]
+                else:
+                    continue
+
+                parents.setdefault(target, target)
+                parents[_find_group(parents, target)] = _find_group(parents, pointer)
+                if target_path is not None and target not in definitions:
+                    definitions[target] = target_path
+                    queue.append((target, target_path))
+
+        for pointer, path in definitions.items():
+            ancestor = _get_owner_pointer(path[:-1], definitions)
+            if ancestor in definitions:
+                parents[_find_group(parents, ancestor)] = _find_group(parents, pointer)
+
+        groups: Dict[str, List[List[str]]] = {}
+        for pointer, path in zip(root_pointers, root_paths):
+            groups.setdefault(_find_group(parents, pointer), []).append(path)
+        return list(groups.values())
+
+    def get_referenced_schema(self, reference: str) -> Optional[Tuple["Schema", str]]:
+        """Get schema in registry and local reference a reference points to."""
+        if self.__registry is None:
+            return None
+
+        if document := self.__registry.load_document(
+            self.base_uri, reference, self.__limits
+        ):
+            document_uri, json_schema_representation = document
+            Schema(
+                document_uri,
+                json_schema_representation,
+                self.__registry,
+                limits=self.__limits,
+                deadline=self.__deadline,
+                code_list_registry=self.__code_list_registry,
+            )
+
+        return self.__registry.resolve_reference(self.base_uri, reference)
+
+    def get_representation(self, path: List[str]) -> Optional[Any]:
+        """Get JSON Schema representation at path of unescaped reference tokens."""
+        return materialize(self.__json_pointer_index.get(path))
+
+    def get_components_by_path(self, path: str) -> List[AbstractComponent]:
+        """Attempt to get component by JSON Pointer reference path."""
+        return self.get_components_by_path_list(split_reference(path))
+
+    def get_components_by_path_list(
+        self, path_list: List[str]
+    ) -> List[AbstractComponent]:
+        """Attempt to get component by reference path.
+
+        Components are stored in the component table of the schema once per path,
+        and a new view of the stored components is returned on every call.
+        """
+        rows = self.__component_rows.get(tuple(path_list))
+        if rows is None:
+            rows = [
+                component.index
+                for component in self._create_components_by_path_list(path_list)
+            ]
+            self.__component_rows[tuple(path_list)] = rows
+        return [self.__component_table.get_component(row) for row in rows]
+
+    def _create_components_by_path_list(
+        self, path_list: List[str]
+    ) -> List[AbstractComponent]:
+        """Create components at reference path in component table."""
         if len(path_list) > 0:
             non_relative_path = (
                 path_list[1:] if path_list[0] == RECURSIVE_CHARACTER else path_list
@@ -61,27 +288,253 @@ class Schema:
             component_title = path_list[-1]
             path_without_title = path_list[:-1]
 
-            component_representation = nested_get(
-                self.__json_schema_representation, *non_relative_path
+            component_representation = (
+                materialize(self.__json_pointer_index.get(non_relative_path))
+                if len(non_relative_path) > 0
+                else None
             )
             if isinstance(component_representation, Dict):
                 return component_factory.create_components(
                     path_without_title,
                     {"title": component_title, **component_representation},
+                    self._add_component,
+                    self.__limits,
                 )
         return []
 
-    def add_parsed_component(self, component: Component) -> None:
+    def _add_component(self, path: List[str], **arguments: object) -> ComponentView:
+        """Add component to the component table, enforcing the component limit.
+
+        The depth limit is enforced by the component factory, before it creates the
+        child components.
+        """
+        if self.__limits is not None:
+            self.__limits.check_components(len(self.__component_table) + 1)
+        return self.__component_table.add_component(path, **arguments)  # type: ignore
+
+    def get_component_type(self, component: ComponentView) -> Optional[str]:
+        """Get type of component in the component table of the schema.
+
+        Components added to the table since the last call are classified in one
+        pass, resolving the references they contain through the reference index.
+        """
+        self.__component_table.classify(self, self.__type_registry)
+        return self.__component_table.get_component_type(component.index)
+
+    def get_reference_row(self, reference: str) -> Optional[int]:
+        """Get row of component a reference points to in the component table."""
+        self._index_reference(reference)
+        return self.__reference_rows.get(reference)
+
+    def get_reference_type(self, reference: str) -> Optional[str]:
+        """Get type of component a reference points to.
+
+        Only the referenced component, and the components it depends on, are
+        classified, so the types of references between schemas resolve without
+        classifying components depending on a type being determined.
+        """
+        self._index_reference(reference)
+        if reference in self.__reference_rows:
+            return self._get_row_type(self.__reference_rows[reference])
+        if reference in self.__registry_references:
+            registry_schema, row = self.__registry_references[reference]
+            return registry_schema._get_row_type(row)
+        return self.__reference_types.get(reference)
+
+    def get_reference_target(self, reference: str) -> Optional[Tuple[Schema, str]]:
+        """Get schema and reference of the component a reference finally points to.
+
+        References to components which are references themselves are followed until
+        a component which is not a reference, or an external reference. Every
+        reference on the way is resolved to the final target, so later lookups of
+        any of them are single dictionary accesses.
+
+        Returns:
+            The schema and local reference of the final target, the schema and
+            reference of an external final target, or None if the reference cannot
+            be resolved or leads back to itself.
+        """
+        if reference in self.__reference_targets:
+            return self.__reference_targets[reference]
+
+        chain = [(self, reference)]
+        visited = set()
+        target = self._normalize_reference(reference)
+        while target is not None:
+            target_schema, target_reference = target
+            if target_reference in target_schema.__reference_targets:
+                target = target_schema.__reference_targets[target_reference]
+                break
+            if determine_reference_type(target_reference) != RECURSIVE_REFERENCE:
+                break
+            if (id(target_schema), target_reference) in visited:
+                warnings.warn(
+                    f"Reference {reference} in {self.base_uri} references itself",
+                    CyclicReferenceWarning,
+                    stacklevel=2,
+                )
+                target = None
+                break
+            visited.add((id(target_schema), target_reference))
+            chain.append(target)
+
+            components = target_schema.get_components_by_path(target_reference)
+            if not components or not components[0].ref:
+                break
+            target = target_schema._normalize_reference(components[0].ref)
+
+        for chain_schema, chain_reference in chain:
+            chain_schema.__reference_targets[chain_reference] = target
+        return target
+
+    def _normalize_reference(self, reference: str) -> Optional[Tuple[Schema, str]]:
+        """Get schema and local reference of reference, or None if unresolvable."""
+        reference_type = determine_reference_type(reference)
+        if reference_type == RECURSIVE_REFERENCE:
+            return self, reference
+        if referenced_schema := self.get_referenced_schema(reference):
+            return referenced_schema
+        if reference_type == EXTERNAL_REFERENCE:
+            return self, reference
+        return None
+
+    def _get_row_type(self, row: int) -> Optional[str]:
+        """Get type of component row, classifying it and its dependencies only."""
+        self.__component_table.classify_row(row, self, self.__type_registry)
+        return self.__component_table.get_component_type(row)
+
+    def _index_reference(self, reference: str) -> None:
+        """Add referenced component row, or type, to the reference index."""
+        if (
+            reference in self.__reference_rows
+            or reference in self.__registry_references
+            or reference in self.__reference_types
+        ):
+            return
+
+        reference_type = determine_reference_type(reference)
+        if reference_type == RECURSIVE_REFERENCE:
+            components = self.get_components_by_path(reference)
+            if len(components) >= 1 and isinstance(components[0], ComponentView):
+                self.__reference_rows[reference] = components[0].index
+            else:
+                self.__reference_types[reference] = None
+        elif referenced_schema := self.get_referenced_schema(reference):
+            registry_schema, local_reference = referenced_schema
+            row = registry_schema.get_reference_row(local_reference)
+            if row is not None:
+                self.__registry_references[reference] = (registry_schema, row)
+            else:
+                self.__reference_types[reference] = None
+        elif reference_type == EXTERNAL_REFERENCE:
+            self.__reference_types[reference] = EXTERNAL_REFERENCE
+        else:
+            self.__reference_types[reference] = None
+
+    def invalidate(self, pointer: str) -> List[str]:
+        """Drop cached components of an edited subtree, and of components using it.
+
+        The document is indexed again below the JSON Pointer. Components at paths
+        overlapping the subtree, and components transitively referencing them, are
+        created and converted anew on their next use. References from other schemas
+        in the registry are not followed.
+
+        Args:
+            pointer: JSON Pointer to the edited subtree of the document.
+
+        Returns:
+            Complete paths of the components whose conversions were dropped.
+        """
+        path = split_json_pointer(pointer)
+        self.__json_pointer_index.invalidate(path)
+
+        component_paths = {
+            key: list(key[1:] if key and key[0] == RECURSIVE_CHARACTER else key)
+            for key in self.__component_rows
+        }
+        reference_paths = {
+            key: [
+                split_reference(reference)[1:]
+                for reference in find_references(
+                    self.__json_pointer_index.get(component_path)
+                )
+                if determine_reference_type(reference) == RECURSIVE_REFERENCE
+            ]
+            for key, component_path in component_paths.items()
+        }
+        invalidated_paths = [path]
+        invalidated_keys = set()
+        changed = True
+        while changed:
+            changed = False
+            for key, component_path in component_paths.items():
+                if key not in invalidated_keys and any(
+                    _overlaps(used_path, invalidated_path)
+                    for used_path in (component_path, *reference_paths[key])
+                    for invalidated_path in invalidated_paths
+                ):
+                    invalidated_keys.add(key)
+                    invalidated_paths.append(component_path)
+                    changed = True
+
+        complete_paths = {
+            self.__component_table.get_component(row).complete_path
+            for key in invalidated_keys
+            for row in self.__component_rows.pop(key)
+        }
+        prefixes = tuple(
+            f"{to_json_pointer(invalidated_path)}{separator}"
+            for invalidated_path in invalidated_paths
+            for separator in ("/", "#")
+        )
+        dropped_paths = [
+            complete_path
+            for complete_path in self.__parsed_components_cache
+            if complete_path in complete_paths or complete_path.startswith(prefixes)
+        ]
+        for complete_path in dropped_paths:
+            del self.__parsed_components_cache[complete_path]
+
+        self.__reference_rows.clear()
+        self.__reference_types.clear()
+        self.__registry_references.clear()
+        self.__reference_targets.clear()
+        return dropped_paths
+
+    def check_deadline(self) -> None:
+        """Raise ConversionTimeoutError if the deadline of the schema has passed."""
+        if self.__deadline is not None and time.monotonic() > self.__deadline:
+            raise ConversionTimeoutError(f"Conversion of {self.base_uri} timed out")
+
+    def add_parsed_component(self, component: AbstractComponent) -> None:
         """Add a modelldcatno component or URI to parsed components cache."""
         if component.complete_path:
-            self.__parsed_components_cache[component.complete_path] = URI(
-                component.identifier
-            )
+            self.add_parsed_identifier(component.complete_path, component.identifier)
+
+    def add_parsed_identifier(self, complete_path: str, identifier: str) -> None:
+        """Add identifier of component parsed at complete path to the cache."""
+        self.__parsed_components_cache[complete_path] = create_uri(identifier)
 
     def get_parsed_component_uri(self, path: Optional[str]) -> Optional[URI]:
         """Get a modelldcatno component or URI from parsed components cache."""
         return self.__parsed_components_cache.get(path) if path else None
 
+    def get_primitive_simple_type(
+        self, title: str, type_definition_reference: Optional[str]
+    ) -> Optional[SimpleType]:
+        """Get shared primitive simple type created for title and type reference."""
+        return self.__primitive_simple_types.get((title, type_definition_reference))
+
+    def add_primitive_simple_type(
+        self, simple_type: SimpleType, type_definition_reference: Optional[str]
+    ) -> None:
+        """Add primitive simple type to be shared by all components using it."""
+        title = simple_type.title.get(None) if simple_type.title else None
+        if title:
+            self.__primitive_simple_types[
+                (title, type_definition_reference)
+            ] = simple_type
+
     def add_orphan_elements(
         self, orphans: List[Union[ModelElement, CodeElement]]
     ) -> None:
@@ -91,10 +544,46 @@ class Schema:
     def create_identifier(self, component_path: Optional[str]) -> URI:
         """Create identifier for component."""
         if component_path:
-            try:
-                component_uri = self.base_uri + component_path
-                return URI(component_uri)
-            except InvalidURIError:
-                pass
+            component_uri = join_uri(self.base_uri, component_path)
+            if component_uri is not None:
+                return component_uri
+
+        return self.create_skolemization()
+
+    def create_skolemization(self) -> URI:
+        """Create skolemized identifier under the base URI of the schema.
+
+        Identifiers are minted in the form used by skolemizer, without registering
+        them globally. Every identifier is unique, so its validation is not cached.
+        """
+        skolem_base_uri = (
+            self.base_uri if self.base_uri.endswith("/") else f"{self.base_uri}/"
+        )
+        return datacatalogtordf.URI(
+            f"{skolem_base_uri}.well-known/skolem/{uuid.uuid4()}"
+        )
+
+
+def _overlaps(path: List[str], other_path: List[str]) -> bool:
+    """Whether one of two paths contains the other."""
+    length = min(len(path), len(other_path))
+    return path[:length] == other_path[:length]
+
+
+def _get_owner_pointer(path: List[str], definitions: Dict[str, List[str]]) -> str:
+    """Get pointer of outermost definition containing path, or of path itself."""
+    for length in range(1, len(path) + 1):
+        pointer = to_json_pointer(path[:length])
+        if pointer in definitions:
+            return pointer
+    return to_json_pointer(path)
+
 
-        return Skolemizer.add_skolemization()
+def _find_group(parents: Dict[str, str], pointer: str) -> str:
+    """Find representative of group containing pointer, compressing the path."""
+    group = pointer
+    while parents[group] != group:
+        group = parents[group]
+    while parents[pointer] != group:
+        parents[pointer], pointer = group, parents[pointer]
+    return group
@@ -0,0 +1,70 @@
+"""SchemaRegistry module."""
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urldefrag, urljoin
+
+from jsonschematordf.documentresolver import DocumentResolver
+from jsonschematordf.resourcelimits import ResourceLimits
+from jsonschematordf.types.enums import RECURSIVE_CHARACTER
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jsonschematordf.schema import Schema
+
+
+class SchemaRegistry:
+    """Utility class for managing a bundle of schemas referencing each other."""
+
+    __slots__ = ("__schemas", "__resolver")
+
+    __schemas: Dict[str, "Schema"]
+    __resolver: Optional[DocumentResolver]
+
+    def __init__(self, resolver: Optional[DocumentResolver] = None) -> None:
+        """Constructor for SchemaRegistry object."""
+        self.__schemas = {}
+        self.__resolver = resolver
+
+    @property
+    def schemas(self) -> List["Schema"]:
+        """Getter for registered schemas."""
+        return list(self.__schemas.values())
+
+    def add_schema(self, schema: "Schema") -> None:
+        """Register schema by its base URI."""
+        self.__schemas[_document_uri(schema.base_uri)] = schema
+
+    def get_schema(self, document_uri: str) -> Optional["Schema"]:
+        """Get registered schema by document URI."""
+        return self.__schemas.get(_document_uri(document_uri))
+
+    def resolve_reference(
+        self, base_uri: str, reference: str
+    ) -> Optional[Tuple["Schema", str]]:
+        """Resolve reference relative to base URI to schema and local reference."""
+        document_uri, fragment = urldefrag(urljoin(base_uri, reference))
+        if not fragment:
+            return None
+
+        schema = self.get_schema(document_uri)
+        if schema is None:
+            return None
+
+        return schema, RECURSIVE_CHARACTER + fragment
+
+    def load_document(
+        self, base_uri: str, reference: str, limits: Optional[ResourceLimits] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Load unregistered document a reference points to using the resolver.
+
+        Documents exceeding the resource limits raise ResourceLimitError.
+        """
+        document_uri, fragment = urldefrag(urljoin(base_uri, reference))
+        if not fragment or self.__resolver is None or self.get_schema(document_uri):
+            return None
+
+        document = self.__resolver.resolve(document_uri, limits)
+        return (document_uri, document) if document is not None else None
+
+
+def _document_uri(uri: str) -> str:
+    """Strip fragment from URI."""
+    return urldefrag(uri)[0]
@@ -0,0 +1,107 @@
+"""SchemaSession module."""
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional, Set, TYPE_CHECKING, Union
+
+from jsonschematordf.documentresolver import DocumentResolver
+from jsonschematordf.parse import json_schema_component_to_modelldcatno
+from jsonschematordf.parsedschema import ParsedSchema
+from jsonschematordf.schema import Schema
+from jsonschematordf.schemaregistry import SchemaRegistry
+from jsonschematordf.typeregistry import DEFAULT_TYPE_REGISTRY, TypeRegistry
+from jsonschematordf.utils import split_json_pointer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
+
+
+class SchemaSession:
+    """A long-lived conversion session for repeated queries on the same document.
+
+    The session keeps one Schema, so the document index, components, types and
+    conversions stay cached between queries. Every query only returns the elements
+    not returned by an earlier query. When the document is edited in place, the
+    edited subtree is invalidated, and the elements depending on it are converted
+    and returned anew by the next query using them.
+    """
+
+    __slots__ = ("__schema", "__returned_identifiers")
+
+    __schema: Schema
+    __returned_identifiers: Set[str]
+
+    def __init__(
+        self,
+        base_uri: str,
+        json_schema_representation: Mapping[str, Any],
+        resolver: Optional[DocumentResolver] = None,
+        type_registry: TypeRegistry = DEFAULT_TYPE_REGISTRY,
+    ) -> None:
+        """Constructor for SchemaSession object.
+
+        Args:
+            base_uri: Base URI of the schema.
+            json_schema_representation: The JSON Schema document.
+            resolver: Optional resolver loading externally referenced documents.
+            type_registry: Registry of primitive types and formats.
+        """
+        registry = SchemaRegistry(resolver) if resolver else None
+        self.__schema = Schema(
+            base_uri, json_schema_representation, registry, type_registry
+        )
+        self.__returned_identifiers = set()
+
+    @property
+    def schema(self) -> Schema:
+        """Getter for the schema of the session."""
+        return self.__schema
+
+    def to_modelldcatno(self, pointer: str) -> ParsedSchema:
+        """Parse component to modelldcatno, returning only elements not returned yet.
+
+        Args:
+            pointer: JSON Pointer to the component.
+
+        Returns:
+            A ParsedSchema object containing the new modelldcatno ModelElements and
+            orphaned elements.
+
+        Example:
+        >>> from jsonschematordf.schemasession import SchemaSession
+        >>> session = SchemaSession("http://uri.com", {"Element": {"type": "object"}})
+        >>> model_elements, orphan_elements = session.to_modelldcatno("/Element")
+        """
+        parsed_schema = json_schema_component_to_modelldcatno(
+            self.__schema, split_json_pointer(pointer)
+        )
+        return ParsedSchema(
+            [
+                element
+                for element in parsed_schema.model_elements
+                if self._is_new(element)
+            ],
+            [
+                element
+                for element in parsed_schema.orphan_elements
+                if self._is_new(element)
+            ],
+        )
+
+    def invalidate(self, pointer: str) -> None:
+        """Invalidate subtree of the document after editing it in place.
+
+        Args:
+            pointer: JSON Pointer to the edited subtree.
+        """
+        for complete_path in self.__schema.invalidate(pointer):
+            self.__returned_identifiers.discard(self.__schema.base_uri + complete_path)
+
+    def _is_new(self, element: Union[ModelElement, CodeElement, str]) -> bool:
+        """Whether element is not returned yet, marking it as returned."""
+        if isinstance(element, str):
+            return False
+        if element.identifier is not None:
+            if element.identifier in self.__returned_identifiers:
+                return False
+            self.__returned_identifiers.add(element.identifier)
+        return True
@@ -0,0 +1,189 @@
+"""Serialization module.
+
+Serializes Component trees and modelldcatno elements to a compact, versioned binary
+format. Objects are flattened into a table of their slot values, so shared and
+nested objects are stored once, and cached RDF graphs held by modelldcatno elements
+are left out. Objects with a detach method, such as views, are serialized as the
+object it returns. The format is meant for process pools and local caches, and must not
+be used to load data from untrusted sources.
+"""
+from functools import lru_cache
+from importlib import import_module
+import marshal
+import struct
+from typing import Any, cast, Dict, List, Tuple, Union
+
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct(">4sHH")
+_MAGIC = b"JSRD"
+_TYPED_STRING = 0
+_OBJECT = 1
+_SERIALIZABLE_MODULES = (
+    "datacatalogtordf.uri",
+    "jsonschematordf.component",
+    "modelldcatnotordf.modelldcatno",
+    "rdflib.term",
+)
+_SKIPPED_SLOTS = ("_g", "g")
+
+_EncodedValue = Union[None, bool, int, float, str, List, Dict, Tuple]
+
+
+def dumps(value: object) -> bytes:
+    """Serialize value containing Components and modelldcatno elements to bytes.
+
+    Args:
+        value: Lists, dicts and scalars, Components, and modelldcatno elements.
+
+    Returns:
+        The serialized value, prefixed by the format version.
+
+    Raises:
+        TypeError: If value contains objects that cannot be serialized.
+    """
+    encoder = _Encoder()
+    encoded_value = encoder.encode(value)
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, marshal.version)
+    return header + marshal.dumps((encoder.classes, encoder.objects, encoded_value))
+
+
+def loads(data: bytes) -> object:
+    """Deserialize value serialized by dumps.
+
+    Args:
+        data: Bytes created by dumps.
+
+    Returns:
+        The deserialized value.
+
+    Raises:
+        ValueError: If data is not serialized in the current format version.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Data is not serialized by jsonschematordf")
+
+    magic, format_version, marshal_version = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Data is not serialized by jsonschematordf")
+    if (format_version, marshal_version) != (FORMAT_VERSION, marshal.version):
+        raise ValueError(f"Unsupported serialization format version {format_version}")
+
+    class_names, objects, encoded_value = marshal.loads(data[_HEADER.size :])
+    return _Decoder(class_names, objects).decode(encoded_value)
+
+
+class _Encoder:
+    """Flattens objects into a table of classes and slot values."""
+
+    __slots__ = ("classes", "objects", "_class_indices", "_object_indices")
+
+    classes: List[str]
+    objects: List[Tuple[int, Dict[str, Any]]]
+    _class_indices: Dict[type, int]
+    _object_indices: Dict[int, int]
+
+    def __init__(self) -> None:
+        """Constructor for _Encoder object."""
+        self.classes = []
+        self.objects = []
+        self._class_indices = {}
+        self._object_indices = {}
+
+    def encode(self, value: object) -> _EncodedValue:
+        """Encode value as marshallable value, referencing objects by index."""
+        value_type = type(value)
+        if value is None or value_type in (bool, int, float, str):
+            return cast(_EncodedValue, value)
+        if type(value) is list:
+            return [self.encode(item) for item in value]
+        if type(value) is dict:
+            return {self.encode(key): self.encode(item) for key, item in value.items()}
+        if isinstance(value, str):
+            return (_TYPED_STRING, self._encode_class(value_type), str(value))
+        if hasattr(value, "detach"):
+            return self.encode(value.detach())
+        return (_OBJECT, self._encode_object(value))
+
+    def _encode_class(self, value_type: type) -> int:
+        """Get index of class in class table."""
+        if value_type not in self._class_indices:
+            if value_type.__module__ not in _SERIALIZABLE_MODULES:
+                raise TypeError(f"Cannot serialize object of type {value_type}")
+            self._class_indices[value_type] = len(self.classes)
+            self.classes.append(f"{value_type.__module__}:{value_type.__qualname__}")
+        return self._class_indices[value_type]
+
+    def _encode_object(self, value: object) -> int:
+        """Get index of object in object table, adding it on first encounter."""
+        if id(value) not in self._object_indices:
+            index = len(self.objects)
+            self._object_indices[id(value)] = index
+            slot_values: Dict[str, Any] = {}
+            self.objects.append((self._encode_class(type(value)), slot_values))
+            for slot in _get_slots(type(value)):
+                if hasattr(value, slot):
+                    slot_values[slot] = self.encode(getattr(value, slot))
+        return self._object_indices[id(value)]
+
+
+class _Decoder:
+    """Restores objects from a table of classes and slot values."""
+
+    __slots__ = ("_classes", "_encoded_objects", "_objects")
+
+    _classes: List[type]
+    _encoded_objects: List[Tuple[int, Dict[str, Any]]]
+    _objects: Dict[int, Any]
+
+    def __init__(
+        self, class_names: List[str], objects: List[Tuple[int, Dict[str, Any]]]
+    ) -> None:
+        """Constructor for _Decoder object."""
+        self._classes = [_import_class(class_name) for class_name in class_names]
+        self._encoded_objects = objects
+        self._objects = {}
+
+    def decode(self, value: object) -> object:
+        """Decode marshalled value, restoring referenced objects."""
+        if type(value) is list:
+            return [self.decode(item) for item in value]
+        if type(value) is dict:
+            return {self.decode(key): self.decode(item) for key, item in value.items()}
+        if type(value) is tuple:
+            if value[0] == _TYPED_STRING:
+                string_type = self._classes[value[1]]
+                return string_type.__new__(string_type, value[2])
+            return self._decode_object(value[1])
+        return value
+
+    def _decode_object(self, index: int) -> object:
+        """Get object by index in object table, creating it on first reference."""
+        if index not in self._objects:
+            class_index, slot_values = self._encoded_objects[index]
+            object_type = self._classes[class_index]
+            restored = object_type.__new__(object_type)
+            self._objects[index] = restored
+            for slot, slot_value in slot_values.items():
+                object.__setattr__(restored, slot, self.decode(slot_value))
+        return self._objects[index]
+
+
+@lru_cache(maxsize=None)
+def _get_slots(object_type: type) -> Tuple[str, ...]:
+    """Get slots of class and its base classes, excluding cached graphs."""
+    slots = []
+    for base in reversed(object_type.__mro__):
+        base_slots = base.__dict__.get("__slots__", ())
+        for slot in (base_slots,) if isinstance(base_slots, str) else base_slots:
+            if slot not in _SKIPPED_SLOTS and slot not in slots:
+                slots.append(slot)
+    return tuple(slots)
+
+
+def _import_class(class_name: str) -> type:
+    """Import serializable class by module and qualified name."""
+    module_name, qualified_name = class_name.split(":")
+    if module_name not in _SERIALIZABLE_MODULES:
+        raise ValueError(f"Cannot deserialize object of type {class_name}")
+    return getattr(import_module(module_name), qualified_name)
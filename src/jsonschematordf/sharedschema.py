@@ -0,0 +1,116 @@
+"""SharedSchema module."""
+from mmap import ACCESS_READ, mmap
+import os
+from tempfile import mkstemp
+from typing import Any, BinaryIO, Mapping, Optional, Tuple, Type, Union
+
+from jsonschematordf.resourcelimits import load_json_schema_buffer, ResourceLimits
+
+
+class SharedJsonSchema:
+    """A JSON Schema document shared read-only between processes.
+
+    The document is written once to a file which every process memory-maps, so the
+    operating system shares the same pages between all processes. Pickling only
+    transfers the file path. Each process navigates JSON documents lazily, and
+    loads other documents as YAML from the original source.
+    """
+
+    __slots__ = ("_file_path", "_owner", "_file", "_buffer", "_root")
+
+    _file_path: str
+    _owner: bool
+    _file: Optional[BinaryIO]
+    _buffer: Optional[mmap]
+    _root: Optional[Mapping[str, Any]]
+
+    def __init__(self, file_path: str, owner: bool = False) -> None:
+        """Constructor for SharedJsonSchema object.
+
+        The owner removes the file when the shared schema is closed.
+        """
+        self._file_path = file_path
+        self._owner = owner
+        self._file = None
+        self._buffer = None
+        self._root = None
+
+    def __reduce__(self) -> Tuple[Type["SharedJsonSchema"], Tuple[str]]:
+        """Pickle shared schema by file path, attaching without ownership."""
+        return SharedJsonSchema, (self._file_path,)
+
+    def __enter__(self) -> "SharedJsonSchema":
+        """Enter context managing the shared schema."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close shared schema when exiting context."""
+        self.close()
+
+    @property
+    def file_path(self) -> str:
+        """Getter for path of the shared file."""
+        return self._file_path
+
+    def load(
+        self, limits: Optional[ResourceLimits] = None
+    ) -> Optional[Mapping[str, Any]]:
+        """Get root object of the shared document, mapping it on first use.
+
+        JSON documents are navigated lazily, and other documents are loaded as YAML.
+        Documents without a root object load as None. Resource limits are enforced
+        when the document is first loaded.
+
+        Raises:
+            ResourceLimitError: If the document exceeds the resource limits.
+        """
+        if self._file is None:
+            self._file = open(self._file_path, "rb")
+            if os.fstat(self._file.fileno()).st_size > 0:
+                self._buffer = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+                self._root = load_json_schema_buffer(self._buffer, limits)
+        return self._root
+
+    def close(self) -> None:
+        """Unmap the shared document, and remove the file if owned."""
+        self._root = None
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._owner and os.path.exists(self._file_path):
+            os.remove(self._file_path)
+
+
+def share_json_schema(
+    json_schema_string: Union[str, bytes], directory: Optional[str] = None
+) -> SharedJsonSchema:
+    """Write JSON Schema to a file to be shared read-only between processes.
+
+    The source is shared as is, so YAML documents, whose values and keys may not be
+    representable in JSON, are loaded by every process from the original source.
+
+    Args:
+        json_schema_string: A valid JSON or YAML JSON Schema string, or its bytes.
+        directory: Optional directory of the shared file, e.g. /dev/shm.
+
+    Returns:
+        A SharedJsonSchema owning the shared file.
+
+    Example:
+    >>> from jsonschematordf.sharedschema import share_json_schema
+    >>> with share_json_schema("{ 'Element': { 'type': 'object' } }") as shared:
+        ... schema = Schema("http://uri.com", shared.load())
+    """
+    document = (
+        json_schema_string.encode("utf-8")
+        if isinstance(json_schema_string, str)
+        else json_schema_string
+    )
+    file_descriptor, file_path = mkstemp(suffix=".json", dir=directory)
+    with os.fdopen(file_descriptor, "wb") as shared_file:
+        shared_file.write(document)
+
+    return SharedJsonSchema(file_path, owner=True)
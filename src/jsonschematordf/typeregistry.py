@@ -0,0 +1,69 @@
+"""TypeRegistry module."""
+from typing import Dict, Mapping, Optional
+
+from jsonschematordf.types.constants import FORMAT_TYPES, TYPE_DEFINITION_REFERENCE
+
+
+class TypeRegistry:
+    """Registry of primitive JSON Schema types and formats.
+
+    Every registered type has a type definition reference, and every registered
+    format belongs to a registered type. Components with a registered type, or a
+    registered format and no type, are primitive simple types.
+
+    Format lookups are compiled to type definition references when registered, so
+    looking up a component is a single dictionary access.
+    """
+
+    __slots__ = ("_type_references", "_format_types", "_format_references")
+
+    _type_references: Dict[str, str]
+    _format_types: Dict[str, str]
+    _format_references: Dict[str, str]
+
+    def __init__(
+        self,
+        type_references: Mapping[str, str] = TYPE_DEFINITION_REFERENCE,
+        format_types: Mapping[str, str] = FORMAT_TYPES,
+    ) -> None:
+        """Constructor for TypeRegistry object."""
+        self._type_references = {}
+        self._format_types = {}
+        self._format_references = {}
+        for type_name, reference in type_references.items():
+            self.register_type(type_name, reference)
+        for format_name, type_name in format_types.items():
+            self.register_format(format_name, type_name)
+
+    def register_type(self, type_name: str, reference: str) -> None:
+        """Register primitive type by its type definition reference."""
+        self._type_references[type_name] = reference
+        for format_name, format_type in self._format_types.items():
+            if format_type == type_name:
+                self._format_references[format_name] = reference
+
+    def register_format(self, format_name: str, type_name: str) -> None:
+        """Register format of registered primitive type.
+
+        Raises:
+            ValueError: If the type is not registered.
+        """
+        if type_name not in self._type_references:
+            raise ValueError(f"Type {type_name} of format {format_name} is unknown")
+        self._format_types[format_name] = type_name
+        self._format_references[format_name] = self._type_references[type_name]
+
+    def is_primitive(self, type: object, format: object = None) -> bool:
+        """Whether a component of type and format is a primitive simple type."""
+        return self.get_type_definition_reference(type, format) is not None
+
+    def get_type_definition_reference(
+        self, type: object, format: object = None
+    ) -> Optional[str]:
+        """Get type definition reference of type, or of format if type is missing."""
+        if type is not None:
+            return self._type_references.get(type) if isinstance(type, str) else None
+        return self._format_references.get(format) if isinstance(format, str) else None
+
+
+DEFAULT_TYPE_REGISTRY = TypeRegistry()
@@ -1,5 +1,9 @@
 """Constants module."""
 
+DEFS_ROOT_SELECTOR = "/$defs"
+DEFINITIONS_ROOT_SELECTOR = "/definitions"
+OPENAPI_ROOT_SELECTOR = "/components/schemas"
+
 TYPE_DEFINITION_REFERENCE = {
     "string": "https://www.w3.org/2019/wot/json-schema#stringschema",
     "boolean": "https://www.w3.org/2019/wot/json-schema#booleanschema",
@@ -7,3 +11,19 @@ TYPE_DEFINITION_REFERENCE = {
     "int32": "https://www.w3.org/2019/wot/json-schema#integerschema",
     "integer": "https://www.w3.org/2019/wot/json-schema#integerschema",
 }
+
+FORMAT_TYPES = {
+    "date": "string",
+    "date-time": "string",
+    "time": "string",
+    "duration": "string",
+    "email": "string",
+    "uri": "string",
+    "uri-reference": "string",
+    "uuid": "string",
+    "byte": "string",
+    "int32": "integer",
+    "int64": "integer",
+    "float": "number",
+    "double": "number",
+}
@@ -1,17 +1,40 @@
 """Utility functions module."""
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from __future__ import annotations
 
-from datacatalogtordf.uri import InvalidURIError, URI
-from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
-from rdflib.graph import Graph
+from copy import deepcopy
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Union,
+)
+from urllib.parse import unquote
 
+from jsonschematordf.lazyimport import lazy_import
 from jsonschematordf.types.enums import (
     EXTERNAL_REFERENCE,
     RECURSIVE_CHARACTER,
     RECURSIVE_REFERENCE,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from datacatalogtordf.uri import URI
+    from modelldcatnotordf.modelldcatno import CodeElement, ModelElement
+    from rdflib.graph import Graph
+
+datacatalogtordf = lazy_import("datacatalogtordf")
+modelldcatno = lazy_import("modelldcatnotordf.modelldcatno")
+rdflib = lazy_import("rdflib")
+
+URI_CACHE_SIZE = 4096
+
 
 def nested_get(dictionary: Dict, *keys: str) -> Optional[Any]:
     """Get nested object from dict."""
@@ -29,14 +52,97 @@ def determine_reference_type(reference: Optional[str]) -> Optional[str]:
         if reference.startswith(RECURSIVE_CHARACTER):
             return RECURSIVE_REFERENCE
         if reference.startswith("http"):
-            try:
-                URI(reference)
-                return EXTERNAL_REFERENCE
-            except InvalidURIError:
-                return None
+            return EXTERNAL_REFERENCE if validate_uri(reference) is not None else None
     return None
 
 
+def create_uri(value: str) -> URI:
+    """Create URI of string, reusing strings that are URIs already.
+
+    Raises:
+        InvalidURIError: If the string is not a valid URI.
+    """
+    return (
+        value
+        if isinstance(value, datacatalogtordf.URI)
+        else datacatalogtordf.URI(value)
+    )
+
+
+def join_uri(uri: URI, suffix: str) -> Optional[URI]:
+    """Join URI and suffix, or get None if the joined string is not a valid URI.
+
+    Joined URIs start with the base URI of the document, so they are validated
+    without caching, leaving the cache of validate_uri to strings shared between
+    documents.
+    """
+    return _create_valid_uri(uri + suffix)
+
+
+@lru_cache(maxsize=URI_CACHE_SIZE)
+def validate_uri(value: str) -> Optional[URI]:
+    """Get URI of string, or None if it is not a valid URI.
+
+    The results of the most recently validated strings are cached, as the same
+    identifiers and references are validated again and again.
+    """
+    return _create_valid_uri(value)
+
+
+def _create_valid_uri(value: str) -> Optional[URI]:
+    """Create URI of string, or get None if it is not a valid URI."""
+    try:
+        return datacatalogtordf.URI(value)
+    except datacatalogtordf.InvalidURIError:
+        return None
+
+
+def escape_json_pointer_token(token: str) -> str:
+    """Escape reference token for use in JSON Pointer according to RFC 6901."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_json_pointer_token(token: str) -> str:
+    """Unescape JSON Pointer reference token according to RFC 6901."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def to_json_pointer(path: List[str]) -> str:
+    """Create JSON Pointer from path list of unescaped reference tokens."""
+    return "".join("/" + escape_json_pointer_token(token) for token in path)
+
+
+def split_json_pointer(pointer: str) -> List[str]:
+    """Split JSON Pointer into path of unescaped reference tokens."""
+    return [unescape_json_pointer_token(token) for token in pointer.split("/")[1:]]
+
+
+def split_reference(reference: str) -> List[str]:
+    """Split URI fragment JSON Pointer reference into path of unescaped tokens."""
+    return [
+        unescape_json_pointer_token(token) for token in unquote(reference).split("/")
+    ]
+
+
+def find_references(node: object) -> Iterator[str]:
+    """Find all $ref strings in node and its descendants, visiting each node once."""
+    visited = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+
+        if isinstance(current, Mapping):
+            reference = current.get("$ref")
+            if isinstance(reference, str):
+                yield reference
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
 def add_to_path(path: List[str], to_add: Optional[str]) -> List[str]:
     """Adds postfix to path list if exists, else returns empty path."""
     if to_add:
@@ -48,10 +154,52 @@ def add_to_path(path: List[str], to_add: Optional[str]) -> List[str]:
 def add_elements_to_graph(
     graph: Graph, elements: List[Union[ModelElement, CodeElement]]
 ) -> Graph:
-    """Get Graph containing all elements."""
+    """Get Graph containing all elements.
+
+    Element objects occurring more than once, such as shared primitive simple types,
+    are serialized once. Distinct elements are all added, so the triples of elements
+    sharing an identifier are merged. The elements are serialized to N-Triples and
+    parsed in one pass, binding the prefixes of the vocabularies of modelldcatno.
+    """
     out_graph = deepcopy(graph)
+    added_elements: Set[int] = set()
+    ntriples = []
     for element in elements:
-        if isinstance(element, ModelElement) or isinstance(element, CodeElement):
-            out_graph.parse(data=element.to_rdf(format="turtle"), format="turtle")
+        if (
+            isinstance(element, (modelldcatno.ModelElement, modelldcatno.CodeElement))
+            and id(element) not in added_elements
+        ):
+            added_elements.add(id(element))
+            ntriples.append(element.to_rdf(format="nt", encoding=None))
 
+    if ntriples:
+        for prefix, namespace in [
+            ("modelldcatno", modelldcatno.MODELLDCATNO),
+            ("dcat", modelldcatno.DCAT),
+            ("dct", rdflib.namespace.DCTERMS),
+            ("foaf", rdflib.namespace.FOAF),
+            ("rdfs", rdflib.namespace.RDFS),
+            ("skos", rdflib.namespace.SKOS),
+            ("xsd", rdflib.namespace.XSD),
+        ]:
+            out_graph.bind(prefix, namespace)
+        out_graph.parse(data=b"\n".join(ntriples), format="nt")
     return out_graph
+
+
+def graph_to_ntriples(graph: Graph) -> Set[str]:
+    """Get set of N-Triples statements in Graph."""
+    # The N-Triples serializer warns about custom encodings, so the serialization
+    # is decoded afterwards when rdflib returns bytes.
+    serialized = graph.serialize(format="nt")
+    if isinstance(serialized, bytes):
+        serialized = serialized.decode("utf-8")
+    return set(read_ntriples(serialized.splitlines()))
+
+
+def read_ntriples(lines: Iterable[str]) -> Iterator[str]:
+    """Get normalized N-Triples statements from lines, skipping blanks and comments."""
+    for line in lines:
+        statement = line.strip()
+        if statement and not statement.startswith("#"):
+            yield statement
@@ -1,5 +1,6 @@
 """Pytests."""
 # flake8: noqa
+from modelldcatnotordf.modelldcatno import SimpleType
 import pytest
 from pytest_mock.plugin import MockerFixture
 from rdflib.graph import Graph
@@ -29,7 +30,7 @@ def test_object_type_attribute_property(mocker: MockerFixture) -> None:
     components = schema.get_components_by_path("#/Eiendom")
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -186,7 +187,7 @@ def test_simple_type_array_property(mocker: MockerFixture) -> None:
     components = schema.get_components_by_path("#/KommuneResultat")
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -335,7 +336,7 @@ def test_multiplicity(mocker: MockerFixture) -> None:
     components = schema.get_components_by_path("#/Account")
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -387,7 +388,7 @@ def test_code_list_and_element(mocker: MockerFixture) -> None:
     components = schema.get_components_by_path("#/Alphabet")
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -443,3 +444,35 @@ def test_code_list_and_element(mocker: MockerFixture) -> None:
     g2 = collected_graph
 
     assert_isomorphic(g1, g2)
+
+
+@pytest.mark.integration
+def test_primitive_simple_types_are_shared(mocker: MockerFixture) -> None:
+    """Test that primitive simple types are created once and referred to later."""
+    in_dict = {
+        "Element": {
+            "properties": {
+                "a": {"type": "string"},
+                "b": {"type": "string"},
+                "c": {"format": "int64"},
+            }
+        },
+    }
+    mocker.patch(
+        "jsonschematordf.schema.Schema.create_skolemization",
+        side_effect=mock_uri_generator(BASE_URI),
+    )
+    schema = Schema(BASE_URI, in_dict)
+    element = create_model_element(
+        schema.get_components_by_path("#/Element")[0], schema
+    )
+
+    a, b, c = [property.has_simple_type for property in element.has_property]
+
+    assert b == a.identifier
+    assert not isinstance(b, SimpleType)
+    assert a.identifier == f"{BASE_URI}/#string"
+    assert c.identifier == f"{BASE_URI}/#int64"
+    assert c.type_definition_reference == (
+        "https://www.w3.org/2019/wot/json-schema#integerschema"
+    )
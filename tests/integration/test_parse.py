@@ -1,12 +1,40 @@
 """Pytests."""
 # flake8: noqa
+from pathlib import Path
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 from rdflib.graph import Graph
+from rdflib.namespace import RDF
+from rdflib.term import URIRef
 
-from tests.testutils import assert_isomorphic, mock_uri_generator
+from tests.testutils import (
+    assert_isomorphic,
+    get_memory_growth,
+    get_time_and_peak_memory,
+    mock_uri_generator,
+    skolems_to_blank_nodes,
+)
 
-from jsonschematordf.parse import json_schema_to_graph
+from jsonschematordf.codelistregistry import CodeListRegistry
+from jsonschematordf.documentresolver import DirectoryResolver, MappingResolver
+from jsonschematordf.exceptions import ConversionTimeoutError, ResourceLimitError
+from jsonschematordf.parse import (
+    json_schema_bundle_to_graph,
+    json_schema_bundle_to_modelldcatno,
+    json_schema_component_to_modelldcatno,
+    json_schema_definitions_to_modelldcatno,
+    json_schema_file_to_graph,
+    json_schema_file_to_modelldcatno,
+    json_schema_to_conversion_plan,
+    json_schema_to_graph,
+    json_schema_to_graph_delta,
+    json_schema_to_modelldcatno,
+)
+from jsonschematordf.resourcelimits import ResourceLimits
+from jsonschematordf.schema import Schema
+from jsonschematordf.types.constants import OPENAPI_ROOT_SELECTOR
+from jsonschematordf.utils import add_elements_to_graph
 
 
 BASE_URI = "http://uri.com"
@@ -37,7 +65,7 @@ def test_graph_creation(mocker: MockerFixture) -> None:
     }"""
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -135,7 +163,7 @@ def test_referenced_objects_are_parsed_once(mocker: MockerFixture) -> None:
     }"""
 
     mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
+        "jsonschematordf.schema.Schema.create_skolemization",
         side_effect=mock_uri_generator(BASE_URI),
     )
 
@@ -252,3 +280,802 @@ def test_handles_circular_and_external_references() -> None:
     g2 = json_schema_to_graph(json_schema_string, BASE_URI)
 
     assert_isomorphic(g1, g2)
+
+
+@pytest.mark.integration
+def test_graph_delta_against_previous_graph() -> None:
+    """Test that delta only contains statements that changed between versions."""
+    previous_json_schema_string = """{
+        "Eiendom":{
+            "type":"object",
+            "description":"Old description"
+        },
+        "Adresse":{
+            "type":"object"
+        }
+    }"""
+    json_schema_string = """{
+        "Eiendom":{
+            "type":"object",
+            "description":"New description"
+        },
+        "Adresse":{
+            "type":"object"
+        }
+    }"""
+
+    previous = json_schema_to_graph(previous_json_schema_string, BASE_URI)
+
+    additions, removals = json_schema_to_graph_delta(
+        json_schema_string, BASE_URI, previous
+    )
+
+    assert additions == [
+        '<http://uri.com/#Eiendom> <http://purl.org/dc/terms/description> "New description" .'
+    ]
+    assert removals == [
+        '<http://uri.com/#Eiendom> <http://purl.org/dc/terms/description> "Old description" .'
+    ]
+
+
+@pytest.mark.integration
+def test_graph_delta_leaves_out_unchanged_skolemized_elements(
+    tmp_path: Path,
+) -> None:
+    """Test that skolemized elements minted anew are only in delta if changed."""
+    previous_json_schema_string = """{
+        "Eiendom":{
+            "type":"object",
+            "properties":{
+                "kode":{ "type":"string", "enum":["a", "b"] },
+                "tall":{ "type":"array", "items":{ "type":"integer", "minimum":1 } }
+            }
+        }
+    }"""
+    json_schema_string = previous_json_schema_string.replace('"b"', '"c"')
+
+    previous = tmp_path / "previous.nt"
+    previous.write_bytes(
+        json_schema_to_graph(previous_json_schema_string, BASE_URI).serialize(
+            format="nt"
+        )
+    )
+
+    unchanged_additions, unchanged_removals = json_schema_to_graph_delta(
+        previous_json_schema_string, BASE_URI, str(previous)
+    )
+    assert unchanged_additions == unchanged_removals == []
+
+    additions, removals = json_schema_to_graph_delta(
+        json_schema_string, BASE_URI, str(previous)
+    )
+
+    assert len(additions) == len(removals) == 3
+    assert any(statement.endswith('"c" .') for statement in additions)
+    assert any(statement.endswith('"b" .') for statement in removals)
+    assert all("/.well-known/skolem/" in statement for statement in additions)
+
+
+@pytest.mark.integration
+def test_bundle_resolves_references_between_documents() -> None:
+    """Test that references between documents are resolved and parsed once."""
+    documents = {
+        "http://uri.com/a.json": """{
+            "Person":{
+                "type":"object",
+                "properties":{
+                    "address":{
+                        "$ref":"b.json#/Address"
+                    }
+                }
+            },
+            "Company":{
+                "type":"object",
+                "properties":{
+                    "address":{
+                        "$ref":"http://uri.com/b.json#/Address"
+                    }
+                }
+            }
+        }""",
+        "http://uri.com/b.json": """{
+            "Address":{
+                "type":"object"
+            }
+        }""",
+    }
+
+    expected = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        <http://uri.com/a.json/#Person> a modelldcatno:ObjectType ;
+            dct:title "Person" ;
+            modelldcatno:hasProperty <http://uri.com/a.json/Person#address> .
+
+        <http://uri.com/a.json/#Company> a modelldcatno:ObjectType ;
+            dct:title "Company" ;
+            modelldcatno:hasProperty <http://uri.com/a.json/Company#address> .
+
+        <http://uri.com/a.json/Person#address> a modelldcatno:Role ;
+            dct:title "address" ;
+            xsd:maxOccurs "1"^^xsd:nonNegativeInteger ;
+            modelldcatno:hasObjectType <http://uri.com/b.json/#Address> .
+
+        <http://uri.com/a.json/Company#address> a modelldcatno:Role ;
+            dct:title "address" ;
+            xsd:maxOccurs "1"^^xsd:nonNegativeInteger ;
+            modelldcatno:hasObjectType <http://uri.com/b.json/#Address> .
+
+        <http://uri.com/b.json/#Address> a modelldcatno:ObjectType ;
+            dct:title "Address" .
+    """
+
+    g1 = Graph().parse(data=expected, format="turtle")
+    g2 = json_schema_bundle_to_graph(documents)
+
+    assert_isomorphic(g1, g2)
+
+
+@pytest.mark.integration
+def test_code_lists_are_shared_by_documents_in_a_batch() -> None:
+    """Test that later documents in a batch refer to code lists of earlier ones."""
+    code_list_registry = CodeListRegistry()
+    code_element_type = URIRef(
+        "https://data.norge.no/vocabulary/modelldcatno#CodeElement"
+    )
+    has_value_from = URIRef(
+        "https://data.norge.no/vocabulary/modelldcatno#hasValueFrom"
+    )
+
+    first = json_schema_to_graph(
+        """{
+            "Address": {
+                "type": "object",
+                "properties": {
+                    "country": {"type": "string", "enum": ["NO", "SE", "DK"]}
+                }
+            }
+        }""",
+        "http://uri.com/a.json",
+        code_list_registry=code_list_registry,
+    )
+    second = json_schema_to_graph(
+        """{
+            "Person": {
+                "type": "object",
+                "properties": {
+                    "citizenship": {"type": "string", "enum": ["DK", "NO", "SE"]},
+                    "residence": {"type": "string", "enum": ["SE", "NO", "DK"]}
+                }
+            }
+        }""",
+        "http://uri.com/b.json",
+        code_list_registry=code_list_registry,
+    )
+
+    shared_code_list = URIRef("http://uri.com/a.json/Address/country#country")
+    assert len(list(first.subjects(RDF.type, code_element_type))) == 3
+    assert not list(second.subjects(RDF.type, code_element_type))
+    assert set(second.objects(predicate=has_value_from)) == {shared_code_list}
+    assert len(code_list_registry) == 1
+
+
+@pytest.mark.integration
+def test_interrupted_roots_do_not_register_code_lists(mocker: MockerFixture) -> None:
+    """Test that code lists of root elements discarded on timeout are dropped."""
+    code_list_registry = CodeListRegistry()
+    json_schema_string = """{
+        "Address": {
+            "type": "object",
+            "properties": {
+                "country": {"type": "string", "enum": ["NO", "SE"]},
+                "street": {"type": "string"}
+            }
+        }
+    }"""
+
+    def _check_deadline() -> None:
+        if len(code_list_registry):
+            raise ConversionTimeoutError()
+
+    check_deadline = mocker.patch.object(
+        Schema, "check_deadline", side_effect=_check_deadline
+    )
+    interrupted = json_schema_to_modelldcatno(
+        json_schema_string, BASE_URI, code_list_registry=code_list_registry
+    )
+    assert interrupted.skipped_definitions == ["/Address"]
+    assert len(code_list_registry) == 0
+
+    check_deadline.side_effect = None
+    completed = json_schema_to_modelldcatno(
+        json_schema_string, BASE_URI, code_list_registry=code_list_registry
+    )
+    assert len(completed.orphan_elements) == 2
+    assert len(code_list_registry) == 1
+
+
+@pytest.mark.integration
+def test_external_references_are_resolved_offline(tmp_path: Path) -> None:
+    """Test that external documents are loaded from local mirror and parsed."""
+    (tmp_path / "address.json").write_text(
+        """{
+            "Address":{
+                "type":"object"
+            }
+        }""",
+        encoding="utf-8",
+    )
+    json_schema_string = """{
+        "Person":{
+            "type":"object",
+            "properties":{
+                "address":{
+                    "$ref":"http://mirror.com/schemas/address.json#/Address"
+                }
+            }
+        }
+    }"""
+
+    expected = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        <http://uri.com/#Person> a modelldcatno:ObjectType ;
+            dct:title "Person" ;
+            modelldcatno:hasProperty <http://uri.com/Person#address> .
+
+        <http://uri.com/Person#address> a modelldcatno:Role ;
+            dct:title "address" ;
+            xsd:maxOccurs "1"^^xsd:nonNegativeInteger ;
+            modelldcatno:hasObjectType <http://mirror.com/schemas/address.json/#Address> .
+
+        <http://mirror.com/schemas/address.json/#Address> a modelldcatno:ObjectType ;
+            dct:title "Address" .
+    """
+
+    resolver = DirectoryResolver("http://mirror.com/schemas/", str(tmp_path))
+
+    g1 = Graph().parse(data=expected, format="turtle")
+    g2 = json_schema_to_graph(json_schema_string, BASE_URI, resolver)
+
+    assert_isomorphic(g1, g2)
+
+
+@pytest.mark.integration
+def test_root_selectors_only_parse_selected_definitions() -> None:
+    """Test that only members of selected objects are parsed as root elements."""
+    json_schema_string = """{
+        "openapi":"3.0.0",
+        "paths":{
+            "/eiendom":{
+                "get":{
+                    "type":"object"
+                }
+            }
+        },
+        "components":{
+            "schemas":{
+                "Eiendom":{
+                    "type":"object",
+                    "properties":{
+                        "adresse":{
+                            "$ref":"#/components/schemas/Adresse"
+                        }
+                    }
+                },
+                "Adresse":{
+                    "type":"object"
+                }
+            }
+        }
+    }"""
+
+    expected = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        <http://uri.com/components/schemas#Eiendom> a modelldcatno:ObjectType ;
+            dct:title "Eiendom" ;
+            modelldcatno:hasProperty <http://uri.com/components/schemas/Eiendom#adresse> .
+
+        <http://uri.com/components/schemas/Eiendom#adresse> a modelldcatno:Role ;
+            dct:title "adresse" ;
+            xsd:maxOccurs "1"^^xsd:nonNegativeInteger ;
+            modelldcatno:hasObjectType <http://uri.com/components/schemas#Adresse> .
+
+        <http://uri.com/components/schemas#Adresse> a modelldcatno:ObjectType ;
+            dct:title "Adresse" .
+    """
+
+    g1 = Graph().parse(data=expected, format="turtle")
+    g2 = json_schema_to_graph(
+        json_schema_string, BASE_URI, root_selectors=[OPENAPI_ROOT_SELECTOR]
+    )
+
+    assert_isomorphic(g1, g2)
+
+
+@pytest.mark.integration
+def test_selected_definitions_and_references_are_parsed(
+    mocker: MockerFixture,
+) -> None:
+    """Test that only selected definitions and their reference closure are parsed."""
+    json_schema = {
+        "$defs": {
+            "Eiendom": {
+                "type": "object",
+                "properties": {"type": {"$ref": "#/$defs/EiendomType"}},
+            },
+            "EiendomType": {"type": "string", "enum": ["residential"]},
+            "Adresse": {"type": "object"},
+        }
+    }
+
+    mocker.patch(
+        "jsonschematordf.schema.Schema.create_skolemization",
+        side_effect=mock_uri_generator(BASE_URI),
+    )
+
+    expected = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        <http://uri.com/$defs#Eiendom> a modelldcatno:ObjectType ;
+            dct:title "Eiendom" ;
+            modelldcatno:hasProperty <http://uri.com/$defs/Eiendom#type> .
+
+        <http://uri.com/$defs/Eiendom#type> a modelldcatno:Attribute ;
+            dct:title "type" ;
+            xsd:maxOccurs "1"^^xsd:nonNegativeInteger ;
+            modelldcatno:hasValueFrom <http://uri.com/$defs#EiendomType> .
+
+        <http://uri.com/$defs#EiendomType> a modelldcatno:CodeList ;
+            dct:title "EiendomType" .
+
+        <http://uri.com/mock_uri_0> a modelldcatno:CodeElement ;
+            skos:inScheme <http://uri.com/$defs#EiendomType> ;
+            skos:notation "residential" .
+    """
+
+    schema = Schema(BASE_URI, json_schema)
+    model_elements, orphan_elements = json_schema_definitions_to_modelldcatno(
+        schema, ["/$defs/Eiendom"]
+    )
+
+    g1 = Graph().parse(data=expected, format="turtle")
+    g2 = add_elements_to_graph(Graph(), [*model_elements, *orphan_elements])
+
+    assert_isomorphic(g1, g2)
+    assert len(orphan_elements) == 1
+
+
+@pytest.mark.integration
+def test_file_parsing_only_loads_selected_subtrees(tmp_path: Path) -> None:
+    """Test that files are parsed like strings, skipping unselected subtrees."""
+    json_schema_string = """{
+        "paths":{
+            "/eiendom":[ "not", "valid" "json" ]
+        },
+        "components":{
+            "schemas":{
+                "Eiendom":{
+                    "type":"object",
+                    "properties":{
+                        "adresse":{
+                            "$ref":"#/components/schemas/Adresse"
+                        }
+                    }
+                },
+                "Adresse":{
+                    "type":"object"
+                }
+            }
+        }
+    }"""
+    file_path = tmp_path / "schema.json"
+    file_path.write_text(json_schema_string, encoding="utf-8")
+
+    expected = json_schema_to_graph(
+        json_schema_string.replace('"valid" "json"', '"valid", "json"'),
+        BASE_URI,
+        root_selectors=[OPENAPI_ROOT_SELECTOR],
+    )
+
+    actual = json_schema_file_to_graph(
+        str(file_path), BASE_URI, root_selectors=[OPENAPI_ROOT_SELECTOR]
+    )
+
+    assert len(actual) == 9
+    assert_isomorphic(expected, actual)
+
+
+@pytest.mark.integration
+def test_flow_style_yaml_file_is_loaded_as_yaml(tmp_path: Path) -> None:
+    """Test that YAML files looking like JSON objects are loaded as YAML."""
+    json_schema_string = "{ 'Element': { 'type': 'object', 'title': 'Element' } }"
+    file_path = tmp_path / "schema.yaml"
+    file_path.write_text(json_schema_string, encoding="utf-8")
+
+    expected = json_schema_to_graph(json_schema_string, BASE_URI)
+    actual = json_schema_file_to_graph(str(file_path), BASE_URI)
+
+    assert len(actual) == 2
+    assert_isomorphic(expected, actual)
+
+
+@pytest.mark.integration
+def test_empty_json_object_file_is_loaded_once(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test that empty JSON objects are not loaded again as YAML."""
+    file_path = tmp_path / "schema.json"
+    file_path.write_text("{ }", encoding="utf-8")
+    load_mock = mocker.patch("jsonschematordf.parse.load_json_schema_string")
+
+    model_elements, orphan_elements = json_schema_file_to_modelldcatno(
+        str(file_path), BASE_URI
+    )
+
+    assert model_elements == []
+    assert orphan_elements == []
+    load_mock.assert_not_called()
+
+
+@pytest.mark.integration
+def test_parallel_conversion_is_identical_to_serial_conversion() -> None:
+    """Test that converting independent definitions in workers gives same output."""
+    json_schema_string = """{
+        "$defs": {
+            "A": {
+                "type": "object",
+                "properties": {
+                    "b": {"$ref": "#/$defs/B"},
+                    "n": {"type": "integer"}
+                }
+            },
+            "B": {"type": "object", "properties": {"s": {"type": "string"}}},
+            "C": {
+                "type": "object",
+                "properties": {"c": {"type": "string", "enum": ["x", "y"]}}
+            },
+            "D": {"$ref": "#/$defs/E/properties/e"},
+            "E": {
+                "type": "object",
+                "properties": {"e": {"type": "string", "format": "date"}}
+            },
+            "F": {"type": "string"}
+        }
+    }"""
+
+    serial = json_schema_to_modelldcatno(
+        json_schema_string, BASE_URI, root_selectors=["/$defs"]
+    )
+    parallel = json_schema_to_modelldcatno(
+        json_schema_string, BASE_URI, root_selectors=["/$defs"], max_workers=2
+    )
+
+    assert [
+        getattr(element, "identifier", element) for element in parallel.model_elements
+    ] == [getattr(element, "identifier", element) for element in serial.model_elements]
+    assert len(parallel.orphan_elements) == len(serial.orphan_elements)
+    assert_isomorphic(
+        skolems_to_blank_nodes(add_elements_to_graph(Graph(), [*parallel])),
+        skolems_to_blank_nodes(add_elements_to_graph(Graph(), [*serial])),
+    )
+
+
+@pytest.mark.integration
+def test_resource_limits_reject_hostile_schemas(tmp_path: Path) -> None:
+    """Test that schemas exceeding resource limits are rejected."""
+    limits = ResourceLimits(
+        max_bytes=10000, max_alias_expansions=1000, max_depth=30, max_components=20
+    )
+    alias_bomb = "\n".join(
+        [f"A0: &A0 {{type: string}}"]
+        + [f"A{i}: &A{i} [{', '.join([f'*A{i - 1}'] * 9)}]" for i in range(1, 8)]
+    )
+    wide_schema = (
+        '{"A": {"properties": {'
+        + ", ".join(f'"p{i}": {{"type": "string"}}' for i in range(100))
+        + "}}}"
+    )
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(wide_schema)
+
+    with pytest.raises(ResourceLimitError):
+        json_schema_to_graph(alias_bomb, BASE_URI, limits=limits)
+    with pytest.raises(ResourceLimitError):
+        json_schema_to_graph("A: " + "x" * 10000, BASE_URI, limits=limits)
+    with pytest.raises(ResourceLimitError):
+        json_schema_to_graph(wide_schema, BASE_URI, limits=limits)
+    with pytest.raises(ResourceLimitError):
+        json_schema_file_to_graph(str(schema_file), BASE_URI, limits=limits)
+    with pytest.raises(ResourceLimitError):
+        json_schema_to_graph(wide_schema, BASE_URI, max_workers=2, limits=limits)
+
+    assert len(
+        json_schema_to_graph('{"A": {"type": "object"}}', BASE_URI, limits=limits)
+    )
+
+
+@pytest.mark.integration
+def test_deeply_nested_files_exceed_depth_limit(tmp_path: Path) -> None:
+    """Test that deeply nested files raise ResourceLimitError, not RecursionError."""
+    limits = ResourceLimits(max_depth=50)
+    deep_schema = '{"A": ' + '{"properties": {"p": ' * 600 + "{}" + "}}" * 600 + "}"
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(deep_schema)
+
+    with pytest.raises(ResourceLimitError):
+        json_schema_file_to_graph(str(schema_file), BASE_URI, limits=limits)
+    with pytest.raises(ResourceLimitError):
+        json_schema_to_graph(deep_schema, BASE_URI, max_workers=2, limits=limits)
+
+
+@pytest.mark.integration
+def test_resource_limits_apply_to_referenced_documents() -> None:
+    """Test that documents loaded through a resolver are limited as well."""
+    limits = ResourceLimits(
+        max_bytes=10000, max_alias_expansions=1000, max_depth=30, max_components=20
+    )
+    alias_bomb = "\n".join(
+        ["B: {type: object}", "A0: &A0 {type: string}"]
+        + [f"A{i}: &A{i} [{', '.join([f'*A{i - 1}'] * 9)}]" for i in range(1, 8)]
+    )
+    wide_schema = (
+        '{"B": {"properties": {'
+        + ", ".join(f'"p{i}": {{"type": "string"}}' for i in range(100))
+        + "}}}"
+    )
+    json_schema_string = """{
+        "A": {"type": "object", "properties": {"b": {"$ref": "b.json#/B"}}}
+    }"""
+
+    for referenced_document in (alias_bomb, wide_schema):
+        resolver = MappingResolver({"http://uri.com/b.json": referenced_document})
+        with pytest.raises(ResourceLimitError):
+            json_schema_to_graph(
+                json_schema_string,
+                "http://uri.com/a.json",
+                resolver=resolver,
+                limits=limits,
+            )
+        assert len(
+            json_schema_to_graph(
+                json_schema_string, "http://uri.com/a.json", resolver=resolver
+            )
+        )
+
+
+@pytest.mark.integration
+def test_time_budget_returns_partial_result(mocker: MockerFixture) -> None:
+    """Test that conversion stops when time runs out, listing skipped definitions."""
+    json_schema_string = """{
+        "A": {"type": "object", "properties": {"a": {"type": "string"}}},
+        "B": {"type": "string", "title": "B"},
+        "C": {"type": "object"}
+    }"""
+
+    in_time = json_schema_to_modelldcatno(json_schema_string, BASE_URI, time_budget=60)
+    assert len(in_time.model_elements) == 3
+    assert in_time.skipped_definitions == []
+
+    out_of_time = json_schema_to_modelldcatno(
+        json_schema_string, BASE_URI, time_budget=0
+    )
+    assert out_of_time.model_elements == []
+    assert out_of_time.skipped_definitions == ["/A", "/B", "/C"]
+
+    mocker.patch.object(
+        Schema,
+        "check_deadline",
+        side_effect=[None, None, None, ConversionTimeoutError(), None],
+    )
+    partial = json_schema_to_modelldcatno(json_schema_string, BASE_URI)
+    assert [element.title for element in partial.model_elements] == [{None: "A"}]
+    assert partial.skipped_definitions == ["/B", "/C"]
+
+
+@pytest.mark.integration
+def test_bundle_time_budget_is_shared_by_all_documents(mocker: MockerFixture) -> None:
+    """Test that one deadline stops loading and converting documents of a bundle."""
+    documents = {
+        "http://uri.com/a.json": """{
+            "A": {"type": "object", "properties": {"b": {"$ref": "b.json#/B"}}},
+            "C": {"type": "object"}
+        }""",
+        "http://uri.com/b.json": '{"B": {"type": "object"}}',
+        "http://uri.com/d.json": '{"D": {"type": "object"}}',
+    }
+
+    in_time = json_schema_bundle_to_modelldcatno(documents, time_budget=60)
+    assert len(in_time.model_elements) == 4
+    assert in_time.skipped_definitions == []
+
+    out_of_time = json_schema_bundle_to_modelldcatno(documents, time_budget=0)
+    assert out_of_time.model_elements == []
+    assert out_of_time.skipped_definitions == [
+        "http://uri.com/a.json",
+        "http://uri.com/b.json",
+        "http://uri.com/d.json",
+    ]
+
+    mocker.patch(
+        "jsonschematordf.parse._is_past_deadline", side_effect=[False, False, True]
+    )
+    mocker.patch.object(
+        Schema,
+        "check_deadline",
+        side_effect=[None, None, None, None, ConversionTimeoutError()],
+    )
+    partial = json_schema_bundle_to_modelldcatno(documents, time_budget=60)
+    assert [element.title for element in partial.model_elements] == [{None: "A"}]
+    assert partial.skipped_definitions == [
+        "http://uri.com/a.json#/C",
+        "http://uri.com/b.json#/B",
+        "http://uri.com/d.json",
+    ]
+
+
+@pytest.mark.integration
+def test_bundle_graph_only_contains_documents_added_in_time(
+    mocker: MockerFixture,
+) -> None:
+    """Test that documents are not added to the bundle graph when time runs out."""
+    documents = {
+        "http://uri.com/a.json": '{"A": {"type": "object"}}',
+        "http://uri.com/b.json": '{"B": {"type": "object"}}',
+    }
+    mocker.patch(
+        "jsonschematordf.parse._is_past_deadline",
+        side_effect=[False, False, False, True],
+    )
+
+    graph = json_schema_bundle_to_graph(documents, time_budget=60)
+
+    assert set(graph.subjects()) == {URIRef("http://uri.com/a.json/#A")}
+
+
+@pytest.mark.integration
+def test_conversion_plan_gives_same_graph_as_conversion() -> None:
+    """Test that instantiating a conversion plan equals converting the schema."""
+    json_schema_string = """{
+        "Eiendom": {
+            "type": "object",
+            "properties": {
+                "erstatter": {"type": "string", "title": "Erstatter"},
+                "kode": {"type": "string", "enum": ["a", "b"]},
+                "matrikkel": {"type": "array", "items": {"type": "string"}},
+                "eier": {"$ref": "#/Person"},
+                "navn": {"type": "string"}
+            }
+        },
+        "Person": {"type": "object", "oneOf": [{"type": "integer"}]}
+    }"""
+
+    plan = json_schema_to_conversion_plan(json_schema_string)
+
+    for base_uri in (BASE_URI, "http://uri.com/schemas/", "https://other.org/a.json"):
+        expected = json_schema_to_graph(json_schema_string, base_uri)
+        actual = plan.to_graph(base_uri)
+        assert len(plan) == len(expected)
+        assert_isomorphic(
+            skolems_to_blank_nodes(actual), skolems_to_blank_nodes(expected)
+        )
+        assert URIRef(f"{base_uri}/#Eiendom") in set(actual.subjects())
+
+
+@pytest.mark.benchmark
+def test_repeated_conversions_do_not_grow_memory() -> None:
+    """Test that converting schemas in a loop keeps memory flat."""
+    json_schema_string = """{
+        "A": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "string", "enum": ["x", "y"]},
+                "b": {"$ref": "#/B"}
+            }
+        },
+        "B": {"type": "integer", "title": "B"}
+    }"""
+
+    def _convert(iteration: int) -> None:
+        json_schema_to_modelldcatno(json_schema_string, f"{BASE_URI}/{iteration}")
+
+    def _convert_to_graph(iteration: int) -> None:
+        json_schema_to_graph(json_schema_string, f"{BASE_URI}/{iteration}")
+
+    assert get_memory_growth(_convert, 1000) < 64 * 1024
+    assert get_memory_growth(_convert_to_graph, 100) < 64 * 1024
+
+
+@pytest.mark.benchmark
+def test_wide_object_conversion_is_linear() -> None:
+    """Test time and peak memory of objects with 100k properties are linear."""
+
+    def _convert_wide_object(property_count: int) -> None:
+        properties = {
+            f"property{index}": {"type": "string", "pattern": "^[a-z]+$"}
+            for index in range(property_count)
+        }
+        required = [f"property{index}" for index in range(0, property_count, 2)]
+        schema = Schema(
+            BASE_URI,
+            {
+                "Wide": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": required,
+                }
+            },
+        )
+        parsed_schema = json_schema_component_to_modelldcatno(schema, ["Wide"])
+        assert len(parsed_schema.model_elements[0].has_property) == property_count
+
+    small_time, small_peak = get_time_and_peak_memory(
+        lambda: _convert_wide_object(10_000)
+    )
+    large_time, large_peak = get_time_and_peak_memory(
+        lambda: _convert_wide_object(100_000)
+    )
+
+    assert large_time < 20 * small_time
+    assert large_peak < 20 * small_peak
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "json_schema_string",
+    [
+        """{
+            "Person": {
+                "type": "object",
+                "title": "Person",
+                "description": "A person",
+                "required": ["name", "born"],
+                "properties": {
+                    "name": {"type": "string", "description": "Full name"},
+                    "born": {"type": "string", "format": "date"},
+                    "age": {"type": "integer", "title": "Age"},
+                    "height": {"type": "number"},
+                    "alive": {"type": "boolean"},
+                    "id": {"format": "uuid"}
+                }
+            },
+            "Address": {
+                "type": "object",
+                "title": "Person",
+                "properties": {"street": {"type": "string"}}
+            },
+            "Empty": {"type": "object"}
+        }""",
+        """{
+            "A b": {
+                "type": "object",
+                "properties": {
+                    "x y": {"type": "string"},
+                    "first": {"type": "string", "title": "same"},
+                    "second": {"type": "integer", "title": "same"},
+                    "untitled": {"type": "string", "title": ""}
+                }
+            }
+        }""",
+    ],
+)
+def test_flat_schemas_give_same_graph_as_general_conversion(
+    mocker: MockerFixture, json_schema_string: str
+) -> None:
+    """Test that flat schemas converted directly give the same graph."""
+    actual = json_schema_to_graph(json_schema_string, BASE_URI)
+
+    mocker.patch("jsonschematordf.parse.is_flat_schema", return_value=False)
+    expected = json_schema_to_graph(json_schema_string, BASE_URI)
+
+    assert_isomorphic(skolems_to_blank_nodes(actual), skolems_to_blank_nodes(expected))
@@ -1,9 +1,13 @@
 """Utils for displaying debug information."""
 
-from typing import Generator
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Generator, Tuple
 
-from rdflib import Graph
+from rdflib import BNode, Graph, URIRef
 from rdflib.compare import graph_diff, isomorphic
+from rdflib.term import Node
 
 
 def assert_isomorphic(g1: Graph, g2: Graph) -> None:
@@ -42,3 +46,68 @@ def mock_uri_generator(base_uri: str) -> Generator[str, None, None]:
     """Generator for mock_uris."""
     for n in range(1000):
         yield f"{base_uri}/mock_uri_{n}"
+
+
+def skolems_to_blank_nodes(graph: Graph) -> Graph:
+    """Replace skolemized identifiers, which are minted randomly, by blank nodes."""
+    blank_nodes = {}
+
+    def _to_blank_node(term: Node) -> Node:
+        if isinstance(term, URIRef) and "/.well-known/skolem/" in term:
+            return blank_nodes.setdefault(term, BNode())
+        return term
+
+    result = Graph()
+    for triple in graph:
+        result.add(tuple(_to_blank_node(term) for term in triple))
+    return result
+
+
+def get_memory_growth(
+    function: Callable[[int], Any], iterations: int, warmup: int = 50
+) -> int:
+    """Call function repeatedly, and measure growth of traced memory after warm-up.
+
+    Args:
+        function: Function called with the number of the iteration.
+        iterations: Number of calls measured.
+        warmup: Number of calls before measuring, filling caches and imports.
+
+    Returns:
+        Number of bytes allocated by the measured calls and never freed.
+    """
+    for iteration in range(warmup):
+        function(iteration)
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for iteration in range(iterations):
+            function(warmup + iteration)
+        gc.collect()
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return end - start
+
+
+def get_time_and_peak_memory(function: Callable[[], Any]) -> Tuple[float, int]:
+    """Call function once, and measure its duration and peak traced memory.
+
+    Args:
+        function: Function called without arguments.
+
+    Returns:
+        Seconds spent in the call, and the peak number of bytes it allocated.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
@@ -0,0 +1,55 @@
+"""Pytests."""
+import pytest
+
+from jsonschematordf.codelistregistry import CodeListRegistry
+
+
+@pytest.mark.unit
+def test_first_code_list_of_enum_values_is_registered() -> None:
+    """Test that sets of enum values refer to the first code list registered."""
+    registry = CodeListRegistry()
+    registry.add_code_list(["NO", "SE"], "http://uri.com/#first")
+    registry.add_code_list(["SE", "NO", "NO"], "http://uri.com/#second")
+
+    assert len(registry) == 1
+    assert registry.get_code_list_uri(["SE", "NO"]) == "http://uri.com/#first"
+    assert registry.get_code_list_uri(["NO"]) is None
+
+
+@pytest.mark.unit
+def test_enum_values_of_different_types_are_different() -> None:
+    """Test that enum values only match values of the same type."""
+    registry = CodeListRegistry()
+    registry.add_code_list([1, 2], "http://uri.com/#numbers")
+
+    assert registry.get_code_list_uri(["1", "2"]) is None
+    assert registry.get_code_list_uri([True, 2]) is None
+
+
+@pytest.mark.unit
+def test_unhashable_enum_values_are_not_registered() -> None:
+    """Test that enums of unhashable values, such as objects, are not registered."""
+    registry = CodeListRegistry()
+    registry.add_code_list([{"a": 1}], "http://uri.com/#objects")
+
+    assert len(registry) == 0
+    assert registry.get_code_list_uri([{"a": 1}]) is None
+
+
+@pytest.mark.unit
+def test_code_lists_registered_in_failed_block_are_dropped() -> None:
+    """Test that code lists registered before an exception are rolled back."""
+    registry = CodeListRegistry()
+    registry.add_code_list(["NO"], "http://uri.com/#kept")
+
+    with pytest.raises(ValueError):
+        with registry.rollback_on_error():
+            registry.add_code_list(["SE"], "http://uri.com/#dropped")
+            raise ValueError()
+    with registry.rollback_on_error():
+        registry.add_code_list(["DK"], "http://uri.com/#added")
+
+    assert len(registry) == 2
+    assert registry.get_code_list_uri(["NO"]) == "http://uri.com/#kept"
+    assert registry.get_code_list_uri(["SE"]) is None
+    assert registry.get_code_list_uri(["DK"]) == "http://uri.com/#added"
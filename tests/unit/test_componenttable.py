@@ -0,0 +1,147 @@
+"""Pytests."""
+from copy import deepcopy
+import pickle
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jsonschematordf.component import AbstractComponent, Component
+import jsonschematordf.componentfactory as component_factory
+from jsonschematordf.componenttable import ComponentTable
+from jsonschematordf.componentview import ComponentView
+from jsonschematordf.exceptions import CyclicReferenceWarning
+from jsonschematordf.types.enums import (
+    CHOICE,
+    CODE_LIST,
+    EXTERNAL_REFERENCE,
+    OBJECT_ARRAY,
+    OBJECT_TYPE,
+    PRIMITIVE_SIMPLE_TYPE,
+)
+
+JSON_SCHEMA_REPRESENTATION = {
+    "title": "A",
+    "type": "object",
+    "description": "An object",
+    "required": ["b"],
+    "properties": {
+        "b": {"type": "string", "enum": ["x", "y"], "maxLength": 3},
+        "c": {"type": "array", "items": {"$ref": "#/B"}, "maxItems": 2},
+        "d": {"oneOf": [{"type": "integer", "minimum": 1}, {"type": "boolean"}]},
+    },
+}
+
+
+@pytest.mark.unit
+def test_views_are_equal_to_components() -> None:
+    """Test that table views have the fields of equivalent Components."""
+    table = ComponentTable()
+
+    views = component_factory.create_components(
+        ["#"], JSON_SCHEMA_REPRESENTATION, table.add_component
+    )
+    components = component_factory.create_components(["#"], JSON_SCHEMA_REPRESENTATION)
+
+    assert views == components
+    assert len(table) == 7
+    assert views[0].complete_path == "/#A"
+    assert views[0].properties[1].items.path == ["#", "A", "c"]
+
+
+@pytest.mark.unit
+def test_paths_and_values_are_interned() -> None:
+    """Test that paths and values are stored once for all components."""
+    table = ComponentTable()
+
+    first = table.add_component(["#", "A"], type="string", minimum=1)
+    second = table.add_component(["#", "A"], type="string", minimum=True)
+
+    assert first.path is not second.path
+    assert first.path == second.path
+    assert first.minimum == 1 and second.minimum is True
+    assert first.type == second.type == "string"
+
+
+@pytest.mark.unit
+def test_view_identifier_is_stored_in_table() -> None:
+    """Test that identifiers are stored by row, and views hold only table and row."""
+    table = ComponentTable()
+    table.add_component(["#"], title={None: "A"})
+
+    first = table.get_component(0)
+    first.identifier = "http://uri.com/#A"
+
+    assert table.get_component(0).identifier == "http://uri.com/#A"
+    assert table.get_identifier(0) == "http://uri.com/#A"
+    assert isinstance(first, AbstractComponent)
+    assert not isinstance(first, Component)
+    assert not hasattr(first, "__dict__")
+    assert ComponentView.__slots__ == ("_table", "_index")
+
+
+@pytest.mark.unit
+def test_views_are_copied_as_components() -> None:
+    """Test that copies and pickles of views are plain Components."""
+    table = ComponentTable()
+    view = component_factory.create_component(
+        ["#"], JSON_SCHEMA_REPRESENTATION, table.add_component
+    )
+
+    for copied in [
+        view.detach(),
+        view.copy(),
+        deepcopy(view),
+        pickle.loads(pickle.dumps(view)),
+    ]:
+        assert type(copied) is Component
+        assert copied == view
+        assert type(copied.properties[0]) is Component
+
+
+@pytest.mark.unit
+def test_classify_determines_types_of_all_rows(mocker: MockerFixture) -> None:
+    """Test that rows are classified in one pass using the reference resolver."""
+    table = ComponentTable()
+    views = [
+        component_factory.create_component(["#"], representation, table.add_component)
+        for representation in [
+            {"title": "A", "type": "object"},
+            {"title": "B", "type": "array", "items": {"$ref": "#/A"}},
+            {"title": "C", "oneOf": [{"type": "string"}]},
+            {"title": "D", "type": "string", "enum": ["x"]},
+            {"type": "integer"},
+            {"title": "E", "$ref": "http://uri.com/external"},
+            {"title": "F", "$ref": "#/F"},
+        ]
+    ]
+    resolver = mocker.MagicMock()
+    resolver.get_reference_row.side_effect = {
+        "#/A": views[0].index,
+        "#/F": views[6].index,
+    }.get
+    resolver.get_reference_type.side_effect = {
+        "http://uri.com/external": EXTERNAL_REFERENCE
+    }.get
+
+    with pytest.warns(CyclicReferenceWarning):
+        table.classify(resolver)
+
+    assert [table.get_component_type(view.index) for view in views] == [
+        OBJECT_TYPE,
+        OBJECT_ARRAY,
+        CHOICE,
+        CODE_LIST,
+        PRIMITIVE_SIMPLE_TYPE,
+        EXTERNAL_REFERENCE,
+        None,
+    ]
+
+
+@pytest.mark.unit
+def test_unclassified_row_raises_error() -> None:
+    """Test that types of rows are not read before classification."""
+    table = ComponentTable()
+    view = table.add_component(["#"], type="object")
+
+    with pytest.raises(ValueError):
+        table.get_component_type(view.index)
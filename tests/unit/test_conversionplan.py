@@ -0,0 +1,55 @@
+"""Pytests."""
+from datacatalogtordf.exceptions import InvalidURIError
+import pytest
+from rdflib import Graph, Literal, URIRef
+
+from jsonschematordf.conversionplan import ConversionPlan, PLAN_BASE_URI
+
+
+@pytest.mark.unit
+def test_to_graph_prefixes_base_uri_and_skolem_identifiers() -> None:
+    """Test that identifiers minted from the base URI are prefixed by the base URI."""
+    graph = Graph()
+    graph.bind("dct", "http://purl.org/dc/terms/")
+    graph.add(
+        (
+            URIRef(f"{PLAN_BASE_URI}#/A"),
+            URIRef("http://purl.org/dc/terms/title"),
+            Literal(PLAN_BASE_URI),
+        )
+    )
+    graph.add(
+        (
+            URIRef(f"{PLAN_BASE_URI}#/A"),
+            URIRef("http://purl.org/dc/terms/relation"),
+            URIRef(f"{PLAN_BASE_URI}/.well-known/skolem/1"),
+        )
+    )
+    plan = ConversionPlan(graph)
+
+    expected = {
+        (
+            URIRef("http://uri.com/#/A"),
+            URIRef("http://purl.org/dc/terms/title"),
+            Literal(PLAN_BASE_URI),
+        ),
+        (
+            URIRef("http://uri.com/#/A"),
+            URIRef("http://purl.org/dc/terms/relation"),
+            URIRef("http://uri.com/.well-known/skolem/1"),
+        ),
+    }
+    actual = plan.to_graph("http://uri.com/")
+
+    assert set(actual) == expected
+    assert ("dct", URIRef("http://purl.org/dc/terms/")) in set(actual.namespaces())
+    assert URIRef("http://uri.com/.well-known/skolem/1") in set(
+        plan.to_graph("http://uri.com").objects()
+    )
+
+
+@pytest.mark.unit
+def test_to_graph_rejects_invalid_base_uri() -> None:
+    """Test that instantiating plan for an invalid base URI raises error."""
+    with pytest.raises(InvalidURIError):
+        ConversionPlan(Graph()).to_graph("not a uri")
@@ -0,0 +1,99 @@
+"""Pytests."""
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jsonschematordf.documentresolver import (
+    clear_document_cache,
+    DirectoryResolver,
+    DocumentResolver,
+    MappingResolver,
+    ZipResolver,
+)
+
+BASE_URI = "http://uri.com/schemas/"
+DOCUMENT = "{ 'B': { 'type': 'object' } }"
+
+
+@pytest.mark.unit
+def test_directory_resolver(tmp_path: Path) -> None:
+    """Test that documents are loaded from directory relative to base URI."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.json").write_text(DOCUMENT, encoding="utf-8")
+
+    resolver = DirectoryResolver(BASE_URI, str(tmp_path))
+
+    assert resolver.load(BASE_URI + "nested/b.json") == DOCUMENT
+    assert resolver.load(BASE_URI + "missing.json") is None
+    assert resolver.load(BASE_URI + "../b.json") is None
+    assert resolver.load("http://other.com/b.json") is None
+
+
+@pytest.mark.unit
+def test_zip_resolver(tmp_path: Path) -> None:
+    """Test that documents are loaded from zip archive relative to base URI."""
+    archive = tmp_path / "schemas.zip"
+    with ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("nested/b.json", DOCUMENT)
+
+    resolver = ZipResolver(BASE_URI, str(archive))
+
+    assert resolver.load(BASE_URI + "nested/b.json") == DOCUMENT
+    assert resolver.load(BASE_URI + "missing.json") is None
+    assert resolver.load("http://other.com/b.json") is None
+
+
+@pytest.mark.unit
+def test_mapping_resolver() -> None:
+    """Test that documents are loaded from mapping."""
+    resolver = MappingResolver({BASE_URI + "b.json": DOCUMENT})
+
+    assert resolver.load(BASE_URI + "b.json") == DOCUMENT
+    assert resolver.load(BASE_URI + "missing.json") is None
+
+
+@pytest.mark.unit
+def test_resolve_parses_document_once(mocker: MockerFixture) -> None:
+    """Test that documents are loaded and parsed once for equal resolvers."""
+    clear_document_cache()
+    load_mock = mocker.patch.object(
+        MappingResolver, "load", autospec=True, return_value=DOCUMENT
+    )
+
+    first = MappingResolver({BASE_URI + "b.json": DOCUMENT})
+    second = MappingResolver({BASE_URI + "b.json": DOCUMENT})
+
+    assert first == second
+    assert first.resolve(BASE_URI + "b.json") == {"B": {"type": "object"}}
+    assert second.resolve(BASE_URI + "b.json") == {"B": {"type": "object"}}
+    load_mock.assert_called_once()
+    clear_document_cache()
+
+
+@pytest.mark.unit
+def test_resolve_returns_none_for_missing_and_invalid_documents() -> None:
+    """Test that missing documents and documents without root object are None."""
+    resolver = MappingResolver({BASE_URI + "b.json": "[]"})
+
+    assert resolver.resolve(BASE_URI + "b.json") is None
+    assert resolver.resolve(BASE_URI + "missing.json") is None
+
+
+@pytest.mark.unit
+def test_base_resolver_is_abstract() -> None:
+    """Test that base resolver requires cache key and load to be implemented."""
+    with pytest.raises(TypeError):
+        DocumentResolver()  # type: ignore[abstract]
+
+
+@pytest.mark.unit
+def test_base_uri_only_matches_at_path_segment_boundary(tmp_path: Path) -> None:
+    """Test that documents outside the root of the base URI are not resolved."""
+    (tmp_path / "b.json").write_text(DOCUMENT, encoding="utf-8")
+    resolver = DirectoryResolver("http://uri.com", str(tmp_path))
+
+    assert resolver.load("http://uri.com/b.json") == DOCUMENT
+    assert resolver.load("http://uri.community/b.json") is None
+    assert resolver.load("http://uri.comb.json") is None
@@ -0,0 +1,57 @@
+"""Pytests."""
+from typing import Any, Dict
+
+import pytest
+
+from jsonschematordf.flatschema import is_flat_schema
+from jsonschematordf.resourcelimits import ResourceLimits
+from jsonschematordf.schema import Schema
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "representation,expected",
+    [
+        ({"type": "object"}, True),
+        (
+            {
+                "type": "object",
+                "title": "A",
+                "required": ["a"],
+                "properties": {
+                    "a": {"type": "string", "description": "A"},
+                    "b": {"format": "date-time"},
+                },
+            },
+            True,
+        ),
+        ({"type": "string"}, False),
+        ({"properties": {"a": {"type": "string"}}}, False),
+        ({"type": "object", "properties": {"a": {"$ref": "#/B"}}}, False),
+        ({"type": "object", "properties": {"a": {"enum": ["a"]}}}, False),
+        ({"type": "object", "properties": {"a": {"type": "object"}}}, False),
+        ({"type": "object", "properties": {"a": {"type": ["string"]}}}, False),
+        (
+            {"type": "object", "properties": {"a": {"type": "string", "pattern": "a"}}},
+            False,
+        ),
+        ({"type": "object", "oneOf": [{"type": "string"}]}, False),
+        ({"type": "object", "allOf": [{"type": "object"}]}, False),
+        ({"type": "object", "required": "a"}, False),
+    ],
+)
+def test_is_flat_schema(representation: Dict[str, Any], expected: bool) -> None:
+    """Test that only objects of primitive properties are flat."""
+    schema = Schema("http://uri.com", {"A": representation, "B": {"type": "object"}})
+
+    assert is_flat_schema(schema, [["A"], ["B"]]) is expected
+
+
+@pytest.mark.unit
+def test_schema_with_limits_is_not_flat() -> None:
+    """Test that schemas with resource limits use the general conversion."""
+    schema = Schema(
+        "http://uri.com", {"A": {"type": "object"}}, limits=ResourceLimits()
+    )
+
+    assert not is_flat_schema(schema, [["A"]])
@@ -0,0 +1,131 @@
+"""Pytests."""
+from typing import NoReturn
+
+import pytest
+from pytest_mock import MockerFixture
+import yaml
+
+from jsonschematordf.jsonpointerindex import JsonPointerIndex
+from jsonschematordf.lazyjson import load_lazy_json
+
+
+@pytest.mark.unit
+def test_indexes_objects_and_arrays() -> None:
+    """Test that objects and arrays on looked up paths are indexed and resolved."""
+    element = {"type": "string"}
+    document = {"a": {"allOf": [element]}, "b": "scalar"}
+
+    index = JsonPointerIndex(document)
+
+    assert len(index) == 1
+    assert index.get([]) == document
+    assert index.get(["a", "allOf", "0"]) == element
+    assert index.get(["b"]) == "scalar"
+    assert len(index) == 4
+
+
+class UntouchedDict(dict):
+    """Dict failing when its members are visited."""
+
+    def get(self, key: object, default: object = None) -> NoReturn:
+        """Fail when a member is looked up."""
+        raise AssertionError(f"Member {key} of untouched subtree was visited")
+
+    def items(self) -> NoReturn:
+        """Fail when members are listed."""
+        raise AssertionError("Members of untouched subtree were visited")
+
+
+@pytest.mark.unit
+def test_subtrees_not_looked_up_are_not_visited() -> None:
+    """Test that only subtrees of looked up paths are walked."""
+    element = {"type": "string"}
+    document = {"a": {"b": element}, "paths": UntouchedDict(c={"d": {}})}
+
+    index = JsonPointerIndex(document)
+
+    assert index.get(["a", "b"]) is element
+    assert isinstance(index.get(["paths"]), UntouchedDict)
+
+
+@pytest.mark.unit
+def test_members_are_indexed_once_on_first_lookup(mocker: MockerFixture) -> None:
+    """Test that a looked up member is indexed in one pass, and then not walked."""
+    document = {"a": {"b": {"c": {}}, "d": [{"e": "f"}]}, "g": {"h": {}}}
+
+    index = JsonPointerIndex(document)
+    assert index.get(["a", "b"]) is document["a"]["b"]
+    assert len(index) == 6
+
+    mocker.patch(
+        "jsonschematordf.jsonpointerindex._get_child",
+        side_effect=AssertionError("Indexed member was walked"),
+    )
+    assert index.get(["a", "b", "c"]) is document["a"]["b"]["c"]
+    assert index.get(["a", "d", "0"]) is document["a"]["d"][0]
+
+
+@pytest.mark.unit
+def test_resolves_keys_requiring_escaping() -> None:
+    """Test that keys containing '/' and '~' are resolved."""
+    element = {"type": "string"}
+    document = {"a/b": {"c~d": element}}
+
+    index = JsonPointerIndex(document)
+
+    assert index.get(["a/b", "c~d"]) == element
+
+
+@pytest.mark.unit
+def test_missing_paths_return_none() -> None:
+    """Test that paths not in document return None."""
+    index = JsonPointerIndex({"a": {"b": ["c"]}, "d": "e"})
+
+    assert index.get(["x"]) is None
+    assert index.get(["a", "b", "1"]) is None
+    assert index.get(["a", "b", "x"]) is None
+    assert index.get(["d", "e"]) is None
+
+
+@pytest.mark.unit
+def test_handles_aliased_and_recursive_nodes() -> None:
+    """Test that shared and recursive YAML nodes are indexed without looping."""
+    document = yaml.safe_load(
+        """
+        a: &shared
+          b: &recursive
+            c: *recursive
+        d: *shared
+        """
+    )
+
+    index = JsonPointerIndex(document)
+
+    assert index.get(["d", "b", "c", "c"]) == document["a"]["b"]
+
+
+@pytest.mark.unit
+def test_lazy_documents_are_walked_on_demand() -> None:
+    """Test that lazy objects are not indexed but resolved when requested."""
+    document = load_lazy_json(b'{"a": {"b": {"c": "d"}}}')
+
+    index = JsonPointerIndex(document)
+
+    assert len(index) == 1
+    assert index.get(["a", "b", "c"]) == "d"
+
+
+@pytest.mark.unit
+def test_invalidate_indexes_edited_subtree_again() -> None:
+    """Test that nodes below an invalidated path are indexed from the document."""
+    document = {"a": {"b": {"c": ["d"]}}, "e": {"f": {}}}
+    index = JsonPointerIndex(document)
+
+    edited = {"g": {"type": "string"}}
+    document["a"]["b"] = edited
+    index.invalidate(["a", "b"])
+
+    assert index.get(["a", "b"]) is edited
+    assert index.get(["a", "b", "g"]) == {"type": "string"}
+    assert index.get(["a", "b", "c"]) is None
+    assert index.get(["e", "f"]) == {}
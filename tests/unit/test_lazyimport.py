@@ -0,0 +1,83 @@
+"""Pytests."""
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+from jsonschematordf.lazyimport import lazy_import
+
+HEAVY_DEPENDENCIES = [
+    "datacatalogtordf",
+    "importlib.metadata",
+    "modelldcatnotordf",
+    "rdflib",
+    "yaml",
+]
+
+
+@pytest.mark.unit
+def test_lazy_module_is_imported_on_attribute_access() -> None:
+    """Test that lazy modules are imported when an attribute is first accessed."""
+    module = lazy_import("json.tool")
+
+    assert sys.modules["json.tool"] is module
+    assert callable(module.main)
+    assert type(module) is ModuleType
+
+
+@pytest.mark.unit
+def test_lazy_submodule_does_not_load_parent_package() -> None:
+    """Test that parent packages are loaded lazily, and get the submodule."""
+    script = (
+        "import sys\n"
+        "from jsonschematordf.lazyimport import lazy_import\n"
+        "module = lazy_import('xml.dom.minidom')\n"
+        "print('xml.dom' in sys.modules, 'xml.dom.minicompat' in sys.modules)\n"
+        "module.parseString\n"
+        "import xml.dom\n"
+        "print(xml.dom.minidom is module, 'xml.dom.minicompat' in sys.modules)\n"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == ["True False", "True True"]
+
+
+@pytest.mark.unit
+def test_imported_module_is_returned() -> None:
+    """Test that modules imported already are returned as is."""
+    assert lazy_import("json") is sys.modules["json"]
+
+
+@pytest.mark.unit
+def test_import_of_parse_does_not_load_heavy_dependencies() -> None:
+    """Benchmark import of parse module, which must not load heavy dependencies.
+
+    Lazily loaded modules are in sys.modules, but are only ordinary modules once
+    they are loaded.
+    """
+    script = (
+        "import sys, time, types\n"
+        "start = time.perf_counter()\n"
+        "import jsonschematordf.parse\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(m for m in {HEAVY_DEPENDENCIES!r}"
+        " if type(sys.modules.get(m)) is types.ModuleType))\n"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_time, loaded_dependencies = result.stdout.splitlines()
+
+    assert loaded_dependencies == ""
+    assert float(import_time) < 1.0
@@ -0,0 +1,71 @@
+"""Pytests."""
+import pytest
+
+from jsonschematordf.lazyjson import LazyJsonObject, load_lazy_json, materialize
+
+
+@pytest.mark.unit
+def test_navigates_members_lazily() -> None:
+    """Test that members are located without parsing and parsed on access."""
+    buffer = b' { "a": { "b": [1, { "c": "}\\"" }] }, "d\\u00e6": 1.5, "e": null } '
+
+    root = load_lazy_json(buffer)
+
+    assert isinstance(root, LazyJsonObject)
+    assert list(root) == ["a", "dæ", "e"]
+    assert len(root) == 3
+    assert isinstance(root["a"], LazyJsonObject)
+    assert root["a"] is root["a"]
+    assert root["a"]["b"] == [1, {"c": '}"'}]
+    assert root["dæ"] == 1.5
+    assert root["e"] is None
+    assert root.get("missing") is None
+
+
+@pytest.mark.unit
+def test_materialize() -> None:
+    """Test that lazy objects are parsed into dicts and other values returned."""
+    root = load_lazy_json(b'{"a": {"b": {}}, "c": []}')
+
+    assert materialize(root["a"]) == {"b": {}}
+    assert materialize(root["c"]) == []
+    assert materialize("value") == "value"
+
+
+@pytest.mark.unit
+def test_skipped_members_are_not_parsed() -> None:
+    """Test that members that are never accessed are not parsed."""
+    root = load_lazy_json(b'{"a": [1, 2 3], "b": {"c": true}}')
+
+    assert root["b"]["c"] is True
+    with pytest.raises(ValueError):
+        root["a"]
+
+
+@pytest.mark.unit
+def test_empty_and_non_object_documents() -> None:
+    """Test that empty objects are loaded and non-objects return None."""
+    empty = load_lazy_json(b"{ }")
+
+    assert empty is not None
+    assert len(empty) == 0
+    assert load_lazy_json(b"[]") is None
+    assert load_lazy_json(b"a: b") is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "buffer",
+    [b'{"a" 1}', b'{"a": 1 "b": 2}', b"{1: 2}", b'{"a": }', b'{"a": {"b": 1}'],
+)
+def test_malformed_documents_raise_value_error(buffer: bytes) -> None:
+    """Test that malformed objects raise ValueError when scanned."""
+    with pytest.raises(ValueError):
+        list(load_lazy_json(buffer))
+
+
+@pytest.mark.unit
+def test_yaml_flow_mappings_are_rejected_when_loaded() -> None:
+    """Test that YAML flow mappings raise ValueError before they are used."""
+    with pytest.raises(ValueError):
+        load_lazy_json(b"{ 'Element': { 'type': 'object' } }")
@@ -15,8 +15,10 @@ import pytest
 from pytest_mock import MockerFixture
 from rdflib.graph import Graph
 
+from jsonschematordf.codelistregistry import CodeListRegistry
 from jsonschematordf.component import Component
 import jsonschematordf.modelldcatnofactory as modelldcatno_factory
+from jsonschematordf.typeregistry import DEFAULT_TYPE_REGISTRY
 from jsonschematordf.types.constants import TYPE_DEFINITION_REFERENCE
 from jsonschematordf.types.enums import (
     CODE_LIST,
@@ -206,6 +208,7 @@ def test_resolve_component_reference_resolves_recursive_reference(
     """Returns result of recursive reference resolution."""
     mock_reference = mocker.MagicMock()
     mock_schema = mocker.MagicMock()
+    mock_schema.get_reference_target.return_value = (mock_schema, mock_reference)
     expected = "identifier"
 
     mocker.patch(
@@ -229,6 +232,7 @@ def test_resolve_component_reference_resolves_external_reference(
     """Returns URI of external reference."""
     mock_reference = mocker.MagicMock()
     mock_schema = mocker.MagicMock()
+    mock_schema.get_reference_target.return_value = (mock_schema, mock_reference)
 
     mocker.patch(
         "jsonschematordf.modelldcatnofactory.determine_reference_type",
@@ -245,11 +249,7 @@ def test_resolve_component_reference_returns_none(mocker: MockerFixture) -> None
     """Returns None if reference cannot be resolved."""
     mock_reference = mocker.MagicMock()
     mock_schema = mocker.MagicMock()
-
-    mocker.patch(
-        "jsonschematordf.modelldcatnofactory.determine_reference_type",
-        return_value="None",
-    )
+    mock_schema.get_reference_target.return_value = None
     assert (
         modelldcatno_factory._resolve_component_reference(mock_reference, mock_schema)
         is None
@@ -392,6 +392,7 @@ def test_invalid_component_returns_no_element_or_property(
 ) -> None:
     """Test that empty component returns no element or property."""
     mock_schema = mocker.MagicMock()
+    mock_schema.type_registry = DEFAULT_TYPE_REGISTRY
     mocker.patch.object(mock_schema, "get_parsed_component_uri", return_value=None)
 
     mock_component = mocker.MagicMock()
@@ -422,48 +423,19 @@ def test_invalid_component_returns_no_element_or_property(
 
 
 @pytest.mark.unit
-def test_determine_ref_type_returns_correct_type_of_ref(mocker: MockerFixture) -> None:
-    """Test that reference type is correctly returned."""
-    mock_component = mocker.MagicMock(spec=Component)
-    mock_component.type = "string"
-    mock_component.items = None
-    mock_component.ref = None
-    mock_component.specializes = None
-    mock_component.one_of = None
-    mock_component.enum = None
-    mock_component.properties = None
-
-    mocker.patch(
-        "jsonschematordf.modelldcatnofactory.determine_reference_type",
-        return_value=RECURSIVE_REFERENCE,
-    )
-
-    mock_schema = mocker.MagicMock()
-    mocker.patch.object(
-        mock_schema, "get_components_by_path", return_value=[mock_component]
-    )
-
-    assert modelldcatno_factory._determine_ref_type("test", mock_schema) == SIMPLE_TYPE
-
-
-@pytest.mark.unit
-def test_determine_ref_type_returns_object_if_external(mocker: MockerFixture) -> None:
-    """Test that reference type is correctly returned."""
-    mock_component = mocker.MagicMock(spec=Component)
-    mock_component.type = "string"
-    mock_component.ref = None
-
-    mocker.patch(
-        "jsonschematordf.modelldcatnofactory.determine_reference_type",
-        return_value=EXTERNAL_REFERENCE,
-    )
+def test_determine_component_type_uses_type_of_ref(mocker: MockerFixture) -> None:
+    """Test that type of referenced component is resolved by the schema."""
+    component = Component(["#"], ref="#/A")
 
     mock_schema = mocker.MagicMock()
+    mock_schema.get_reference_type.return_value = EXTERNAL_REFERENCE
+    mock_schema.type_registry = DEFAULT_TYPE_REGISTRY
 
     assert (
-        modelldcatno_factory._determine_ref_type("test", mock_schema)
+        modelldcatno_factory._determine_component_type(component, mock_schema)
         == EXTERNAL_REFERENCE
     )
+    mock_schema.get_reference_type.assert_called_once_with("#/A")
 
 
 @pytest.mark.unit
@@ -621,7 +593,9 @@ def test_creates_valid_primitive_simple_type(mocker: MockerFixture) -> None:
     mock_component.format = None
 
     mock_schema = mocker.MagicMock()
+    mock_schema.type_registry = DEFAULT_TYPE_REGISTRY
     mocker.patch.object(mock_schema, "create_identifier", return_value=identifier)
+    mocker.patch.object(mock_schema, "get_primitive_simple_type", return_value=None)
 
     expected = SimpleType(identifier)
     expected.identifier = identifier
@@ -653,6 +627,7 @@ def test_create_code_list(mocker: MockerFixture) -> None:
     mock_component.enum = enum
 
     mock_schema = mocker.MagicMock()
+    mock_schema.code_list_registry = None
     add_orphan_mock = mocker.patch.object(mock_schema, "add_orphan_elements")
 
     expected = CodeList(identifier)
@@ -674,6 +649,32 @@ def test_create_code_list(mocker: MockerFixture) -> None:
     add_orphan_mock.assert_called_once_with(enum)
 
 
+@pytest.mark.unit
+def test_create_code_list_refers_to_shared_code_list(mocker: MockerFixture) -> None:
+    """Code Lists of enum values already in the code list registry are shared."""
+    enum = ["1", "2", "3"]
+    shared_identifier = "http://uri.com/#shared"
+
+    code_list_registry = CodeListRegistry()
+    code_list_registry.add_code_list(list(reversed(enum)), shared_identifier)
+
+    mock_component = mocker.MagicMock()
+    mock_component.identifier = "http://uri.com/#identifier"
+    mock_component.complete_path = "/#identifier"
+    mock_component.enum = enum
+
+    mock_schema = mocker.MagicMock()
+    mock_schema.code_list_registry = code_list_registry
+
+    actual = modelldcatno_factory._create_code_list(mock_component, mock_schema)
+
+    assert actual == shared_identifier
+    mock_schema.add_parsed_identifier.assert_called_once_with(
+        "/#identifier", shared_identifier
+    )
+    mock_schema.add_orphan_elements.assert_not_called()
+
+
 @pytest.mark.unit
 def test_create_code_element(mocker: MockerFixture) -> None:
     """Test that Code Elements are correctly created."""
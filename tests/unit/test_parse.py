@@ -1,12 +1,23 @@
 """Pytests."""
+from pathlib import Path
 from typing import Dict, List
 
 import pytest
 from pytest_mock.plugin import MockerFixture
+from rdflib import Graph, Literal, URIRef
 
+from jsonschematordf.codelistregistry import CodeListRegistry
+from jsonschematordf.component import AbstractComponent
+from jsonschematordf.graphdelta import GraphDelta
 from jsonschematordf.parse import (
+    json_schema_bundle_to_graph,
+    json_schema_bundle_to_modelldcatno,
     json_schema_component_to_modelldcatno,
+    json_schema_definitions_to_modelldcatno,
+    json_schema_file_to_graph,
+    json_schema_file_to_modelldcatno,
     json_schema_to_graph,
+    json_schema_to_graph_delta,
     json_schema_to_modelldcatno,
 )
 from jsonschematordf.parsedschema import ParsedSchema
@@ -26,7 +37,8 @@ def test_json_schema_to_graph(mocker: MockerFixture) -> None:
         return_value=([mocker.MagicMock()], [mocker.MagicMock()]),
     )
     graph_mock = mocker.patch(
-        "jsonschematordf.parse.add_elements_to_graph", return_value=graph_mock_output
+        "jsonschematordf.parse.add_elements_to_graph",
+        return_value=graph_mock_output,
     )
 
     actual = json_schema_to_graph(json_schema_string, base_uri)
@@ -36,6 +48,75 @@ def test_json_schema_to_graph(mocker: MockerFixture) -> None:
     graph_mock.assert_called_once()
 
 
+@pytest.mark.unit
+def test_json_schema_to_graph_delta(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test that only changed statements are part of delta."""
+    json_schema_string = "{ 'Element': { 'type': 'object' } }"
+    base_uri = "http://uri.com"
+    kept = "<http://a> <http://b> <http://c> ."
+    added = "<http://a> <http://b> <http://d> ."
+    removed = "<http://a> <http://b> <http://e> ."
+
+    previous = tmp_path / "previous.nt"
+    previous.write_text(f"{kept}\n{removed}\n", encoding="utf-8")
+
+    mocker.patch("jsonschematordf.parse.json_schema_to_graph")
+    mocker.patch("jsonschematordf.parse.graph_to_ntriples", return_value={kept, added})
+
+    actual = json_schema_to_graph_delta(json_schema_string, base_uri, str(previous))
+
+    assert actual == GraphDelta([added], [removed])
+
+
+@pytest.mark.unit
+def test_graph_delta_to_sparql_update() -> None:
+    """Test that SPARQL Update request contains additions and removals."""
+    added = "<http://a> <http://b> <http://d> ."
+    removed = "<http://a> <http://b> <http://e> ."
+
+    update = GraphDelta([added], [removed]).to_sparql_update("http://graph.com")
+
+    assert update == (
+        f"DELETE DATA {{ GRAPH <http://graph.com> {{\n{removed}\n}} }};\n"
+        f"INSERT DATA {{ GRAPH <http://graph.com> {{\n{added}\n}} }}"
+    )
+
+
+@pytest.mark.unit
+def test_graph_delta_defaults_are_not_shared() -> None:
+    """Test that every GraphDelta gets lists of its own."""
+    delta = GraphDelta()
+    delta.additions.append("<http://a> <http://b> <http://c> .")
+
+    assert GraphDelta() == GraphDelta([], [])
+
+
+@pytest.mark.unit
+def test_json_schema_to_graph_delta_ignores_renamed_skolems(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test that parts equal apart from their skolem IRIs are not part of delta."""
+    json_schema_string = "{ 'Element': { 'type': 'object' } }"
+    base_uri = "http://uri.com"
+    kept = "<http://a> <http://b> <http://uri.com/.well-known/skolem/{}> ."
+    changed = '<http://uri.com/.well-known/skolem/{}> <http://b> "{}" .'
+
+    previous = tmp_path / "previous.nt"
+    previous.write_text(
+        f"{kept.format(1)}\n{changed.format(2, 'x')}\n", encoding="utf-8"
+    )
+
+    mocker.patch("jsonschematordf.parse.json_schema_to_graph")
+    mocker.patch(
+        "jsonschematordf.parse.graph_to_ntriples",
+        return_value={kept.format(3), changed.format(4, "y")},
+    )
+
+    actual = json_schema_to_graph_delta(json_schema_string, base_uri, str(previous))
+
+    assert actual == GraphDelta([changed.format(4, "y")], [changed.format(2, "x")])
+
+
 @pytest.mark.unit
 def test_json_schema_to_modelldcatno(mocker: MockerFixture) -> None:
     """Test that components are parsed."""
@@ -53,6 +134,7 @@ def test_json_schema_to_modelldcatno(mocker: MockerFixture) -> None:
         "jsonschematordf.parse.json_schema_component_to_modelldcatno",
         return_value=parsed_schema_mock,
     )
+    mocker.patch("jsonschematordf.parse.is_flat_schema", return_value=False)
 
     model_elements, orphan_elements = json_schema_to_modelldcatno(
         json_schema_string, base_uri
@@ -116,3 +198,220 @@ def test_json_schema_component_to_modelldcatno_returns_empty() -> None:
     parsed_schema = json_schema_component_to_modelldcatno(schema, path)
 
     assert ParsedSchema() == parsed_schema
+
+
+@pytest.mark.unit
+def test_json_schema_bundle_to_graph(mocker: MockerFixture) -> None:
+    """Test that bundle components are parsed and added to graph."""
+    documents = {"http://uri.com/a.json": "{ 'Element': { 'type': 'object' } }"}
+
+    triple = (URIRef("http://uri.com/a"), URIRef("http://uri.com/b"), Literal("c"))
+    document_graph = Graph()
+    document_graph.add(triple)
+
+    parse_mock = mocker.patch(
+        "jsonschematordf.parse._parse_bundle",
+        return_value=[ParsedSchema([mocker.MagicMock()], [mocker.MagicMock()])],
+    )
+    graph_mock = mocker.patch(
+        "jsonschematordf.parse.add_elements_to_graph",
+        return_value=document_graph,
+    )
+
+    actual = json_schema_bundle_to_graph(documents)
+
+    assert set(actual) == {triple}
+    parse_mock.assert_called_once()
+    graph_mock.assert_called_once()
+
+
+@pytest.mark.unit
+def test_json_schema_bundle_to_modelldcatno(mocker: MockerFixture) -> None:
+    """Test that root elements of all documents are parsed with shared registry."""
+    documents = {
+        "http://uri.com/a.json": "{ 'A': { 'type': 'object' } }",
+        "http://uri.com/b.json": "{ 'B': { 'type': 'object' } }",
+        "http://uri.com/c.json": "",
+    }
+
+    mock_element = mocker.MagicMock()
+    parsed_schema_mock = mocker.MagicMock()
+    parsed_schema_mock.model_elements = [mock_element]
+
+    parse_mock = mocker.patch(
+        "jsonschematordf.parse.json_schema_component_to_modelldcatno",
+        return_value=parsed_schema_mock,
+    )
+
+    model_elements, orphan_elements = json_schema_bundle_to_modelldcatno(documents)
+
+    assert model_elements == [mock_element, mock_element]
+    assert orphan_elements == []
+    schemas = [call.args[0] for call in parse_mock.call_args_list]
+    assert [schema.base_uri for schema in schemas] == [
+        "http://uri.com/a.json",
+        "http://uri.com/b.json",
+    ]
+    assert schemas[0].get_referenced_schema("b.json#/B") == (schemas[1], "#/B")
+
+
+@pytest.mark.unit
+def test_json_schema_component_to_modelldcatno_returns_new_orphans(
+    mocker: MockerFixture,
+) -> None:
+    """Test that only orphans created while parsing the component are returned."""
+    schema = Schema("http://uri.com", {"Element": {"type": "object"}})
+    previous_orphan = mocker.MagicMock()
+    new_orphan = mocker.MagicMock()
+    schema.add_orphan_elements([previous_orphan])
+
+    def create_model_element(
+        component: AbstractComponent, schema: Schema
+    ) -> AbstractComponent:
+        schema.add_orphan_elements([new_orphan])
+        return component
+
+    mocker.patch(
+        "jsonschematordf.parse.create_model_element",
+        side_effect=create_model_element,
+    )
+
+    _, orphan_elements = json_schema_component_to_modelldcatno(schema, ["Element"])
+
+    assert orphan_elements == [new_orphan]
+
+
+@pytest.mark.unit
+def test_json_schema_definitions_to_modelldcatno(mocker: MockerFixture) -> None:
+    """Test that definitions and their reference closure are parsed."""
+    json_schema_dict = {
+        "$defs": {
+            "A": {"$ref": "#/$defs/B"},
+            "B": {"type": "object"},
+            "C": {"type": "object"},
+        }
+    }
+    schema = Schema("http://uri.com", json_schema_dict)
+
+    parsed_schema_mock = mocker.MagicMock()
+    parsed_schema_mock.model_elements = [mocker.MagicMock()]
+    parsed_schema_mock.orphan_elements = [mocker.MagicMock()]
+
+    parse_mock = mocker.patch(
+        "jsonschematordf.parse.json_schema_component_to_modelldcatno",
+        return_value=parsed_schema_mock,
+    )
+
+    model_elements, orphan_elements = json_schema_definitions_to_modelldcatno(
+        schema, ["/$defs/A"]
+    )
+
+    assert [call.args[1] for call in parse_mock.call_args_list] == [
+        ["$defs", "A"],
+        ["$defs", "B"],
+    ]
+    assert len(model_elements) == 2
+    assert len(orphan_elements) == 2
+
+
+@pytest.mark.unit
+def test_json_schema_file_to_graph(mocker: MockerFixture) -> None:
+    """Test that file components are parsed and added to graph."""
+    graph_mock_output = mocker.MagicMock()
+
+    parse_mock = mocker.patch(
+        "jsonschematordf.parse.json_schema_file_to_modelldcatno",
+        return_value=([mocker.MagicMock()], [mocker.MagicMock()]),
+    )
+    graph_mock = mocker.patch(
+        "jsonschematordf.parse.add_elements_to_graph",
+        return_value=graph_mock_output,
+    )
+
+    actual = json_schema_file_to_graph("schema.json", "http://uri.com")
+
+    assert actual == graph_mock_output
+    parse_mock.assert_called_once()
+    graph_mock.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content", ['{ "Element": { "type": "object" } }', "Element:\n  type: object\n"]
+)
+def test_json_schema_file_to_modelldcatno(
+    mocker: MockerFixture, tmp_path: Path, content: str
+) -> None:
+    """Test that root elements of JSON and YAML files are parsed."""
+    file_path = tmp_path / "schema.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    parsed_schema_mock = mocker.MagicMock()
+    parsed_schema_mock.model_elements = [mocker.MagicMock()]
+    parsed_schema_mock.orphan_elements = []
+
+    parse_mock = mocker.patch(
+        "jsonschematordf.parse.json_schema_component_to_modelldcatno",
+        return_value=parsed_schema_mock,
+    )
+    mocker.patch("jsonschematordf.parse.is_flat_schema", return_value=False)
+
+    model_elements, _ = json_schema_file_to_modelldcatno(
+        str(file_path), "http://uri.com"
+    )
+
+    assert model_elements == parsed_schema_mock.model_elements
+    assert parse_mock.call_args.args[1] == ["Element"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", ["", "[]"])
+def test_json_schema_file_to_modelldcatno_returns_empty(
+    tmp_path: Path, content: str
+) -> None:
+    """Test that empty ParsedSchema is returned for empty or non-object files."""
+    file_path = tmp_path / "schema.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    parsed_schema = json_schema_file_to_modelldcatno(str(file_path), "http://uri.com")
+
+    assert ParsedSchema() == parsed_schema
+
+
+@pytest.mark.unit
+def test_single_root_group_is_parsed_with_schema_built_once(
+    mocker: MockerFixture,
+) -> None:
+    """Test that schemas without independent root groups are not built again."""
+    json_schema_string = (
+        '{"A": {"type": "object", "properties": {"b": {"$ref": "#/A"}}}}'
+    )
+    schema_mock = mocker.patch("jsonschematordf.parse.Schema", wraps=Schema)
+    executor_mock = mocker.patch("jsonschematordf.parse.futures.ProcessPoolExecutor")
+
+    model_elements, _ = json_schema_to_modelldcatno(
+        json_schema_string, "http://uri.com", max_workers=2
+    )
+
+    assert len(model_elements) == 1
+    schema_mock.assert_called_once()
+    executor_mock.assert_not_called()
+
+
+@pytest.mark.unit
+def test_code_list_registry_disables_worker_processes(mocker: MockerFixture) -> None:
+    """Test that conversion sharing code lists runs in a single process."""
+    json_schema_string = '{"A": {"type": "object"}, "B": {"type": "object"}}'
+    shared_mock = mocker.patch(
+        "jsonschematordf.parse._shared_json_schema_to_modelldcatno"
+    )
+
+    model_elements, _ = json_schema_to_modelldcatno(
+        json_schema_string,
+        "http://uri.com",
+        max_workers=2,
+        code_list_registry=CodeListRegistry(),
+    )
+
+    assert len(model_elements) == 2
+    shared_mock.assert_not_called()
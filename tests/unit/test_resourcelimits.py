@@ -0,0 +1,119 @@
+"""Pytests."""
+import time
+
+import pytest
+import yaml
+
+from jsonschematordf.exceptions import ResourceLimitError
+from jsonschematordf.resourcelimits import (
+    load_json_schema_buffer,
+    load_json_schema_string,
+    ResourceLimits,
+)
+from jsonschematordf.schema import Schema
+
+YAML_SCHEMA = """
+Element:
+  type: object
+  properties:
+    a: &string
+      type: string
+    b: *string
+"""
+
+
+def _create_alias_bomb(levels: int) -> str:
+    """Create YAML document whose aliases expand nine times per level."""
+    lines = ['a0: &a0 ["lol", "lol", "lol", "lol", "lol", "lol", "lol", "lol", "lol"]']
+    for level in range(1, levels):
+        aliases = ", ".join([f"*a{level - 1}"] * 9)
+        lines.append(f"a{level}: &a{level} [{aliases}]")
+    return "\n".join(lines)
+
+
+@pytest.mark.unit
+def test_load_without_limits_is_safe_load() -> None:
+    """Test that documents are loaded as by yaml.safe_load without limits."""
+    assert load_json_schema_string(YAML_SCHEMA) == yaml.safe_load(YAML_SCHEMA)
+    assert load_json_schema_string(
+        YAML_SCHEMA, ResourceLimits(1000, 10, 10)
+    ) == yaml.safe_load(YAML_SCHEMA)
+
+
+@pytest.mark.unit
+def test_alias_bomb_is_rejected_while_loading() -> None:
+    """Test that aliases expanding to too many nodes are rejected quickly."""
+    start = time.perf_counter()
+
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_string(
+            _create_alias_bomb(10), ResourceLimits(max_alias_expansions=100000)
+        )
+
+    assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.unit
+def test_recursive_alias_is_rejected() -> None:
+    """Test that aliases of nodes containing themselves are rejected."""
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_string("a: &a [*a]", ResourceLimits())
+
+
+@pytest.mark.unit
+def test_size_and_depth_are_limited() -> None:
+    """Test that oversized and deeply nested documents are rejected."""
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_string('{"A": "ø"}', ResourceLimits(max_bytes=10))
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_string(b'{"A": "a"}', ResourceLimits(max_bytes=9))
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_string("[" * 10000 + "]" * 10000, ResourceLimits(max_depth=50))
+
+
+@pytest.mark.unit
+def test_schema_limits_component_count_and_depth() -> None:
+    """Test that schemas stop building components when limits are exceeded."""
+    json_schema = {
+        "A": {"properties": {f"p{i}": {"type": "string"} for i in range(10)}}
+    }
+    nested_schema: dict = {"type": "string"}
+    for _ in range(20):
+        nested_schema = {"properties": {"p": nested_schema}}
+
+    with pytest.raises(ResourceLimitError):
+        Schema(
+            "http://uri.com", json_schema, limits=ResourceLimits(max_components=5)
+        ).get_components_by_path("#/A")
+    with pytest.raises(ResourceLimitError):
+        Schema(
+            "http://uri.com", {"A": nested_schema}, limits=ResourceLimits(max_depth=10)
+        ).get_components_by_path("#/A")
+    assert Schema(
+        "http://uri.com", json_schema, limits=ResourceLimits(max_components=11)
+    ).get_components_by_path("#/A")
+
+
+@pytest.mark.unit
+def test_buffer_depth_is_limited_while_scanned() -> None:
+    """Test that deeply nested JSON buffers are rejected before they are parsed."""
+    deep_schema = b'{"A": ' + b'{"items": ' * 600 + b"{}" + b"}" * 601
+
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_buffer(deep_schema, ResourceLimits(max_depth=50))
+    with pytest.raises(ResourceLimitError):
+        load_json_schema_buffer(b"A: [[[[1]]]]", ResourceLimits(max_depth=3))
+    assert list(load_json_schema_buffer(deep_schema)) == ["A"]
+
+
+@pytest.mark.unit
+def test_component_depth_is_limited_before_children_are_created() -> None:
+    """Test that deeply nested components are rejected instead of recursing."""
+    nested_schema: dict = {"type": "string"}
+    for _ in range(600):
+        nested_schema = {"oneOf": [nested_schema]}
+
+    with pytest.raises(ResourceLimitError):
+        Schema(
+            "http://uri.com", {"A": nested_schema}, limits=ResourceLimits(max_depth=50)
+        ).get_components_by_path("#/A")
@@ -5,8 +5,10 @@ import pytest
 from pytest_mock import MockerFixture
 
 
-from jsonschematordf.component import Component
+from jsonschematordf.component import AbstractComponent
+from jsonschematordf.exceptions import ConversionTimeoutError, CyclicReferenceWarning
 from jsonschematordf.schema import Schema
+from jsonschematordf.schemaregistry import SchemaRegistry
 
 
 @pytest.mark.unit
@@ -43,7 +45,7 @@ def test_recursive_path_returns_component() -> None:
     assert len(components) == 1
 
     component = components[0]
-    assert isinstance(component, Component)
+    assert isinstance(component, AbstractComponent)
     assert component.title == {None: component_title}
     assert component.type == component_type[0]
 
@@ -150,7 +152,7 @@ def test_create_invalid_identifier_returns_skolemized_identifier(
 
     expected = "skolemized_id"
     skolemizer_mock = mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization", return_value=expected,
+        "jsonschematordf.schema.Schema.create_skolemization", return_value=expected,
     )
     actual = schema.create_identifier(component_path)
 
@@ -165,10 +167,297 @@ def test_no_path_returns_skolemized_identifier(mocker: MockerFixture) -> None:
 
     expected = "skolemized_id"
     skolemizer_mock = mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization", return_value=expected,
+        "jsonschematordf.schema.Schema.create_skolemization", return_value=expected,
     )
 
     actual = schema.create_identifier(None)
 
     assert expected == actual
     skolemizer_mock.assert_called_once
+
+
+@pytest.mark.unit
+def test_get_root_paths() -> None:
+    """Test that top-level members are root elements by default."""
+    schema = Schema("https://uri.com", {"A": {}, "B": {}})
+
+    assert schema.get_root_paths() == [["A"], ["B"]]
+
+
+@pytest.mark.unit
+def test_get_root_paths_with_root_selectors() -> None:
+    """Test that members of selected objects are root elements."""
+    json_schema = {
+        "paths": {"/path": {}},
+        "components": {"schemas": {"A": {}, "B": {}}},
+        "$defs": {"a/b": {}},
+        "invalid": "scalar",
+    }
+    schema = Schema("https://uri.com", json_schema)
+
+    root_paths = schema.get_root_paths(
+        ["/components/schemas", "/$defs", "/invalid", "/missing"]
+    )
+
+    assert root_paths == [
+        ["components", "schemas", "A"],
+        ["components", "schemas", "B"],
+        ["$defs", "a/b"],
+    ]
+
+
+@pytest.mark.unit
+def test_get_referenced_schema(mocker: MockerFixture) -> None:
+    """Test that references are resolved through registry relative to base URI."""
+    base_uri = "https://uri.com/a.json"
+    registry = mocker.MagicMock()
+    resolved = (mocker.MagicMock(), "#/B")
+    registry.resolve_reference.return_value = resolved
+    registry.load_document.return_value = None
+
+    schema = Schema(base_uri, {}, registry)
+
+    assert schema.get_referenced_schema("b.json#/B") == resolved
+    registry.resolve_reference.assert_called_once_with(base_uri, "b.json#/B")
+    assert Schema(base_uri, {}).get_referenced_schema("b.json#/B") is None
+
+
+@pytest.mark.unit
+def test_get_referenced_schema_loads_external_document(mocker: MockerFixture) -> None:
+    """Test that external documents are loaded and registered before resolution."""
+    resolver = mocker.MagicMock()
+    resolver.resolve.return_value = {"B": {"type": "object"}}
+    registry = SchemaRegistry(resolver)
+
+    schema = Schema("https://uri.com/a.json", {}, registry)
+    referenced_schema, local_reference = schema.get_referenced_schema("b.json#/B")
+
+    assert referenced_schema.base_uri == "https://uri.com/b.json"
+    assert referenced_schema.get_root_paths() == [["B"]]
+    assert local_reference == "#/B"
+    assert registry.schemas == [schema, referenced_schema]
+
+
+@pytest.mark.unit
+def test_escaped_and_array_paths_return_components() -> None:
+    """Test that escaped, percent-encoded and array references are resolved."""
+    base_uri = "https://uri.com"
+    json_schema = {
+        "definitions": {
+            "a/b c": {"type": "string"},
+            "d": {"allOf": [{"type": "object"}]},
+        }
+    }
+
+    schema = Schema(base_uri, json_schema)
+
+    escaped = schema.get_components_by_path("#/definitions/a~1b%20c")
+    array = schema.get_components_by_path("#/definitions/d/allOf/0")
+
+    assert len(escaped) == 1
+    assert escaped[0].title == {None: "a/b c"}
+    assert escaped[0].path == ["#", "definitions"]
+    assert len(array) == 1
+    assert array[0].type == "object"
+    assert array[0].path == ["#", "definitions", "d", "allOf"]
+    assert schema.get_components_by_path("#") == []
+
+
+@pytest.mark.unit
+def test_get_reference_closure() -> None:
+    """Test that transitively referenced definitions are included once."""
+    json_schema = {
+        "$defs": {
+            "A": {"properties": {"b": {"$ref": "#/$defs/B"}}},
+            "B": {"oneOf": [{"$ref": "#/$defs/C"}, {"$ref": "#/$defs/A"}]},
+            "C": {"items": {"$ref": "http://uri.com/external"}},
+            "D": {"$ref": "#/$defs/A"},
+        }
+    }
+    schema = Schema("https://uri.com", json_schema)
+
+    closure = schema.get_reference_closure([["$defs", "A"]])
+
+    assert closure == [["$defs", "A"], ["$defs", "B"], ["$defs", "C"]]
+
+
+@pytest.mark.unit
+def test_get_independent_root_groups() -> None:
+    """Test that roots sharing referenced definitions are grouped together."""
+    json_schema = {
+        "$defs": {
+            "A": {"properties": {"b": {"$ref": "#/$defs/B"}}},
+            "B": {"type": "string"},
+            "C": {"items": {"$ref": "#/shared/S"}},
+            "D": {"type": "object"},
+            "E": {"$ref": "#/shared/S/properties/s"},
+            "F": {"$ref": "http://uri.com/external#/F"},
+            "G": {"$ref": "http://uri.com/external#/G"},
+        },
+        "shared": {"S": {"properties": {"s": {"type": "string"}}}},
+    }
+    schema = Schema("https://uri.com", json_schema)
+
+    groups = schema.get_independent_root_groups(schema.get_root_paths(["/$defs"]))
+
+    assert groups == [
+        [["$defs", "A"], ["$defs", "B"]],
+        [["$defs", "C"], ["$defs", "E"]],
+        [["$defs", "D"]],
+        [["$defs", "F"]],
+        [["$defs", "G"]],
+    ]
+
+
+@pytest.mark.unit
+def test_get_independent_root_groups_joins_external_documents_in_registry() -> None:
+    """Test that roots referencing the same registry document are grouped together."""
+    json_schema = {
+        "F": {"$ref": "external.json#/F"},
+        "G": {"$ref": "http://uri.com/external.json#/G"},
+        "H": {"type": "string"},
+    }
+    schema = Schema("http://uri.com/schema.json", json_schema, SchemaRegistry())
+
+    groups = schema.get_independent_root_groups(schema.get_root_paths())
+
+    assert groups == [[["F"], ["G"]], [["H"]]]
+
+
+@pytest.mark.unit
+def test_components_are_stored_once_per_path() -> None:
+    """Test that components are created in the component table once per path."""
+    json_schema = {"A": {"type": "object", "properties": {"b": {"type": "string"}}}}
+    schema = Schema("https://uri.com", json_schema)
+
+    first = schema.get_components_by_path("#/A")
+    second = schema.get_components_by_path("#/A")
+
+    assert first == second
+    assert first[0] is not second[0]
+    assert len(schema.component_table) == 2
+
+
+@pytest.mark.unit
+def test_get_component_type_resolves_references() -> None:
+    """Test that component types are resolved through referenced components."""
+    json_schema = {
+        "A": {"$ref": "#/B"},
+        "B": {"type": "string", "format": "date"},
+        "C": {"type": "array", "items": {"$ref": "#/D"}},
+        "D": {"properties": {"d": {"type": "string"}}},
+        "E": {"$ref": "#/F"},
+        "F": {"$ref": "#/E"},
+    }
+    schema = Schema("https://uri.com", json_schema)
+
+    with pytest.warns(CyclicReferenceWarning):
+        types = [
+            schema.get_component_type(schema.get_components_by_path(f"#/{title}")[0])
+            for title in json_schema
+        ]
+
+    assert types == [
+        "simple_type",
+        "simple_type",
+        "object_array",
+        "object_type",
+        None,
+        None,
+    ]
+    assert schema.get_reference_type("#/B") == "simple_type"
+    assert schema.get_reference_type("http://uri.com/external") == "external_reference"
+
+
+@pytest.mark.unit
+def test_get_reference_target_follows_and_compresses_reference_chains() -> None:
+    """Test that reference chains resolve to their final target."""
+    json_schema = {f"A{index}": {"$ref": f"#/A{index + 1}"} for index in range(5000)}
+    json_schema["A5000"] = {"type": "string"}
+    json_schema["B"] = {"$ref": "http://uri.com/external"}
+    schema = Schema("https://uri.com", json_schema)
+
+    assert schema.get_reference_target("#/A0") == (schema, "#/A5000")
+    assert schema.get_reference_target("#/A2500") == (schema, "#/A5000")
+    assert schema.get_reference_target("#/B") == (schema, "http://uri.com/external")
+    assert schema.get_reference_target("#/Missing") == (schema, "#/Missing")
+    assert schema.get_reference_target("invalid") is None
+    assert schema.get_reference_type("#/A0") == "simple_type"
+
+
+@pytest.mark.unit
+def test_cyclic_references_between_schemas_warn() -> None:
+    """Test that cyclic references between schemas produce warnings, not errors."""
+    registry = SchemaRegistry()
+    schema_a = Schema(
+        "http://uri.com/a.json",
+        {
+            "A": {"$ref": "b.json#/B"},
+            "X": {"type": "array", "items": {"$ref": "b.json#/Y"}},
+        },
+        registry,
+    )
+    Schema(
+        "http://uri.com/b.json",
+        {
+            "B": {"$ref": "a.json#/A"},
+            "Y": {"type": "array", "items": {"$ref": "a.json#/X"}},
+        },
+        registry,
+    )
+
+    with pytest.warns(CyclicReferenceWarning):
+        assert schema_a.get_reference_target("#/A") is None
+    with pytest.warns(CyclicReferenceWarning):
+        assert (
+            schema_a.get_component_type(schema_a.get_components_by_path("#/X")[0])
+            is None
+        )
+
+
+@pytest.mark.unit
+def test_check_deadline_raises_after_deadline(mocker: MockerFixture) -> None:
+    """Test that checking deadline raises only after the deadline has passed."""
+    mocker.patch("time.monotonic", return_value=10.0)
+
+    Schema("http://uri.com", {}).check_deadline()
+    Schema("http://uri.com", {}, deadline=10.0).check_deadline()
+    with pytest.raises(ConversionTimeoutError):
+        Schema("http://uri.com", {}, deadline=9.0).check_deadline()
+
+
+@pytest.mark.unit
+def test_invalidate_drops_components_of_subtree_and_referencing_components() -> None:
+    """Test that edited and transitively referencing components are created anew."""
+    document = {
+        "A": {"properties": {"b": {"$ref": "#/B"}}},
+        "B": {"properties": {"c": {"$ref": "#/C"}}},
+        "C": {"type": "string"},
+        "D": {"type": "object"},
+    }
+    schema = Schema("http://uri.com", document)
+    components = {key: schema.get_components_by_path_list([key])[0] for key in document}
+    for component in components.values():
+        component.identifier = schema.create_identifier(component.complete_path)
+        schema.add_parsed_component(component)
+
+    document["C"] = {"type": "object"}
+    dropped_paths = schema.invalidate("/C")
+
+    assert sorted(dropped_paths) == ["/#A", "/#B", "/#C"]
+    assert schema.get_parsed_component_uri("/#D") is not None
+    assert schema.get_components_by_path_list(["D"])[0] == components["D"]
+    new_c = schema.get_components_by_path_list(["C"])[0]
+    assert new_c.index != components["C"].index
+    assert new_c.type == "object"
+
+
+@pytest.mark.unit
+def test_create_skolemization_mints_skolem_under_base_uri() -> None:
+    """Test that skolemized identifiers are minted under the base URI."""
+    with_slash = Schema("http://uri.com/", {}).create_skolemization()
+    without_slash = Schema("http://uri.com", {}).create_skolemization()
+
+    assert with_slash.startswith("http://uri.com/.well-known/skolem/")
+    assert without_slash.startswith("http://uri.com/.well-known/skolem/")
+    assert with_slash != without_slash
@@ -0,0 +1,71 @@
+"""Pytests."""
+import pytest
+from pytest_mock import MockerFixture
+
+from jsonschematordf.documentresolver import MappingResolver
+from jsonschematordf.schema import Schema
+from jsonschematordf.schemaregistry import SchemaRegistry
+
+
+@pytest.mark.unit
+def test_registers_schema_by_base_uri() -> None:
+    """Test that schemas are registered by base URI without fragment."""
+    registry = SchemaRegistry()
+    schema = Schema("http://uri.com/a.json", {}, registry)
+
+    assert registry.get_schema("http://uri.com/a.json#/Element") is schema
+    assert registry.schemas == [schema]
+
+
+@pytest.mark.unit
+def test_resolves_relative_and_absolute_references() -> None:
+    """Test that relative and absolute references resolve to local references."""
+    registry = SchemaRegistry()
+    schema = Schema("http://uri.com/schemas/b.json", {}, registry)
+
+    base_uri = "http://uri.com/schemas/a.json"
+
+    assert registry.resolve_reference(base_uri, "b.json#/B") == (schema, "#/B")
+    assert registry.resolve_reference(
+        base_uri, "http://uri.com/schemas/b.json#/path/B"
+    ) == (schema, "#/path/B")
+
+
+@pytest.mark.unit
+def test_does_not_resolve_unknown_documents_or_missing_fragments() -> None:
+    """Test that unregistered documents and document references return None."""
+    registry = SchemaRegistry()
+    Schema("http://uri.com/b.json", {}, registry)
+
+    base_uri = "http://uri.com/a.json"
+
+    assert registry.resolve_reference(base_uri, "c.json#/C") is None
+    assert registry.resolve_reference(base_uri, "b.json") is None
+
+
+@pytest.mark.unit
+def test_loads_unregistered_document_with_resolver() -> None:
+    """Test that unregistered documents are loaded using the resolver."""
+    resolver = MappingResolver({"http://uri.com/b.json": "{ 'B': {} }"})
+    registry = SchemaRegistry(resolver)
+    base_uri = "http://uri.com/a.json"
+
+    assert registry.load_document(base_uri, "b.json#/B") == (
+        "http://uri.com/b.json",
+        {"B": {}},
+    )
+    assert registry.load_document(base_uri, "c.json#/C") is None
+    assert registry.load_document(base_uri, "b.json") is None
+
+
+@pytest.mark.unit
+def test_does_not_load_registered_or_without_resolver(mocker: MockerFixture) -> None:
+    """Test that registered documents are not loaded again."""
+    resolver = mocker.MagicMock()
+    registry = SchemaRegistry(resolver)
+    Schema("http://uri.com/b.json", {}, registry)
+    base_uri = "http://uri.com/a.json"
+
+    assert registry.load_document(base_uri, "b.json#/B") is None
+    assert SchemaRegistry().load_document(base_uri, "b.json#/B") is None
+    resolver.resolve.assert_not_called()
@@ -0,0 +1,62 @@
+"""Pytests."""
+import pytest
+
+from jsonschematordf.schemasession import SchemaSession
+
+
+@pytest.mark.unit
+def test_queries_return_only_new_elements() -> None:
+    """Test that elements returned by earlier queries are not returned again."""
+    document = {
+        "A": {"type": "object", "properties": {"b": {"$ref": "#/B"}}},
+        "B": {"type": "string", "enum": ["x", "y"]},
+        "C": {"type": "object"},
+    }
+    session = SchemaSession("http://uri.com", document)
+
+    first = session.to_modelldcatno("/B")
+    second = session.to_modelldcatno("/A")
+    repeated = session.to_modelldcatno("/B")
+    other = session.to_modelldcatno("/C")
+
+    assert [element.identifier for element in first.model_elements] == [
+        "http://uri.com/#B"
+    ]
+    assert len(first.orphan_elements) == 2
+    assert [element.identifier for element in second.model_elements] == [
+        "http://uri.com/#A"
+    ]
+    assert second.orphan_elements == []
+    assert repeated.model_elements == [] and repeated.orphan_elements == []
+    assert [element.identifier for element in other.model_elements] == [
+        "http://uri.com/#C"
+    ]
+
+
+@pytest.mark.unit
+def test_invalidate_returns_edited_elements_anew() -> None:
+    """Test that edited elements, and elements using them, are returned anew."""
+    document = {
+        "A": {"type": "object", "properties": {"b": {"$ref": "#/B"}}},
+        "B": {"type": "object", "properties": {"c": {"type": "string"}}},
+        "C": {"type": "object"},
+    }
+    session = SchemaSession("http://uri.com", document)
+    for pointer in ("/A", "/B", "/C"):
+        session.to_modelldcatno(pointer)
+
+    document["B"]["properties"]["d"] = {"type": "integer", "title": "D"}
+    session.invalidate("/B/properties/d")
+
+    edited = session.to_modelldcatno("/B")
+    referencing = session.to_modelldcatno("/A")
+    unaffected = session.to_modelldcatno("/C")
+
+    assert [element.identifier for element in edited.model_elements] == [
+        "http://uri.com/#B"
+    ]
+    assert len(edited.model_elements[0].has_property) == 2
+    assert [element.identifier for element in referencing.model_elements] == [
+        "http://uri.com/#A"
+    ]
+    assert unaffected.model_elements == []
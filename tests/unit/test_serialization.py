@@ -0,0 +1,88 @@
+"""Pytests."""
+import marshal
+import pickle
+
+from datacatalogtordf.uri import URI
+from modelldcatnotordf.modelldcatno import CodeElement, CodeList, ObjectType
+import pytest
+from rdflib.graph import Graph
+
+from jsonschematordf.component import Component
+from jsonschematordf.componentfactory import create_components
+from jsonschematordf.parsedschema import ParsedSchema
+from jsonschematordf.serialization import dumps, loads
+
+
+@pytest.mark.unit
+def test_component_tree_round_trip() -> None:
+    """Test that Component trees are restored by pickle and serialization."""
+    components = create_components(
+        ["#"],
+        {
+            "title": "A",
+            "type": "object",
+            "required": ["b"],
+            "properties": {
+                "b": {"type": "string", "enum": ["x", "y"]},
+                "c": {"type": "array", "items": {"$ref": "#/B"}},
+            },
+        },
+    )
+
+    assert loads(dumps(components)) == components
+    assert pickle.loads(pickle.dumps(components[0])) == components[0]
+
+
+@pytest.mark.unit
+def test_shared_elements_are_restored_once() -> None:
+    """Test that elements referenced twice are restored as one object."""
+    code_list = CodeList()
+    code_list.identifier = "http://uri.com/#list"
+    code_elements = []
+    for notation in ["x", "y"]:
+        code_element = CodeElement("http://uri.com/#" + notation)
+        code_element.notation = notation
+        code_element.in_scheme = [code_list]
+        code_elements.append(code_element)
+
+    restored_x, restored_y = loads(dumps(code_elements))
+
+    assert restored_x.in_scheme[0] is restored_y.in_scheme[0]
+    assert restored_x.notation == "x"
+    assert isinstance(restored_x.identifier, URI)
+
+
+@pytest.mark.unit
+def test_parsed_schema_pickle_omits_cached_graphs() -> None:
+    """Test that ParsedSchema is pickled without cached graphs of its elements."""
+    object_type = ObjectType()
+    object_type.identifier = "http://uri.com/#A"
+    object_type.title = {None: "A"}
+    parsed_schema = ParsedSchema([object_type], [])
+    expected = Graph().parse(data=object_type.to_rdf(), format="turtle")
+
+    restored = pickle.loads(pickle.dumps(parsed_schema))
+
+    assert isinstance(restored, ParsedSchema)
+    assert restored.orphan_elements == []
+    actual = Graph().parse(data=restored.model_elements[0].to_rdf(), format="turtle")
+    assert set(actual) == set(expected)
+    assert len(pickle.dumps(parsed_schema)) < len(pickle.dumps(object_type))
+
+
+@pytest.mark.unit
+def test_unsupported_format_version_raises_error() -> None:
+    """Test that data from other format versions is rejected."""
+    data = dumps([Component(["#"])])
+
+    with pytest.raises(ValueError):
+        loads(b"JSRD\x00\x00" + data[6:])
+    with pytest.raises(ValueError):
+        loads(marshal.dumps([]))
+
+
+@pytest.mark.unit
+def test_unsupported_object_raises_error() -> None:
+    """Test that objects of unknown types are not serialized."""
+    with pytest.raises(TypeError):
+        dumps([Graph()])
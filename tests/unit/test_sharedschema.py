@@ -0,0 +1,87 @@
+"""Pytests."""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import os
+import pickle
+
+import pytest
+
+from jsonschematordf.component import Component
+from jsonschematordf.schema import Schema
+from jsonschematordf.sharedschema import share_json_schema, SharedJsonSchema
+
+
+def _get_component_title(shared: SharedJsonSchema, path: str) -> str:
+    """Resolve component in worker process."""
+    component: Component = Schema(
+        "http://uri.com", shared.load()
+    ).get_components_by_path(path)[0]
+    return component.title[None]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "json_schema_string",
+    ['{"A": {"properties": {"b": {"type": "string"}}}}', "A:\n  properties: {}\n"],
+)
+def test_shares_json_and_yaml_documents(json_schema_string: str) -> None:
+    """Test that JSON and YAML documents are shared and loaded."""
+    with share_json_schema(json_schema_string) as shared:
+        root = shared.load()
+
+        assert list(root) == ["A"]
+        assert shared.load() is root
+        assert "properties" in root["A"]
+
+
+@pytest.mark.unit
+def test_yaml_documents_are_loaded_from_original_source() -> None:
+    """Test that YAML values and keys not representable in JSON are preserved."""
+    json_schema_string = "A:\n  default: 2021-01-01\n  properties:\n    1: {}\n"
+
+    with share_json_schema(json_schema_string) as shared:
+        attached = pickle.loads(pickle.dumps(shared))
+        root = attached.load()
+
+        assert root["A"]["default"] == date(2021, 1, 1)
+        assert list(root["A"]["properties"]) == [1]
+        attached.close()
+
+
+@pytest.mark.unit
+def test_pickles_by_file_path_without_ownership() -> None:
+    """Test that unpickled shared schema attaches to file without owning it."""
+    shared = share_json_schema('{"A": {}}')
+
+    attached = pickle.loads(pickle.dumps(shared))
+    assert attached.file_path == shared.file_path
+    assert list(attached.load()) == ["A"]
+
+    attached.close()
+    assert os.path.exists(shared.file_path)
+
+    shared.close()
+    assert not os.path.exists(shared.file_path)
+
+
+@pytest.mark.unit
+def test_non_object_document_loads_none() -> None:
+    """Test that documents without root object load as None."""
+    with share_json_schema("") as shared:
+        assert shared.load() is None
+
+
+@pytest.mark.unit
+def test_workers_navigate_shared_schema() -> None:
+    """Test that worker processes resolve components from the shared schema."""
+    json_schema_string = '{"defs": {"A": {"type": "object"}, "B": {"type": "string"}}}'
+
+    with share_json_schema(json_schema_string) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            titles = list(
+                executor.map(
+                    _get_component_title, [shared, shared], ["#/defs/A", "#/defs/B"]
+                )
+            )
+
+    assert titles == ["A", "B"]
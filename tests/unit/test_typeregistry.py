@@ -0,0 +1,61 @@
+"""Pytests."""
+import pytest
+
+from jsonschematordf.typeregistry import TypeRegistry
+from jsonschematordf.types.constants import TYPE_DEFINITION_REFERENCE
+
+
+@pytest.mark.unit
+def test_formats_resolve_to_reference_of_their_type() -> None:
+    """Test that registered formats resolve to the reference of their type."""
+    registry = TypeRegistry()
+
+    assert registry.get_type_definition_reference("string") == (
+        TYPE_DEFINITION_REFERENCE["string"]
+    )
+    assert registry.get_type_definition_reference(None, "int64") == (
+        TYPE_DEFINITION_REFERENCE["integer"]
+    )
+    assert registry.get_type_definition_reference(None, "date-time") == (
+        TYPE_DEFINITION_REFERENCE["string"]
+    )
+    assert registry.get_type_definition_reference("string", "int64") == (
+        TYPE_DEFINITION_REFERENCE["string"]
+    )
+
+
+@pytest.mark.unit
+def test_unknown_types_and_formats_are_not_primitive() -> None:
+    """Test that unknown, missing and unhashable types are not primitive."""
+    registry = TypeRegistry()
+
+    assert not registry.is_primitive("object")
+    assert not registry.is_primitive("null", "uuid")
+    assert not registry.is_primitive(None, "unknown")
+    assert not registry.is_primitive(None)
+    assert not registry.is_primitive(["string", "null"])
+
+
+@pytest.mark.unit
+def test_registers_types_and_formats() -> None:
+    """Test that registered types and formats extend the registry."""
+    registry = TypeRegistry({}, {})
+    registry.register_type("string", "http://uri.com/string")
+    registry.register_format("uuid", "string")
+
+    assert registry.get_type_definition_reference(None, "uuid") == (
+        "http://uri.com/string"
+    )
+
+    registry.register_type("string", "http://uri.com/text")
+
+    assert registry.get_type_definition_reference(None, "uuid") == (
+        "http://uri.com/text"
+    )
+
+
+@pytest.mark.unit
+def test_format_of_unknown_type_raises_error() -> None:
+    """Test that formats of unregistered types are rejected."""
+    with pytest.raises(ValueError):
+        TypeRegistry({}, {}).register_format("uuid", "string")
@@ -1,7 +1,10 @@
 """pytests."""
-from datacatalogtordf import URI
+import warnings
+
+from datacatalogtordf import InvalidURIError, URI
 from modelldcatnotordf.modelldcatno import ObjectType
 import pytest
+from pytest_mock import MockerFixture
 from rdflib.graph import Graph
 
 from jsonschematordf.types.enums import (
@@ -10,8 +13,19 @@ from jsonschematordf.types.enums import (
 )
 from jsonschematordf.utils import (
     add_elements_to_graph,
+    create_uri,
     determine_reference_type,
+    escape_json_pointer_token,
+    find_references,
+    graph_to_ntriples,
+    join_uri,
     nested_get,
+    read_ntriples,
+    split_json_pointer,
+    split_reference,
+    to_json_pointer,
+    unescape_json_pointer_token,
+    validate_uri,
 )
 from tests.testutils import assert_isomorphic
 
@@ -68,6 +82,48 @@ def test_invalid_uri_should_return_none() -> None:
     determine_reference_type(reference)
 
 
+@pytest.mark.unit
+def test_validate_uri_caches_results() -> None:
+    """Validated strings should be cached, whether they are valid or not."""
+    validate_uri.cache_clear()
+
+    uri = validate_uri("http://uri.com#test")
+    assert isinstance(uri, URI)
+    assert validate_uri("http://uri.com#test") is uri
+    assert validate_uri("http://uri<.com") is None
+    assert validate_uri("http://uri<.com") is None
+    assert validate_uri.cache_info().hits == 2
+
+
+@pytest.mark.unit
+def test_create_uri_reuses_uris() -> None:
+    """Existing URIs should be reused, and invalid strings should raise exception."""
+    uri = URI("http://uri.com")
+    assert create_uri(uri) is uri
+    assert create_uri("http://uri.com") == uri
+    with pytest.raises(InvalidURIError):
+        create_uri("http://uri<.com")
+
+
+@pytest.mark.unit
+def test_join_uri_validates_suffix() -> None:
+    """Joined URI should be a URI, or None if the suffix is not valid."""
+    uri = join_uri(URI("http://uri.com"), "/Person#address")
+    assert isinstance(uri, URI)
+    assert uri == "http://uri.com/Person#address"
+    assert join_uri(URI("http://uri.com"), "/#Person name") is None
+
+
+@pytest.mark.unit
+def test_join_uri_does_not_cache_joined_uri() -> None:
+    """Joined URI should be validated without filling the URI validation cache."""
+    validate_uri.cache_clear()
+    uri = join_uri(URI("http://uri.com"), "/#Person")
+    assert isinstance(uri, URI)
+    assert uri == "http://uri.com/#Person"
+    assert validate_uri.cache_info().currsize == 0
+
+
 @pytest.mark.unit
 def test_add_elements_to_graph() -> None:
     """Test that elements are added to graph."""
@@ -82,3 +138,130 @@ def test_add_elements_to_graph() -> None:
     actual = add_elements_to_graph(Graph(), [element_1, element_2, element_3])
 
     assert_isomorphic(expected, actual)
+
+
+@pytest.mark.unit
+def test_add_elements_to_graph_adds_repeated_elements_once(
+    mocker: MockerFixture,
+) -> None:
+    """Test that elements occurring more than once are converted to triples once."""
+    element = ObjectType("http://uri1.com")
+    to_rdf = mocker.spy(element, "to_rdf")
+
+    actual = add_elements_to_graph(Graph(), [element, element, element])
+
+    assert to_rdf.call_count == 1
+    assert_isomorphic(
+        Graph().parse(data=element.to_rdf(format="turtle"), format="turtle"), actual
+    )
+
+
+@pytest.mark.unit
+def test_add_elements_to_graph_merges_elements_with_same_identifier() -> None:
+    """Test that the triples of distinct elements with the same identifier are kept."""
+    element_1 = ObjectType("http://uri1.com")
+    element_1.title = {"nb": "Tittel"}
+    element_2 = ObjectType("http://uri1.com")
+    element_2.description = {"nb": "Beskrivelse"}
+
+    expected = Graph()
+    expected.parse(data=element_1.to_rdf(format="turtle"), format="turtle")
+    expected.parse(data=element_2.to_rdf(format="turtle"), format="turtle")
+
+    actual = add_elements_to_graph(Graph(), [element_1, element_2])
+
+    assert_isomorphic(expected, actual)
+
+
+@pytest.mark.unit
+def test_add_elements_to_graph_binds_prefixes() -> None:
+    """Test that the prefixes of the modelldcatno vocabularies are bound."""
+    actual = add_elements_to_graph(Graph(), [ObjectType("http://uri1.com")])
+
+    assert b"modelldcatno:ObjectType" in actual.serialize(format="turtle")
+
+
+@pytest.mark.unit
+def test_add_elements_to_graph_adds_every_element_without_identifier() -> None:
+    """Test that elements without identifier are added once per object."""
+    actual = add_elements_to_graph(Graph(), [ObjectType(), ObjectType()])
+
+    assert len(set(actual.subjects())) == 2
+
+
+@pytest.mark.unit
+def test_graph_to_ntriples() -> None:
+    """Test that graph is converted to set of N-Triples statements."""
+    element = ObjectType("http://uri1.com")
+    graph = Graph().parse(data=element.to_rdf(format="turtle"), format="turtle")
+
+    expected = {
+        "<http://uri1.com> "
+        "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+        "<https://data.norge.no/vocabulary/modelldcatno#ObjectType> ."
+    }
+
+    assert graph_to_ntriples(graph) == expected
+
+
+@pytest.mark.unit
+def test_graph_to_ntriples_does_not_warn() -> None:
+    """Test that graph is converted without serializer warnings."""
+    graph = Graph().parse(
+        data=ObjectType("http://uri1.com").to_rdf(format="turtle"), format="turtle"
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        graph_to_ntriples(graph)
+
+
+@pytest.mark.unit
+def test_read_ntriples_skips_blanks_and_comments() -> None:
+    """Test that blank lines and comments are skipped and statements stripped."""
+    lines = ["# comment\n", "\n", "  <http://a> <http://b> <http://c> .  \n"]
+
+    assert list(read_ntriples(lines)) == ["<http://a> <http://b> <http://c> ."]
+
+
+@pytest.mark.unit
+def test_json_pointer_token_escaping() -> None:
+    """Test that '~' and '/' are escaped and unescaped according to RFC 6901."""
+    assert escape_json_pointer_token("a/b~c") == "a~1b~0c"
+    assert unescape_json_pointer_token("a~1b~0c") == "a/b~c"
+    assert unescape_json_pointer_token("~01") == "~1"
+
+
+@pytest.mark.unit
+def test_to_json_pointer() -> None:
+    """Test that JSON Pointer is created from path list."""
+    assert to_json_pointer(["a/b", "0"]) == "/a~1b/0"
+    assert to_json_pointer([]) == ""
+
+
+@pytest.mark.unit
+def test_split_reference() -> None:
+    """Test that percent-encoded and escaped references are split into tokens."""
+    assert split_reference("#/a~1b/c%20d/e~0f") == ["#", "a/b", "c d", "e~f"]
+
+
+@pytest.mark.unit
+def test_split_json_pointer() -> None:
+    """Test that JSON Pointer is split into unescaped tokens."""
+    assert split_json_pointer("/components/schemas") == ["components", "schemas"]
+    assert split_json_pointer("/$defs/a~1b") == ["$defs", "a/b"]
+    assert split_json_pointer("") == []
+
+
+@pytest.mark.unit
+def test_find_references() -> None:
+    """Test that references in nested objects and arrays are found."""
+    node = {
+        "$ref": "#/a",
+        "properties": {"b": {"$ref": "#/b"}},
+        "oneOf": [{"$ref": "#/c"}, {"type": "string"}],
+        "enum": ["$ref"],
+    }
+
+    assert sorted(find_references(node)) == ["#/a", "#/b", "#/c"]
+    assert list(find_references(None)) == []